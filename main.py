@@ -16,16 +16,20 @@ from core import app
 from config import game_config
 from hardware import cubes_to_game
 from core.dictionary import Dictionary
+from core.lexicon_registry import LexiconRegistry
 from utils.pygameasync import events
 import pygamegameasync
 from core import tiles
 from utils import hub75
+from game_logging import trace
+from game_logging.event_metrics import EventMetrics
 from game_logging.game_loggers import OutputLogger, GameLogger, PublishLogger
 
 MQTT_SERVER = game_config.MQTT_SERVER
 GAME_ON_MQTT_SERVER = game_config.GAME_ON_MQTT_SERVER
 GAME_ON_MQTT_PORT = game_config.GAME_ON_MQTT_PORT
 my_open = open
+PUBLISH_DRAIN_TIMEOUT_S = 5
 
 logger = logging.getLogger(__name__)
 
@@ -69,20 +73,25 @@ async def publish_tasks_in_queue(publish_client: aiomqtt.Client, queue: asyncio.
     while True:
         try:
             timestamp = None
+            topic = message = None
             topic, message, retain, timestamp = await queue.get()
-
-            # Publish retained messages if they changed.
-            if not retain or last_messages.get(topic, "INIT") != message:
-                await publish_client.publish(topic, message, retain=retain)
-                last_messages[topic] = message
-                logger.info(f"publishing: {topic}, {message}")
-                publish_logger.log_mqtt_publish(topic, message, retain, timestamp)
+            try:
+                # Publish retained messages if they changed.
+                if not retain or last_messages.get(topic, "INIT") != message:
+                    await publish_client.publish(topic, message, retain=retain)
+                    last_messages[topic] = message
+                    logger.info(f"publishing: {topic}, {message}")
+                    publish_logger.log_mqtt_publish(topic, message, retain, timestamp)
+            finally:
+                queue.task_done()
         except asyncio.CancelledError:
             # Handle graceful shutdown            
             break
         except aiomqtt.exceptions.MqttCodeError as e:
             print(f"publish_tasks_in_queue failed {e}")
             # Don't exit on MqttCodeError, as it might be a transient issue
+            if topic is not None:
+                cubes_to_game.publish_failed(topic, message)
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -90,7 +99,7 @@ async def publish_tasks_in_queue(publish_client: aiomqtt.Client, queue: asyncio.
             sys.exit(1)
 
 
-async def main(args: argparse.Namespace, dictionary: Dictionary, block_words: pygamegameasync.BlockWordsPygame, keyboard_player_number: int, seed: int, game_logger: GameLogger) -> int:
+async def main(args: argparse.Namespace, dictionary: Dictionary, lexicons: LexiconRegistry, block_words: pygamegameasync.BlockWordsPygame, keyboard_player_number: int, seed: int, game_logger: GameLogger) -> int:
     # Set up loggers
     publish_logger = PublishLogger("output/output.publish.jsonl")
     output_logger = OutputLogger("output/output.jsonl")
@@ -113,7 +122,7 @@ async def main(args: argparse.Namespace, dictionary: Dictionary, block_words: py
             async with aiomqtt.Client(MQTT_SERVER) as publish_client:
                 publish_queue: asyncio.Queue = asyncio.Queue()
                 hardware = CubesHardwareInterface()
-                the_app = app.App(publish_queue, dictionary, hardware)
+                the_app = app.App(publish_queue, dictionary, hardware, lexicons=lexicons)
                 
                 await cubes_to_game.init(subscribe_client)
                 # Clear any retained letters and borders from a previous run
@@ -134,9 +143,13 @@ async def main(args: argparse.Namespace, dictionary: Dictionary, block_words: py
 
                 exit_code = await block_words.main(the_app, subscribe_client, args.start, keyboard_player_number, publish_queue, game_logger, output_logger)
                 print(f"exit code was {exit_code}")
-                # Wait for the publish queue to be empty before shutting down
-                while not publish_queue.empty():
-                    await asyncio.sleep(0.1)
+                # Wait for the publish queue to be drained before shutting down, unless the publisher has died
+                if not publish_task.done():
+                    try:
+                        await asyncio.wait_for(publish_queue.join(), PUBLISH_DRAIN_TIMEOUT_S)
+                    except asyncio.TimeoutError:
+                        logger.warning(f"Publish queue not drained after {PUBLISH_DRAIN_TIMEOUT_S}s, "
+                                       f"{publish_queue.qsize()} messages dropped")
                 
                 publish_queue.shutdown()
                 publish_task.cancel()
@@ -192,7 +205,23 @@ if __name__ == "__main__":
                        help="Time to linger at each column before moving on, in milliseconds (default: 0)")
     parser.add_argument("--letter-drop-time-ms", type=int, default=150000,
                        help="Time in milliseconds for letter to fall full screen height (default: 150000)")
+    parser.add_argument("--lexicon", default=game_config.DEFAULT_LEXICON, choices=list(game_config.LEXICONS),
+                       help=f"Lexicon to play with until a game/start picks another (default: {game_config.DEFAULT_LEXICON})")
+    parser.add_argument("--trace", default="",
+                       help=f"Comma-separated trace categories to log ({', '.join(trace.CATEGORIES)} or all)")
+    parser.add_argument("--neighbor-settle-ms", type=int, default=game_config.NEIGHBOR_SETTLE_MS,
+                       help="Hold changed cube neighbor reports this long before using them, to ignore contact bounce "
+                            f"(default: {game_config.NEIGHBOR_SETTLE_MS})")
+    parser.add_argument("--event-metrics", type=str, default=None,
+                       help="Time event queue latency and handlers, appending the histograms to this JSONL file on exit")
     args = parser.parse_args()
+    try:
+        trace.enable(args.trace.split(","))
+    except ValueError as e:
+        parser.error(str(e))
+    if args.event_metrics:
+        events.metrics = EventMetrics()
+    cubes_to_game.set_neighbor_settle_ms(args.neighbor_settle_ms)
     
     seed = 1
     if args.replay:
@@ -232,8 +261,10 @@ if __name__ == "__main__":
     except pygame.error as e:
         print(f"Audio initialization failed (running without audio): {e}")
     hub75.init(args.display)
-    dictionary = Dictionary(game_config.MIN_LETTERS, game_config.MAX_LETTERS, open=my_open)
-    dictionary.read(game_config.DICTIONARY_PATH, game_config.BINGOS_PATH)
+    lexicons = LexiconRegistry(default_id=args.lexicon, open=my_open)
+    # Load the default lexicon first so its racks follow the seed, then the rest for later games
+    dictionary = lexicons.get()
+    lexicons.load()
     pygame.init()
     block_words = pygamegameasync.BlockWordsPygame(
         replay_file=args.replay or "",
@@ -252,7 +283,7 @@ if __name__ == "__main__":
     
     game_logger = GameLogger(None if args.replay else "output/game_replay.jsonl")
     try:
-        exit_code = asyncio.run(main(args, dictionary, block_words, args.keyboard_player_number-1, seed, game_logger))
+        exit_code = asyncio.run(main(args, dictionary, lexicons, block_words, args.keyboard_player_number-1, seed, game_logger))
         print("asyncio main done")
         sys.exit(exit_code)
     except Exception as e:
@@ -264,3 +295,5 @@ if __name__ == "__main__":
         sys.exit(1)
     finally:
         game_logger.stop_logging()
+        if events.metrics is not None:
+            events.metrics.dump(args.event_metrics)
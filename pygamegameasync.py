@@ -259,11 +259,14 @@ class BlockWordsPygame:
             for control_event in control_events:
                 await self.mqtt_coordinator.handle_message(control_event['topic'], control_event['payload'], now_ms)
 
+        # Apply neighbor reports that have held steady through the settle window
+        await cubes_to_game.apply_settled_neighbor_reports(publish_queue, now_ms, self.game.sound_manager)
+
         # Check if ABC start sequence should be activated
         await cubes_to_game.activate_abc_start_if_ready(publish_queue, now_ms)
 
-        # Check if any ABC countdown has completed
-        countdown_incidents = await cubes_to_game.check_countdown_completion(publish_queue, now_ms, self.game.sound_manager)
+        # Run the ABC countdown stages that are due and collect the incidents from any that ran
+        countdown_incidents = await cubes_to_game.advance_countdown(now_ms)
 
         screen.fill((0, 0, 0))
 
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Measure the CPU used by the background tasks while nothing is happening.
+
+Runs the event worker and the fake/replay MQTT readers with no events for a
+few seconds, once as the old 100 ms polling loops and once with the current
+classes, and prints the process CPU time of each.
+
+Usage:
+    python3 scripts/bench_idle_cpu.py [SECONDS] [COPIES]
+"""
+import asyncio
+import os
+import sys
+import time
+
+# Add src to python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.append(src_dir)
+
+from testing.fake_mqtt_client import FakeMqttClient
+from testing.mock_mqtt_client import MockMqttClient
+from utils.pygameasync import EventEngine
+
+
+async def polled_worker(queue):
+    """EventEngine._worker before: wake every 100 ms to re-check `running`."""
+    while True:
+        try:
+            await asyncio.wait_for(queue.get(), timeout=0.1)
+        except asyncio.TimeoutError:
+            continue
+
+
+async def polled_reader(ready):
+    """MockMqttClient/FakeMqttClient.__anext__ before: sleep 100 ms and look again."""
+    while not ready:
+        await asyncio.sleep(0.1)
+
+
+async def polled_tasks():
+    return [asyncio.create_task(polled_worker(asyncio.Queue())),
+            asyncio.create_task(polled_reader([])),
+            asyncio.create_task(polled_reader([]))]
+
+
+async def current_tasks():
+    engine = EventEngine()
+    await engine.start()
+    return [engine._worker_task,
+            asyncio.create_task(FakeMqttClient().__anext__()),
+            asyncio.create_task(MockMqttClient([]).__anext__())]
+
+
+async def idle_cpu_s(make_tasks, seconds, copies):
+    tasks = []
+    for _ in range(copies):
+        tasks += await make_tasks()
+    start = time.process_time()
+    await asyncio.sleep(seconds)
+    used = time.process_time() - start
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return used
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    copies = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    for label, make_tasks in (("polling", polled_tasks), ("wakeups", current_tasks)):
+        used = asyncio.run(idle_cpu_s(make_tasks, seconds, copies))
+        print(f"{label:8s}: {used * 1000:8.2f} ms CPU over {seconds:g} s idle "
+              f"({used / seconds * 100:.3f}% of a core, {copies} cop{'y' if copies == 1 else 'ies'})")
+
+
+if __name__ == "__main__":
+    main()
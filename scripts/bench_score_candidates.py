@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Benchmark AnagramHelper.score_candidates against per-candidate counting.
+
+Usage:
+    python3 scripts/bench_score_candidates.py [N_RACKS]
+"""
+import sys
+import os
+import random
+import string
+import time
+
+# Add src to python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.append(src_dir)
+
+# Change CWD to project root so that relative paths in config work
+os.chdir(project_root)
+
+from core.anagram_helper import AnagramHelper
+from config import game_config
+
+def per_candidate_scores(helper, rack):
+    """The original path: one count_anagrams() call per letter."""
+    return [helper.count_anagrams(rack + char) for char in string.ascii_uppercase]
+
+def time_racks(label, score, racks):
+    start = time.perf_counter()
+    results = [score(rack) for rack in racks]
+    elapsed = time.perf_counter() - start
+    print(f"{label:>14}: {elapsed * 1000 / len(racks):7.3f} ms/rack ({elapsed:.2f}s total)")
+    return elapsed, results
+
+def main():
+    n_racks = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    helper = AnagramHelper.get_instance()
+
+    random.seed(1)
+    with open(game_config.BINGOS_PATH, 'r') as f:
+        bingos = [line.strip().upper() for line in f if line.strip()]
+    racks = [random.choice(bingos) for _ in range(n_racks)]
+    print(f"Scoring next-letter candidates for {n_racks} racks")
+
+    baseline, expected = time_racks("per-candidate", lambda r: per_candidate_scores(helper, r), racks)
+    elapsed, actual = time_racks("score_candidates", lambda r: [s for _, s in sorted(helper.score_candidates(r))], racks)
+    # The fallback score_candidates uses when NumPy is not installed
+    lattice_elapsed, lattice = time_racks("subset lattice", helper._score_candidates_lattice, racks)
+
+    if actual != expected or lattice != expected:
+        print("MISMATCH between score_candidates and per-candidate counting")
+        sys.exit(1)
+    print(f"Results identical, speedup {baseline / elapsed:.1f}x (no-NumPy lattice fallback {baseline / lattice_elapsed:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""Compile word lists into memory-mapped lexicon files (sowpods.txt -> sowpods.lex).
+
+The game rebuilds stale lexicons on its own at startup; run this once after
+updating a word list to keep that cost off the Pi's first boot.
+"""
+import sys
+import os
+
+# Add src to python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.append(src_dir)
+
+# Change CWD to project root so that relative paths in config work
+os.chdir(project_root)
+
+from core import lexicon
+from config import game_config
+
+def main():
+    sources = sys.argv[1:] or [game_config.DICTIONARY_PATH]
+    for source in sources:
+        lexicon_path = lexicon.lexicon_path_for(source)
+        lexicon.build(source, lexicon_path)
+        print(f"{source} -> {lexicon_path} ({len(lexicon.Lexicon(lexicon_path))} words)")
+
+if __name__ == "__main__":
+    main()
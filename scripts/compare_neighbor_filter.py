@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Check that the cube/right filter leaves the words formed in a replay unchanged.
+
+Feeds the neighbor reports from a game replay log (output/game_replay.jsonl)
+into two sets of CubeSetManagers: one gets every report, the other only what
+NeighborFilter lets through. It then compares the words each cube set
+showed. With a settle window, words the unfiltered cubes showed for less
+than the window are expected to disappear. Every other word must match.
+
+REPLAY_FILE may be --swap instead, to run SWAP_REPORTS: a link first
+rejected as a loop, then repeated once it no longer closes one.
+
+Usage:
+    python3 scripts/compare_neighbor_filter.py REPLAY_FILE [SETTLE_MS]
+    python3 scripts/compare_neighbor_filter.py --swap [SETTLE_MS]
+"""
+import json
+import os
+import sys
+
+# Add src to python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.append(src_dir)
+
+from config import game_config
+from core import tiles
+from hardware.cubes_to_game.cube_set_manager import CubeSetManager
+from hardware.cubes_to_game.neighbor_filter import NeighborFilter
+
+ALL_CUBES = [str(i) for i in range(1, 7)] + [str(i) for i in range(11, 17)]
+
+
+def make_managers():
+    managers = []
+    for cube_set_id in range(game_config.MAX_PLAYERS):
+        manager = CubeSetManager(cube_set_id)
+        manager.cube_list = ALL_CUBES[cube_set_id * tiles.MAX_LETTERS:(cube_set_id + 1) * tiles.MAX_LETTERS]
+        manager._initialize_arrays()
+        managers.append(manager)
+    return managers
+
+
+def read_reports(path):
+    """(now_ms, [(sender, neighbor), ...]) per logged frame, frames without reports included."""
+    with open(path) as f:
+        for line in f:
+            entry = json.loads(line)
+            if "timestamp_ms" not in entry:
+                continue  # seed and delay_ms header lines
+            reports = [(event["topic"].removeprefix("cube/right/"), event.get("payload") or "")
+                       for event in entry.get("events", {}).get("mqtt", [])
+                       if event.get("topic", "").startswith("cube/right/")]
+            yield entry["timestamp_ms"], reports
+
+
+# Cube 2 reports cube 1 while 1 still links to 2, then again after 1 has moved away
+SWAP_REPORTS = [(0, [("1", "2")]), (100, [("2", "")]), (200, [("2", "1")]), (300, [("1", "")]),
+                (400, [("2", "1")]), (500, [("2", "1")])]
+
+
+class Recorder:
+    """The words each cube set showed at the end of each frame, as (words, from_ms) whenever they changed."""
+
+    def __init__(self):
+        self.managers = make_managers()
+        self.cube_set = {cube: manager for manager in self.managers for cube in manager.cube_list}
+        self.history = [[([], 0)] for _ in self.managers]
+
+    def apply(self, sender, neighbor):
+        """Process the report; False if the cube set rejected the link, as coordination tells the filter."""
+        manager = self.cube_set.get(sender)
+        if manager is not None:
+            manager.process_neighbor_cube(sender, neighbor)
+            if neighbor in manager.cube_list and manager.cube_chain.get(sender) != neighbor:
+                return False
+        return True
+
+    def end_frame(self, now_ms):
+        for manager, history in zip(self.managers, self.history):
+            words = manager.words()
+            if history[-1][0] != words:
+                history.append((words, now_ms))
+
+
+def lasting(history, end_ms, settle_ms):
+    """The starting words, then those in history that stayed at least settle_ms, with repeats merged."""
+    kept = [history[0][0]]
+    for index, (words, from_ms) in enumerate(history[1:], 1):
+        until_ms = history[index + 1][1] if index + 1 < len(history) else end_ms
+        if until_ms - from_ms >= settle_ms and kept[-1] != words:
+            kept.append(words)
+    return kept
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(2)
+    settle_ms = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    raw, filtered = Recorder(), Recorder()
+    neighbor_filter = NeighborFilter(settle_ms)
+
+    def apply_filtered(sender, neighbor):
+        if not filtered.apply(sender, neighbor):
+            neighbor_filter.reject(sender)
+
+    reports = 0
+    now_ms = 0
+    frames = SWAP_REPORTS if sys.argv[1] == "--swap" else read_reports(sys.argv[1])
+    for now_ms, frame_reports in frames:
+        for sender, neighbor in frame_reports:
+            reports += 1
+            raw.apply(sender, neighbor)
+            if neighbor_filter.offer(sender, neighbor, now_ms):
+                apply_filtered(sender, neighbor)
+        # Same order as run_single_frame: the frame's messages, then whatever has settled
+        for sender, neighbor in neighbor_filter.take_settled(now_ms):
+            apply_filtered(sender, neighbor)
+        raw.end_frame(now_ms)
+        filtered.end_frame(now_ms)
+    end_ms = now_ms + settle_ms
+    for sender, neighbor in neighbor_filter.take_settled(end_ms):
+        apply_filtered(sender, neighbor)
+    filtered.end_frame(end_ms)
+
+    print(f"{reports} cube/right reports, suppressed: {dict(neighbor_filter.suppressed)}")
+    same = True
+    for cube_set_id in range(len(raw.managers)):
+        expected = lasting(raw.history[cube_set_id], end_ms, settle_ms)
+        actual = lasting(filtered.history[cube_set_id], end_ms, 0)
+        status = "same" if expected == actual else "DIFFERENT"
+        same = same and expected == actual
+        print(f"cube set {cube_set_id}: {len(expected)} word states unfiltered, {len(actual)} filtered: {status}")
+        if expected != actual:
+            print(f"  unfiltered: {expected}\n  filtered:   {actual}")
+    sys.exit(0 if same else 1)
+
+
+if __name__ == "__main__":
+    main()
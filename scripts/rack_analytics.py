@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Offline rack analytics for word lists and bingos.
+
+Scoring is spread over a process pool (see core.rack_analytics).
+
+Usage:
+    python3 scripts/rack_analytics.py bingos [--workers N]
+        Anagram count for every bingo -> assets/data/bingo_stats.csv
+    python3 scripts/rack_analytics.py filter [--min-anagrams 50]
+        Rewrite bingos.txt with the bingos that have enough anagrams
+    python3 scripts/rack_analytics.py best-letter RACK [N]
+        Top N replacement letters for a rack
+    python3 scripts/rack_analytics.py table [WORD_LIST ...] [--workers N]
+        Next-letter table for each word list (sowpods.txt -> sowpods.next)
+
+Every command takes --dictionary to score against another word list.
+"""
+import argparse
+import csv
+import os
+import string
+import sys
+import time
+
+# Add src to python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.append(src_dir)
+
+# Change CWD to project root so that relative paths in config work
+os.chdir(project_root)
+
+from core import next_letter_table
+from core import rack_analytics
+from config import game_config
+
+
+def read_words(path: str) -> list[str]:
+    with open(path) as f:
+        return [line.strip().upper() for line in f if line.strip()]
+
+
+def bingos(args: argparse.Namespace) -> None:
+    words = read_words(args.bingos)
+    start = time.perf_counter()
+    with open(args.output, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Word', 'AnagramCount'])
+        writer.writerows(rack_analytics.count_anagrams(words, args.dictionary, args.workers))
+    print(f"{len(words)} bingos -> {args.output} ({time.perf_counter() - start:.1f}s)")
+
+
+def filter_bingos(args: argparse.Namespace) -> None:
+    with open(args.stats, newline='') as f:
+        words = sorted(row['Word'] for row in csv.DictReader(f)
+                       if int(row['AnagramCount']) >= args.min_anagrams)
+    with open(args.bingos, 'w') as f:
+        f.writelines(word + '\n' for word in words)
+    print(f"{len(words)} bingos with >= {args.min_anagrams} anagrams -> {args.bingos}")
+
+
+def best_letter(args: argparse.Namespace) -> None:
+    if not args.rack.isalpha():
+        sys.exit(f"Rack must be letters only: {args.rack}")
+    (_, scores), = rack_analytics.replacement_scores([args.rack], args.dictionary, workers=1)
+    ranked = sorted(zip(string.ascii_uppercase, scores), key=lambda kv: (-kv[1], kv[0]))
+    print(f"Top {args.n} replacement letters for rack '{args.rack.upper()}':")
+    for letter, score in ranked[:args.n]:
+        print(f"  {letter}: {score:.1f} expected words")
+
+
+def table(args: argparse.Namespace) -> None:
+    for source in args.word_lists or [args.dictionary]:
+        table_path = next_letter_table.table_path_for(source)
+        start = time.perf_counter()
+        next_letter_table.build(source, table_path, game_config.MAX_LETTERS, args.workers)
+        size_mb = os.path.getsize(table_path) / (1024 * 1024)
+        print(f"{source} -> {table_path} "
+              f"({next_letter_table.rack_count(game_config.MAX_LETTERS)} racks, "
+              f"{size_mb:.1f} MB, {time.perf_counter() - start:.0f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--dictionary', default=game_config.DICTIONARY_PATH,
+                        help="word list to score against")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('bingos', help="anagram count for every bingo")
+    p.add_argument('--bingos', default=game_config.BINGOS_PATH)
+    p.add_argument('--output', default=game_config.BINGO_STATS_PATH)
+    p.set_defaults(func=bingos)
+
+    p = commands.add_parser('filter', help="keep the bingos with enough anagrams")
+    p.add_argument('--stats', default=game_config.BINGO_STATS_PATH)
+    p.add_argument('--bingos', default=game_config.BINGOS_PATH)
+    p.add_argument('--min-anagrams', type=int, default=50)
+    p.set_defaults(func=filter_bingos)
+
+    p = commands.add_parser('best-letter', help="rank replacement letters for a rack")
+    p.add_argument('rack')
+    p.add_argument('n', nargs='?', type=int, default=5)
+    p.set_defaults(func=best_letter)
+
+    p = commands.add_parser('table', help="build next-letter tables")
+    p.add_argument('word_lists', nargs='*', metavar='WORD_LIST')
+    p.set_defaults(func=table)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
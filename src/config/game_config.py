@@ -51,6 +51,7 @@ FREE_SCORE = 0
 
 # Timing settings
 ABC_COUNTDOWN_DELAY_MS = 1000  # Delay for ABC countdown sequence (ms)
+NEIGHBOR_SETTLE_MS = 0  # Hold changed cube/right reports this long to ride out contact bounce (0 = apply at once)
 UPDATE_TILES_REBROADCAST_S = 8  # How often to rebroadcast tile updates (seconds)
 DESCENT_DURATION_S = 10  # Default duration for descent speed calculation (seconds)
 LETTER_SWEEP_SPEED_MS = 1000  # Time between letter column movements (ms) - lower is faster
@@ -94,6 +95,24 @@ GAME_ON_MQTT_PORT = int(os.environ.get("GAME_ON_MQTT_PORT", "1883"))
 DATA_DIR = "assets/data"
 DICTIONARY_PATH = os.path.join(DATA_DIR, "sowpods.txt")
 BINGOS_PATH = os.path.join(DATA_DIR, "bingos.txt")
+BINGO_STATS_PATH = os.path.join(DATA_DIR, "bingo_stats.csv")  # Written by scripts/rack_analytics.py bingos
+
+# Lexicons a game can pick via GameParams.lexicon, all loaded at startup.
+# Each needs a word list and bingos drawn from it; bingo stats are optional.
+# To add one (e.g. a kids' list), give it an id here and run
+# `scripts/rack_analytics.py --dictionary WORDS table` for its next-letter table.
+LEXICONS = {
+    "sowpods": {
+        "words": DICTIONARY_PATH,
+        "bingos": BINGOS_PATH,
+        "bingo_stats": BINGO_STATS_PATH,
+    },
+}
+DEFAULT_LEXICON = "sowpods"
+
+# Bingos are split into this many difficulty buckets by anagram count;
+# game_on level N draws its starting rack from bucket N (the last bucket past that)
+BINGO_DIFFICULTY_BUCKETS = 5
 
 # Shield Animation Physics
 # Shields accelerate upward using exponential growth:
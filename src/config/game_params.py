@@ -21,6 +21,7 @@ class GameParams:
     next_column_ms: Optional[int] = None  # Time to move between columns (ms), None for level 1 practice mode
     letter_linger_ms: int = 0  # Time to linger at each column before moving (ms)
     letter_drop_time_ms: int = 150000  # Time for letter to fall full screen height (ms)
+    lexicon: Optional[str] = None  # Id from game_config.LEXICONS, None for the default
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional['GameParams']:
@@ -50,7 +51,8 @@ class GameParams:
             level=data.get('level', 1),
             next_column_ms=data.get('next_column_ms'),
             letter_linger_ms=data.get('letter_linger_ms', 0),
-            letter_drop_time_ms=data.get('letter_drop_time_ms', 150000)
+            letter_drop_time_ms=data.get('letter_drop_time_ms', 150000),
+            lexicon=data.get('lexicon')
         )
 
     @classmethod
@@ -73,11 +75,12 @@ class GameParams:
             level=args.level,
             next_column_ms=getattr(args, 'next_column_ms', None),
             letter_linger_ms=getattr(args, 'letter_linger_ms', 0),
-            letter_drop_time_ms=getattr(args, 'letter_drop_time_ms', 150000)
+            letter_drop_time_ms=getattr(args, 'letter_drop_time_ms', 150000),
+            lexicon=getattr(args, 'lexicon', None)
         )
 
     def __str__(self) -> str:
         """Return string representation for logging."""
         return (f"GameParams(mode={self.descent_mode}, duration={self.descent_duration_s}, "
                 f"one_round={self.one_round}, min_win={self.min_win_score}, "
-                f"stars={self.stars}, level={self.level})")
+                f"stars={self.stars}, level={self.level}, lexicon={self.lexicon})")
@@ -0,0 +1,91 @@
+"""NumPy-vectorized next-letter scoring for AnagramHelper.
+
+AnagramHelper.score_candidates used to call count_anagrams() once per letter
+A-Z, walking every combination of a 7-letter rack in Python. This engine scores
+all 26 candidate racks in one pass:
+
+- Each candidate rack (base + letter) is a sorted row of letter indices, so the
+  26 racks form a (26 x n) integer matrix.
+- Every subset of n positions with MIN..MAX_WORD_LENGTH members is a row of a
+  (subsets x n) weight matrix. Because rack rows are sorted, the packed
+  signature of a subset is a plain weighted sum, and one matrix product yields
+  the signatures of every subset of every candidate rack.
+- Signatures are deduplicated per rack (repeated letters produce repeats) and
+  looked up in the sorted signature table with searchsorted.
+
+The results are identical to the per-candidate count_anagrams() path.
+"""
+
+import string
+from itertools import combinations
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; AnagramHelper falls back to count_anagrams()
+    np = None
+
+from core.lexicon import LETTER_BITS, MIN_WORD_LENGTH, MAX_WORD_LENGTH, SignatureCounts
+
+_CANDIDATES = [ord(c) - 64 for c in string.ascii_uppercase]
+
+
+def available() -> bool:
+    """True if NumPy is installed and the batched engine can be used."""
+    return np is not None
+
+
+class BatchCandidateScorer:
+    """Scores all 26 next-letter candidates for a rack in one vectorized pass."""
+
+    def __init__(self, freq_map: "SignatureCounts") -> None:
+        # Wraps the mmapped tables in place; signatures fit in 30 bits, so lookups are done as uint32
+        self._signatures = np.frombuffer(freq_map.signatures, dtype=np.uint32)
+        self._counts = np.frombuffer(freq_map.counts, dtype=np.uint16)
+        self._weights_by_length: dict[int, np.ndarray] = {}
+
+    def _subset_weights(self, n: int) -> np.ndarray:
+        """(subsets x n) matrix; row @ sorted letter indices = packed signature."""
+        weights = self._weights_by_length.get(n)
+        if weights is None:
+            rows = []
+            for size in range(MIN_WORD_LENGTH, min(n, MAX_WORD_LENGTH) + 1):
+                for combo in combinations(range(n), size):
+                    row = [0] * n
+                    for rank, position in enumerate(combo):
+                        row[position] = 1 << (LETTER_BITS * (MAX_WORD_LENGTH - 1 - rank))
+                    rows.append(row)
+            weights = np.array(rows, dtype=np.int64).reshape(len(rows), n)
+            self._weights_by_length[n] = weights
+        return weights
+
+    def score(self, base_letters: str) -> list[int]:
+        """Anagram counts for base_letters + each of A-Z, in alphabetical order."""
+        base = [ord(c) - 64 for c in base_letters.upper() if 'A' <= c <= 'Z']
+        return self.score_racks(np.array([base], dtype=np.int64).reshape(1, len(base)))[0].tolist()
+
+    def score_racks(self, bases: "np.ndarray") -> "np.ndarray":
+        """Score many racks at once.
+
+        Args:
+            bases: (racks x k) matrix of letter indices (A=1 .. Z=26)
+
+        Returns:
+            (racks x 26) matrix of anagram counts for each rack + each of A-Z
+        """
+        n_racks, k = bases.shape
+        weights = self._subset_weights(k + 1)
+        if len(weights) == 0 or len(self._signatures) == 0:
+            return np.zeros((n_racks, len(_CANDIDATES)), dtype=np.int64)
+
+        candidates = np.tile(np.array(_CANDIDATES, dtype=np.int64), n_racks).reshape(-1, 1)
+        racks = np.sort(np.concatenate([np.repeat(bases, len(_CANDIDATES), axis=0), candidates], axis=1), axis=1)
+        signatures = np.sort(racks @ weights.T, axis=1)
+
+        # Only count the first occurrence of each signature within a rack
+        first = np.ones(signatures.shape, dtype=bool)
+        first[:, 1:] = signatures[:, 1:] != signatures[:, :-1]
+
+        signatures = signatures.astype(np.uint32)
+        idx = np.minimum(np.searchsorted(self._signatures, signatures), len(self._signatures) - 1)
+        found = (self._signatures[idx] == signatures) & first
+        return np.where(found, self._counts[idx], 0).astype(np.int64).sum(axis=1).reshape(n_racks, len(_CANDIDATES))
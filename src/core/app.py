@@ -1,20 +1,26 @@
 import asyncio
 from collections import Counter
+from contextlib import asynccontextmanager
+import contextvars
 from datetime import datetime
 from functools import wraps
 import logging
-from typing import Any, Callable, Coroutine, Optional
+from typing import Any, AsyncIterator, Callable, Coroutine, Optional
 
 from game.time_provider import TimeProvider, SystemTimeProvider
 from hardware.interface import HardwareInterface
 from config import game_config
 from core.dictionary import Dictionary
+from core.lexicon_registry import LexiconRegistry
 from utils.pygameasync import events
 import pygame
 from core import tiles
+from core.frame_batch import FrameBatch
 from core.scorecard import ScoreCard
+from game_logging import trace
 from game_logging.game_loggers import OutputLogger
 from events.game_events import (
+    EventType,
     GameStartPlayerEvent,
     GameStageGuessEvent,
     GameOldGuessEvent,
@@ -25,16 +31,22 @@ from events.game_events import (
     InputAddGuessEvent,
     InputUpdatePreviousGuessesEvent,
     InputRemainingPreviousGuessesEvent,
+    InputPreviousGuessesDeltaEvent,
 )
 from core.player_mapping import calculate_player_mapping
 
 logger = logging.getLogger("app:"+__name__)
 
+# The batch open in the current task: (app, task, batch), see App.batch
+_open_batch: contextvars.ContextVar[Optional[tuple["App", asyncio.Task, FrameBatch]]] = \
+    contextvars.ContextVar("open_batch", default=None)
+
 from core.rack_manager import RackManager
 from core.tile_generator import TileGenerator
 
 class App:
-    def __init__(self, publish_queue: asyncio.Queue, dictionary: Dictionary, hardware_interface: HardwareInterface, time_provider: Optional[TimeProvider] = None) -> None:
+    def __init__(self, publish_queue: asyncio.Queue, dictionary: Dictionary, hardware_interface: HardwareInterface, time_provider: Optional[TimeProvider] = None,
+                 lexicons: Optional[LexiconRegistry] = None) -> None:
         def make_guess_tiles_callback(the_app: App) -> Callable[[list[str], bool, int],  Coroutine[Any, Any, None]]:
             async def guess_tiles_callback(guess: list[str], move_tiles: bool, player: int, now_ms: int) -> None:
                 await the_app.guess_tiles(guess, move_tiles, player, now_ms)
@@ -53,13 +65,14 @@ class App:
             return remove_highlight_callback
 
         self._dictionary = dictionary
+        self._lexicons = lexicons
         self._publish_queue = publish_queue
         self.hardware = hardware_interface
         self._time = time_provider or SystemTimeProvider()
         self._last_guess: list[str] = []
         
-        tile_generator = TileGenerator()
-        self.rack_manager = RackManager(dictionary, tile_generator)
+        self._tile_generator = TileGenerator()
+        self.rack_manager = RackManager(dictionary, self._tile_generator)
         
         self._score_card = ScoreCard(self.rack_manager.get_rack(0), self._dictionary)
         self._player_count = 1
@@ -72,6 +85,63 @@ class App:
         self.hardware.set_remove_highlight_callback(make_remove_highlight_callback(self))
         self.hardware.set_start_game_callback(make_start_game_callback(self))
         self._running = False
+        # Guess-list event name -> sender, for the updates a batch holds back
+        self._guess_list_senders = {
+            EventType.INPUT_UPDATE_PREVIOUS_GUESSES.value: self._send_previous_guesses,
+            EventType.INPUT_REMAINING_PREVIOUS_GUESSES.value: self._send_remaining_previous_guesses,
+            EventType.INPUT_PREVIOUS_GUESSES_DELTA.value: self._send_previous_guesses_delta,
+        }
+
+    @property
+    def _batch(self) -> Optional[FrameBatch]:
+        """The batch the current task has open on this App.
+
+        Other coroutines that run while it is open (event handlers, timers, and
+        tasks that copied the context) don't see it and send their updates directly.
+        """
+        open_batch = _open_batch.get()
+        if open_batch is None:
+            return None
+        app, task, batch = open_batch
+        if app is not self or task is not asyncio.current_task():
+            return None
+        return batch
+
+    @property
+    def _hardware_queue(self) -> Any:
+        """Where hardware updates go: the publish queue, or the open batch's buffer."""
+        return self._batch.publish_buffer if self._batch else self._publish_queue
+
+    @asynccontextmanager
+    async def batch(self, now_ms: int) -> AsyncIterator[None]:
+        """Collect the hardware updates and rack events made inside, and send them once at the end.
+
+        Only the last message per retained cube topic and one rack refresh per
+        player are sent; a letter landing on the last guess re-checks it once,
+        at the end, instead of once per call. A batch opened inside another
+        joins the outer one. The batch belongs to the task that opened it.
+        """
+        if self._batch:
+            yield
+            return
+        batch = FrameBatch(now_ms)
+        token = _open_batch.set((self, asyncio.current_task(), batch))
+        try:
+            yield
+            if batch.reguess_ms is not None and self._last_guess:
+                for player in range(self._player_count):
+                    await self.guess_tiles(self._last_guess, False, player, batch.reguess_ms)
+        finally:
+            _open_batch.reset(token)
+            for message in batch.publish_buffer.messages():
+                await self._publish_queue.put(message)
+            # Full lists before the delta, which then only carries what they didn't
+            for event_name, send in self._guess_list_senders.items():
+                if event_name in batch.guess_lists:
+                    send()
+            events.coalesced.update(batch.coalesced)
+            for event in batch.rack_events():
+                events.trigger(event)
 
     @property
     def player_count(self) -> int:
@@ -157,16 +227,35 @@ class App:
         """
         return self._player_to_cube_set.copy()
 
-    def _initialize_racks_for_fair_play(self) -> None:
+    def set_lexicon(self, lexicon_id: Optional[str]) -> None:
+        """Use a configured lexicon for the next game; None means the default one.
+
+        Unknown ids fall back to the default with a warning. Without a lexicon
+        registry the dictionary passed to __init__ is always used.
+        """
+        if self._lexicons is None:
+            if lexicon_id is not None:
+                logger.warning(f"No lexicons configured, ignoring lexicon {lexicon_id!r}")
+            return
+        if lexicon_id is not None and lexicon_id not in self._lexicons.ids():
+            logger.warning(f"Unknown lexicon {lexicon_id!r}, using the default")
+            lexicon_id = None
+        lexicon_id = lexicon_id or self._lexicons.default_id
+        self._dictionary = self._lexicons.get(lexicon_id)
+        self.rack_manager.set_dictionary(self._dictionary)
+        self._tile_generator.set_word_list(self._lexicons.word_list(lexicon_id))
+
+    def _initialize_racks_for_fair_play(self, level: Optional[int] = None) -> None:
         """Initialize racks using the RackManager."""
-        self.rack_manager.initialize_racks_for_fair_play()
+        self.rack_manager.initialize_racks_for_fair_play(level)
 
-    async def start(self, now_ms: int) -> None:
+    async def start(self, now_ms: int, level: Optional[int] = None) -> None:
+        """Start a game. A level picks the starting rack's difficulty (see Dictionary.get_rack)."""
         print(">>>>>>>> app.STARTING")
         self._running = True
         # Set game running state for cube border logic
         self.hardware.set_game_running(True)
-        self._initialize_racks_for_fair_play()
+        self._initialize_racks_for_fair_play(level)
 
         self._update_next_tile(self.rack_manager.get_rack(0).next_letter())
         self._score_card = ScoreCard(self.rack_manager.get_rack(0), self._dictionary)
@@ -180,30 +269,31 @@ class App:
                 self.hardware.remove_player_from_abc_tracking(player)
         
         # Clear ABC cubes for any remaining players (non-participants)
-        await self.hardware.clear_remaining_abc_cubes(self._publish_queue, now_ms)
-
-        await self.load_rack(now_ms)
-        for player in range(game_config.MAX_PLAYERS):
-            self._update_rack_display(0, 0, player, None)
-        self._update_previous_guesses()
-        self._update_remaining_previous_guesses()
-        for player in range(self._player_count):
-            cube_set_id = self._player_to_cube_set[player]
-            await self.hardware.guess_last_tiles(self._publish_queue, cube_set_id, player, now_ms)
+        await self.hardware.clear_remaining_abc_cubes(self._hardware_queue, now_ms)
+
+        async with self.batch(now_ms):
+            await self.load_rack(now_ms)
+            for player in range(game_config.MAX_PLAYERS):
+                self._update_rack_display(0, 0, player, None)
+            self._update_previous_guesses()
+            self._update_remaining_previous_guesses()
+            for player in range(self._player_count):
+                cube_set_id = self._player_to_cube_set[player]
+                await self.hardware.guess_last_tiles(self._hardware_queue, cube_set_id, player, now_ms)
         print(">>>>>>>> app.STARTED")
 
     async def stop(self, now_ms: int, min_win_score: int) -> None:
         # Clear hardware cubes - we do this directly without clearing our logical RackManager,
         # so that post-game UI effects (like melting) can still access the final game state.
-        await self.hardware.clear_all_letters(self._publish_queue, now_ms)
+        await self.hardware.clear_all_letters(self._hardware_queue, now_ms)
 
         self._running = False
         # Set game ended state
         self.hardware.set_game_end_time(now_ms, min_win_score)
         # Unlock all letters when game ends
-        await self.hardware.unlock_all_letters(self._publish_queue, now_ms)
+        await self.hardware.unlock_all_letters(self._hardware_queue, now_ms)
         # Ensure all borders are cleared on every cube at game end
-        await self.hardware.clear_all_borders(self._publish_queue, now_ms)
+        await self.hardware.clear_all_borders(self._hardware_queue, now_ms)
         # Clear player started state so borders won't be re-applied after game over
         self.hardware.reset_player_started_state()
         # Note: ABC sequence will be activated automatically
@@ -213,7 +303,7 @@ class App:
         for player in range(game_config.MAX_PLAYERS):
             if self.hardware.has_player_started_game(player):
                 cube_set_id = self._player_to_cube_set[player]
-                await self.hardware.load_rack(self._publish_queue, self.rack_manager.get_rack(player).get_tiles(), cube_set_id, player, now_ms)
+                await self.hardware.load_rack(self._hardware_queue, self.rack_manager.get_rack(player).get_tiles(), cube_set_id, player, now_ms)
             else:
                 logging.info(f"LOAD RACK: Skipping player {player} - game not started")
 
@@ -240,26 +330,29 @@ class App:
     async def accept_new_letter(self, next_letter: str, position: int, now_ms: int) -> None:
         # 1. Determine parameters for the manager
         hit_rack_idx, position_offset = self._map_position_to_rack(position)
+        replaced_letter = self.rack_manager.get_rack(hit_rack_idx).get_tiles()[position + position_offset].letter
         
         # 2. Delegate to RackManager
         changed_tile = self.rack_manager.accept_new_letter(
             next_letter, position, hit_rack_idx, position_offset
         )
 
-        self._score_card.update_previous_guesses()
+        self._score_card.replace_letter(replaced_letter, next_letter)
         for player in range(self._player_count):
             cube_set_id = self._player_to_cube_set[player]
-            await self.hardware.accept_new_letter(self._publish_queue, next_letter,
+            await self.hardware.accept_new_letter(self._hardware_queue, next_letter,
                                                   changed_tile.id, cube_set_id, now_ms)
 
-        self._update_previous_guesses()
-        self._update_remaining_previous_guesses()
+        self._update_previous_guesses_delta()
         for player in range(self._player_count):
-            events.trigger(RackUpdateLetterEvent(changed_tile, player, now_ms))
+            self._trigger_rack_event(RackUpdateLetterEvent(changed_tile, player, now_ms))
         
         self._update_next_tile(self.rack_manager.get_rack(0).next_letter())
         
         if changed_tile.id in self._last_guess:
+            if self._batch:
+                self._batch.reguess_ms = now_ms
+                return
             for player in range(self._player_count):
                 await self.guess_tiles(self._last_guess, False, player, now_ms)
 
@@ -271,40 +364,44 @@ class App:
         lock_changed = False
         for player in range(self._player_count):
             cube_set_id = self._player_to_cube_set[player]
-            lock_changed |= await self.hardware.letter_lock(self._publish_queue, cube_set_id,
+            lock_changed |= await self.hardware.letter_lock(self._hardware_queue, cube_set_id,
                                             locked_tile_id if locked else None, now_ms)
         return lock_changed
 
+    def get_solutions(self) -> set[str]:
+        """Every word that can be made from the current shared letters."""
+        self._score_card.solutions.sync(self._dictionary, self.rack_manager.get_rack(0).letters())
+        return self._score_card.solutions.words()
+
+    def get_words_remaining(self) -> list[str]:
+        """Solutions that haven't been played yet this game."""
+        return self._score_card.words_remaining()
+
     def add_guess(self, guess: str, player: int) -> None:
         self._score_card.add_guess(guess, player)
-        events.trigger(InputAddGuessEvent(self._score_card.get_previous_guesses(), guess, player, self._time.get_ticks()))
+        events.trigger(InputAddGuessEvent(self._score_card.publish_previous_guesses(), guess, player, self._time.get_ticks()))
 
     async def remove_highlight(self, word_tile_ids: list[str], player: int) -> None:
         """Remove highlight when cube chain is physically disconnected."""
-        logger.info(f"remove_highlight: word_tile_ids {word_tile_ids}")
+        if trace.GUESS.enabled:
+            trace.GUESS.emit("remove_highlight", player=player, tile_ids=word_tile_ids)
         self._update_rack_display(0, 0, player, word_tile_ids)
         self._last_guess = []
 
     async def guess_tiles(self, word_tile_ids: list[str], move_tiles: bool, player: int, now_ms: int) -> None:
-        logger.info(f"guess_tiles: word_tile_ids {word_tile_ids}")
-
         # Empty guess - ignore
         if not word_tile_ids:
             return
 
         self._last_guess = word_tile_ids
+        if self._batch:
+            # This guess already sees any letter that landed earlier in the batch
+            self._batch.reguess_ms = None
 
         rack = self.rack_manager.get_rack(player)
         guess = rack.ids_to_letters(word_tile_ids)
         guess_tiles = rack.ids_to_tiles(word_tile_ids)
 
-        print(f"[DEBUG] guess_tiles called:")
-        print(f"[DEBUG]   word_tile_ids: {word_tile_ids}")
-        print(f"[DEBUG]   player: {player}")
-        print(f"[DEBUG]   rack letters: {rack.letters}")
-        print(f"[DEBUG]   constructed guess: '{guess}'")
-        print(f"[DEBUG]   guess_tiles: {guess_tiles}")
-
         tiles_dirty = False
         good_guess_highlight = 0
         if move_tiles:
@@ -321,18 +418,14 @@ class App:
             tiles_dirty = True
 
         cube_set_id = self._player_to_cube_set[player]
-        print(f"[DEBUG] Checking word validation:")
-        print(f"[DEBUG]   is_old_guess('{guess}'): {self._score_card.is_old_guess(guess)}")
-        print(f"[DEBUG]   is_good_guess('{guess}'): {self._score_card.is_good_guess(guess)}")
-
         if self._score_card.is_old_guess(guess):
-            print(f"[DEBUG]   Triggering OLD_GUESS event for '{guess}'")
+            judged = "old"
             events.trigger(GameOldGuessEvent(guess, player, self._time.get_ticks()))
-            await self.hardware.old_guess(self._publish_queue, word_tile_ids, cube_set_id, player)
+            await self.hardware.old_guess(self._hardware_queue, word_tile_ids, cube_set_id, player)
             tiles_dirty = True
         elif self._score_card.is_good_guess(guess):
-            print(f"[DEBUG]   Triggering STAGE_GUESS event for '{guess}'")
-            await self.hardware.good_guess(self._publish_queue, word_tile_ids, cube_set_id, player, now_ms)
+            judged = "good"
+            await self.hardware.good_guess(self._hardware_queue, word_tile_ids, cube_set_id, player, now_ms)
             self._score_card.add_staged_guess(guess)
             score = self._score_card.calculate_score(guess)
             events.trigger(GameStageGuessEvent(score, guess, player, now_ms))
@@ -340,9 +433,13 @@ class App:
             good_guess_highlight = len(guess_tiles)
             tiles_dirty = True
         else:
-            print(f"[DEBUG]   Triggering BAD_GUESS event for '{guess}' (not in dictionary)")
+            judged = "bad"
             events.trigger(GameBadGuessEvent(player))
-            await self.hardware.bad_guess(self._publish_queue, word_tile_ids, cube_set_id, player)
+            await self.hardware.bad_guess(self._hardware_queue, word_tile_ids, cube_set_id, player)
+
+        if trace.GUESS.enabled:
+            trace.GUESS.emit("guess_tiles", player=player, tile_ids=word_tile_ids, guess=guess,
+                             rack=rack.letters(), move_tiles=move_tiles, judged=judged)
 
         # Always update rack display to refresh tile positions from physical cube arrangement
         # For bad guesses, pass highlight_length=0 to avoid creating a highlight
@@ -354,23 +451,53 @@ class App:
 
     async def guess_word_keyboard(self, guess: str, player: int, now_ms: int) -> None:
         cube_set_id = self._player_to_cube_set[player]
-        await self.hardware.guess_tiles(self._publish_queue,
+        await self.hardware.guess_tiles(self._hardware_queue,
             [self.rack_manager.get_rack(player).letters_to_ids(guess)], cube_set_id, player, now_ms)
 
     def _update_next_tile(self, next_tile: str) -> None:
         events.trigger(GameNextTileEvent(next_tile, self._time.get_ticks()))
 
     def _update_previous_guesses(self) -> None:
-        events.trigger(InputUpdatePreviousGuessesEvent(
-            self._score_card.get_previous_guesses(), self._time.get_ticks()))
+        if self._batch:
+            self._batch.request_guess_list(EventType.INPUT_UPDATE_PREVIOUS_GUESSES.value)
+        else:
+            self._send_previous_guesses()
 
     def _update_remaining_previous_guesses(self) -> None:
+        if self._batch:
+            self._batch.request_guess_list(EventType.INPUT_REMAINING_PREVIOUS_GUESSES.value)
+        else:
+            self._send_remaining_previous_guesses()
+
+    def _update_previous_guesses_delta(self) -> None:
+        if self._batch:
+            self._batch.request_guess_list(EventType.INPUT_PREVIOUS_GUESSES_DELTA.value)
+        else:
+            self._send_previous_guesses_delta()
+
+    def _send_previous_guesses(self) -> None:
+        events.trigger(InputUpdatePreviousGuessesEvent(
+            self._score_card.publish_previous_guesses(), self._time.get_ticks()))
+
+    def _send_remaining_previous_guesses(self) -> None:
         events.trigger(InputRemainingPreviousGuessesEvent(
-            self._score_card.get_remaining_previous_guesses(),
+            self._score_card.publish_remaining_previous_guesses(),
             self._time.get_ticks()))
 
+    def _send_previous_guesses_delta(self) -> None:
+        added, removed, remaining_added, remaining_removed = self._score_card.take_previous_guesses_delta()
+        if added or removed or remaining_added or remaining_removed:
+            events.trigger(InputPreviousGuessesDeltaEvent(
+                added, removed, remaining_added, remaining_removed, self._time.get_ticks()))
+
+    def _trigger_rack_event(self, event: RackUpdateRackEvent | RackUpdateLetterEvent) -> None:
+        if self._batch:
+            self._batch.add_rack_event(event)
+        else:
+            events.trigger(event)
+
     def _update_rack_display(self, highlight_length: int, guess_length: int, player: int, guessed_tile_ids: list[str] | None):
-        events.trigger(RackUpdateRackEvent(
+        self._trigger_rack_event(RackUpdateRackEvent(
                        self.rack_manager.get_rack(player).get_tiles(),
                        highlight_length,
                        guess_length,
@@ -0,0 +1,286 @@
+"""Minimized word graph (DAWG) behind Dictionary.
+
+A DAWG is a trie whose identical subtrees are merged, so common prefixes and
+common suffixes are each stored once. Besides membership tests it answers
+prefix queries and enumerates every word a rack of letters can form by walking
+the graph while spending letters from the rack; branches the rack can't pay
+for are never visited.
+
+STORAGE:
+Nodes and edges live in flat arrays rather than per-node Python objects:
+    node_edges[i]       index of node i's first edge
+    node_edge_count[i]  number of edges out of node i (<= 26)
+    node_final[i]       1 if the path to node i spells a word
+    edge_letter[e]      edge label (ord of an uppercase letter)
+    edge_target[e]      node the edge leads to
+A node's edges are contiguous and sorted by letter, so words come out in
+alphabetical order. The arrays may also be read-only views over a compiled
+lexicon (see core.lexicon); they are copied on the first add().
+
+Construction uses the incremental algorithm for sorted input (Daciuk et al.),
+which yields the minimal graph directly. add() inserts by copying the nodes
+along the new word's path, so shared subtrees are never modified; the graph
+stays correct but may no longer be minimal.
+"""
+
+from array import array
+from typing import Iterable, Iterator, Sequence
+
+
+class _BuildNode:
+    __slots__ = ("edges", "final", "index")
+
+    def __init__(self) -> None:
+        self.edges: dict[str, "_BuildNode"] = {}
+        self.final = False
+        self.index = -1
+
+
+class Dawg:
+    """Array-backed directed acyclic word graph over uppercase words."""
+
+    def __init__(self) -> None:
+        self._set_arrays(array("I"), bytearray(), bytearray(), bytearray(), array("I"), 0, 0)
+        self._root = self._append_node(False, [])
+
+    @classmethod
+    def from_arrays(cls, node_edges: Sequence[int], node_edge_count: Sequence[int],
+                    node_final: Sequence[int], edge_letter: Sequence[int],
+                    edge_target: Sequence[int], root: int, count: int) -> "Dawg":
+        """Wrap existing arrays (e.g. memoryviews over an mmapped lexicon).
+
+        Only the small edge_letter array is copied, into bytes, for its fast find().
+        """
+        dawg = cls.__new__(cls)
+        dawg._set_arrays(node_edges, node_edge_count, node_final, bytes(edge_letter),
+                         edge_target, root, count)
+        return dawg
+
+    def _set_arrays(self, node_edges: Sequence[int], node_edge_count: Sequence[int],
+                    node_final: Sequence[int], edge_letter: Sequence[int],
+                    edge_target: Sequence[int], root: int, count: int) -> None:
+        self._node_edges = node_edges
+        self._node_edge_count = node_edge_count
+        self._node_final = node_final
+        self._edge_letter = edge_letter
+        self._edge_target = edge_target
+        self._root = root
+        self._count = count
+
+    def arrays(self) -> tuple[Sequence[int], Sequence[int], Sequence[int], Sequence[int], Sequence[int]]:
+        """(node_edges, node_edge_count, node_final, edge_letter, edge_target) for serializing."""
+        return (self._node_edges, self._node_edge_count, self._node_final,
+                self._edge_letter, self._edge_target)
+
+    @property
+    def root(self) -> int:
+        return self._root
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "Dawg":
+        """Build a minimal graph from any iterable of words (uppercased, deduplicated)."""
+        return cls.from_sorted(sorted({word.upper() for word in words}))
+
+    @classmethod
+    def from_sorted(cls, words: Iterable[str]) -> "Dawg":
+        """Build a minimal graph from strictly increasing uppercase words."""
+        root = _BuildNode()
+        register: dict[tuple, _BuildNode] = {}
+        # (parent, letter, child) along the previous word, not yet merged into the register
+        unchecked: list[tuple[_BuildNode, str, _BuildNode]] = []
+
+        def minimize(down_to: int) -> None:
+            while len(unchecked) > down_to:
+                parent, letter, child = unchecked.pop()
+                # Children are already canonical (and hash by identity), so this describes the subtree
+                key = (child.final, tuple(child.edges.items()))
+                existing = register.get(key)
+                if existing is None:
+                    register[key] = child
+                else:
+                    parent.edges[letter] = existing
+
+        previous = ""
+        count = 0
+        for word in words:
+            if word <= previous:
+                raise ValueError(f"Words must be sorted and unique: {previous!r} then {word!r}")
+            common = 0
+            limit = min(len(word), len(previous))
+            while common < limit and word[common] == previous[common]:
+                common += 1
+            minimize(common)
+
+            node = unchecked[-1][2] if unchecked else root
+            for letter in word[common:]:
+                child = _BuildNode()
+                node.edges[letter] = child
+                unchecked.append((node, letter, child))
+                node = child
+            node.final = True
+            previous = word
+            count += 1
+        minimize(0)
+
+        dawg = cls.__new__(cls)
+        dawg._set_arrays(array("I"), bytearray(), bytearray(), bytearray(), array("I"), 0, count)
+        dawg._root = dawg._compile(root)
+        return dawg
+
+    def _compile(self, node: _BuildNode) -> int:
+        """Append a build node and everything below it (once per shared node)."""
+        if node.index < 0:
+            edges = [(letter, self._compile(child)) for letter, child in node.edges.items()]
+            node.index = self._append_node(node.final, edges)
+        return node.index
+
+    def _append_node(self, final: bool, edges: list[tuple[str, int]]) -> int:
+        index = len(self._node_final)
+        self._node_edges.append(len(self._edge_target))
+        self._node_edge_count.append(len(edges))
+        self._node_final.append(final)
+        for letter, target in sorted(edges):
+            self._edge_letter.append(ord(letter))
+            self._edge_target.append(target)
+        return index
+
+    def _edges(self, node: int) -> list[tuple[str, int]]:
+        start = self._node_edges[node]
+        end = start + self._node_edge_count[node]
+        return [(chr(letter), target)
+                for letter, target in zip(self._edge_letter[start:end], self._edge_target[start:end])]
+
+    def _child(self, node: int, letter: str) -> int:
+        """Node reached from node by letter, or -1."""
+        code = ord(letter)
+        if code > 0xFF:
+            return -1
+        start = self._node_edges[node]
+        e = self._edge_letter.find(code, start, start + self._node_edge_count[node])
+        return self._edge_target[e] if e >= 0 else -1
+
+    def _walk(self, prefix: str) -> int:
+        """Node reached by spelling prefix from the root, or -1."""
+        node_edges, node_edge_count = self._node_edges, self._node_edge_count
+        edge_letter, edge_target = self._edge_letter, self._edge_target
+        node = self._root
+        for letter in prefix:
+            code = ord(letter)
+            if code > 0xFF:
+                return -1
+            start = node_edges[node]
+            e = edge_letter.find(code, start, start + node_edge_count[node])
+            if e < 0:
+                return -1
+            node = edge_target[e]
+        return node
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        node = self._walk(word)
+        return node >= 0 and bool(self._node_final[node])
+
+    def __iter__(self) -> Iterator[str]:
+        return self.words_with_prefix("")
+
+    def has_prefix(self, prefix: str) -> bool:
+        """True if some word starts with prefix."""
+        return self._walk(prefix) >= 0
+
+    def words_with_prefix(self, prefix: str) -> Iterator[str]:
+        """All words starting with prefix, in alphabetical order."""
+        node = self._walk(prefix)
+        if node < 0:
+            return
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if self._node_final[node]:
+                yield word
+            stack.extend((child, word + letter) for letter, child in reversed(self._edges(node)))
+
+    def words_from_rack(self, letters: str) -> list[str]:
+        """All words that use each letter of the rack at most as often as it appears."""
+        return self._words_from_rack(letters, 0)
+
+    def words_from_rack_using(self, letters: str, letter: str) -> list[str]:
+        """The words_from_rack() words that use every copy of letter in the rack.
+
+        These are the words a rack gains when that letter is added to it.
+        """
+        return self._words_from_rack(letters, ord(letter))
+
+    def _words_from_rack(self, letters: str, required: int) -> list[str]:
+        """Rack enumeration; words must use up every copy of the letter coded `required`.
+
+        Code 0 never appears in a rack, so required=0 means no constraint.
+        """
+        available = [0] * 128
+        for letter in letters:
+            if letter.isascii():
+                available[ord(letter)] += 1
+        node_edges, node_edge_count, node_final = self._node_edges, self._node_edge_count, self._node_final
+        edge_letter, edge_target = self._edge_letter, self._edge_target
+        found: list[str] = []
+
+        def visit(node: int, word: str) -> None:
+            if node_final[node] and not available[required]:
+                found.append(word)
+            start = node_edges[node]
+            for e in range(start, start + node_edge_count[node]):
+                code = edge_letter[e]
+                if available[code]:
+                    available[code] -= 1
+                    visit(edge_target[e], word + chr(code))
+                    available[code] += 1
+
+        visit(self._root, "")
+        return found
+
+    def add(self, word: str) -> None:
+        """Insert one word, copying the nodes on its path instead of mutating shared ones."""
+        word = word.upper()
+        if word in self:
+            return
+        self._thaw()
+        path = [self._root]
+        for letter in word:
+            child = self._child(path[-1], letter)
+            if child < 0:
+                break
+            path.append(child)
+
+        # Fresh chain for the letters past the existing path, ending in a final node
+        below = self._append_node(True, []) if len(path) <= len(word) else -1
+        for i in range(len(word) - 1, len(path) - 1, -1):
+            below = self._append_node(False, [(word[i], below)])
+
+        # Copy the existing path bottom-up, pointing each copy at the copy below it
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            edges = dict(self._edges(node))
+            final = bool(self._node_final[node])
+            if depth == len(word):
+                final = True
+            else:
+                edges[word[depth]] = below
+            below = self._append_node(final, list(edges.items()))
+        self._root = below
+        self._count += 1
+
+    def _thaw(self) -> None:
+        """Copy read-only array views into growable arrays before the first insert."""
+        if not isinstance(self._edge_target, array):
+            self._node_edges = array("I", self._node_edges)
+            self._node_edge_count = bytearray(self._node_edge_count)
+            self._node_final = bytearray(self._node_final)
+            self._edge_letter = bytearray(self._edge_letter)
+            self._edge_target = array("I", self._edge_target)
+
+    def update(self, words: Iterable[str]) -> None:
+        for word in words:
+            self.add(word)
@@ -1,8 +1,12 @@
+import csv
 import logging
 import random
-from typing import Callable
+from typing import Callable, Iterator, Optional
 
+from config import game_config
+from core import lexicon
 from core import tiles
+from core.dawg import Dawg
 from core.tiles import Rack
 
 def _sort_word(word):
@@ -19,10 +23,7 @@ class Dictionary:
     ) -> 'Dictionary':
         """Create a dictionary from word lists without file I/O."""
         d = cls(min_letters, max_letters)
-        for word in words:
-            word_upper = word.upper()
-            if min_letters <= len(word_upper) <= max_letters:
-                d._all_words.add(word_upper)
+        d._all_words = Dawg.from_words(w for w in words if min_letters <= len(w) <= max_letters)
                 
         if bingos is None:
             d._bingos = [w for w in d._all_words if len(w) == max_letters]
@@ -33,33 +34,122 @@ class Dictionary:
     def __init__(self, min_letters: int, max_letters: int, open: Callable=open) -> None:
         self._open = open
         self._bingos: list[str] = []
-        self._all_words: set[str] = set()
+        self._all_words = Dawg()
         self._min_letters = min_letters
         self._max_letters = max_letters
-        self._random_state = random.getstate()
+        self._bingo_stats_file: Optional[str] = None
+        self._bingo_buckets: Optional[list[list[str]]] = None  # Built on first get_rack(level)
+        # A private stream, seeded from the global one so a logged seed still replays the same racks.
+        self._random = random.Random()
+        self._random.setstate(random.getstate())
         random.seed(1)
 
-    def read(self, dictionary_file: str, bingos_file: str) -> None:
+    def read(self, dictionary_file: str, bingos_file: str, bingo_stats_file: Optional[str] = None) -> None:
+        words = []
         with self._open(dictionary_file, "r") as f:
             for line in f:
                 word = line.strip().upper()
                 if len(word) < self._min_letters or len(word) > self._max_letters:
                     continue
-                self._all_words.add(word)
+                words.append(word)
+        self._all_words = Dawg.from_words(words)
 
+        self._read_bingos(bingos_file, bingo_stats_file)
+
+    def load(self, dictionary_file: str, bingos_file: str, bingo_stats_file: Optional[str] = None) -> None:
+        """Like read(), but memory-maps the word graph compiled into the lexicon.
+
+        The lexicon is (re)built first if it is missing or older than dictionary_file.
+        """
+        lex = lexicon.load(dictionary_file)
+        if self._min_letters < lex.min_len or self._max_letters > lex.max_len:
+            raise ValueError(f"Lexicon covers {lex.min_len}-{lex.max_len} letter words, "
+                             f"dictionary needs {self._min_letters}-{self._max_letters}")
+        self._all_words = lex.dawg()
+        self._read_bingos(bingos_file, bingo_stats_file)
+
+    def _read_bingos(self, bingos_file: str, bingo_stats_file: Optional[str]) -> None:
         with self._open(bingos_file, "r") as f:
             for line in f:
                 converted = line.strip().upper()
                 if converted:
                     self._bingos.append(line.strip().upper())
+        self._bingo_stats_file = bingo_stats_file
+        self._bingo_buckets = None
+
+    def get_rack(self, level: Optional[int] = None) -> Rack:
+        """A rack holding the letters of a random bingo.
 
-    def get_rack(self) -> Rack:
-        random.setstate(self._random_state)
-        bingo = random.choice(self._bingos)
-        self._random_state = random.getstate()
+        With a level, the bingo comes from that level's difficulty bucket: level 1
+        draws from the bingos with the most anagrams, and each level after that
+        from bingos with fewer, up to game_config.BINGO_DIFFICULTY_BUCKETS.
+        """
+        if level is None:
+            bingo = self._random.choice(self._bingos)
+        else:
+            buckets = self._get_bingo_buckets()
+            bingo = self._random.choice(buckets[min(max(level, 1), len(buckets)) - 1])
         # bingo = "AAAAAA"
         print(f"initial bingo: ---------- {bingo} --------")
         return Rack(_sort_word(bingo))
 
+    def _get_bingo_buckets(self) -> list[list[str]]:
+        if self._bingo_buckets is None:
+            self._bingo_buckets = self._build_bingo_buckets()
+        return self._bingo_buckets
+
+    def _build_bingo_buckets(self) -> list[list[str]]:
+        """Split the bingos into equal-sized buckets, most anagrams first.
+
+        Anagram counts come from the bingo stats file when it is present (see
+        scripts/rack_analytics.py bingos); any bingo it doesn't cover is counted here.
+        """
+        counts = self._read_bingo_stats()
+        for bingo in self._bingos:
+            if bingo not in counts:
+                counts[bingo] = len(self.words_from_rack(bingo))
+        # Ties broken alphabetically so buckets don't depend on the order of bingos.txt
+        ranked = sorted(set(self._bingos), key=lambda b: (-counts[b], b))
+        bucket_count = max(1, min(game_config.BINGO_DIFFICULTY_BUCKETS, len(ranked)))
+        buckets = [ranked[len(ranked) * i // bucket_count:len(ranked) * (i + 1) // bucket_count]
+                   for i in range(bucket_count)]
+        logging.info(f"bingo buckets: {[len(b) for b in buckets]}")
+        return buckets
+
+    def _read_bingo_stats(self) -> dict[str, int]:
+        if not self._bingo_stats_file:
+            return {}
+        counts = {}
+        try:
+            with self._open(self._bingo_stats_file, "r") as f:
+                for row in csv.DictReader(f):
+                    counts[row["Word"].upper()] = int(row["AnagramCount"])
+        except FileNotFoundError:
+            return {}
+        return counts
+
+    # A loaded lexicon may hold words outside [min_letters, max_letters], so every
+    # query filters by length.
+
     def is_word(self, word: str) -> bool:
-        return word in self._all_words
+        return self._min_letters <= len(word) <= self._max_letters and word in self._all_words
+
+    def has_prefix(self, prefix: str) -> bool:
+        """True if some word starts with prefix."""
+        return any(self.words_with_prefix(prefix))
+
+    def words_with_prefix(self, prefix: str) -> Iterator[str]:
+        """Words starting with prefix, in alphabetical order."""
+        return (w for w in self._all_words.words_with_prefix(prefix)
+                if self._min_letters <= len(w) <= self._max_letters)
+
+    def words_from_rack(self, letters: str) -> list[str]:
+        """Every word the rack's letters can form, each letter used at most as often as it appears."""
+        return [w for w in self._all_words.words_from_rack(letters)
+                if self._min_letters <= len(w) <= self._max_letters]
+
+    def words_from_rack_using(self, letters: str, letter: str) -> list[str]:
+        """The words_from_rack() words that use every copy of letter in the rack."""
+        return [w for w in self._all_words.words_from_rack_using(letters, letter)
+                if self._min_letters <= len(w) <= self._max_letters]
+
@@ -0,0 +1,91 @@
+"""Hardware updates and rack events collected over one frame (see App.batch).
+
+Within a frame the App can touch the same cube several times: a letter lands,
+the lock moves, and the guess on the cubes is re-checked, each for every
+player. Inside a batch the MQTT messages and rack events are held back and
+sent once when the batch ends, with the ones a later change overrides
+dropped.
+
+The guess lists are handled the same way. Each letter that lands can change
+them, so the App only notes which updates (full previous list, full remaining
+list, delta) the frame asked for. At the end it sends each of those once,
+built from the ScoreCard as it is then. Repeated requests are counted in
+`coalesced` by event name.
+"""
+
+from collections import Counter
+from typing import Any, Optional
+
+from events.game_events import RackUpdateLetterEvent, RackUpdateRackEvent
+
+
+class PublishBuffer:
+    """Stands in for the MQTT publish queue during a batch.
+
+    Retained messages set a cube's state (letter, border, lock), so only the
+    last one per topic is kept. Other messages (flashes) are all kept.
+    Messages go out in the order of their last write.
+    """
+
+    def __init__(self) -> None:
+        self._messages: dict[Any, tuple[str, Any, bool, int]] = {}
+        self._transient_count = 0
+
+    async def put(self, message: tuple[str, Any, bool, int]) -> None:
+        self.put_nowait(message)
+
+    def put_nowait(self, message: tuple[str, Any, bool, int]) -> None:
+        topic, _, retain, _ = message
+        if retain:
+            self._messages.pop(topic, None)
+            self._messages[topic] = message
+        else:
+            self._messages[self._transient_count] = message
+            self._transient_count += 1
+
+    def messages(self) -> list[tuple[str, Any, bool, int]]:
+        return list(self._messages.values())
+
+
+class FrameBatch:
+    def __init__(self, now_ms: int) -> None:
+        self.now_ms = now_ms
+        self.publish_buffer = PublishBuffer()
+        self.reguess_ms: Optional[int] = None  # Set when a new letter landed on the last guess
+        self._rack_events: list[RackUpdateRackEvent | RackUpdateLetterEvent] = []
+        self.guess_lists: set[str] = set()  # Guess-list event names to send at the end
+        self.coalesced: Counter[str] = Counter()
+
+    def request_guess_list(self, event_name: str) -> None:
+        """Ask for a guess-list update to be sent at the end of the batch."""
+        if event_name in self.guess_lists:
+            self.coalesced[event_name] += 1
+        else:
+            self.guess_lists.add(event_name)
+
+    def add_rack_event(self, event: RackUpdateRackEvent | RackUpdateLetterEvent) -> None:
+        self._rack_events.append(event)
+
+    def rack_events(self) -> list[RackUpdateRackEvent | RackUpdateLetterEvent]:
+        """The rack events to send, in order.
+
+        A plain rack refresh (no highlight change) is dropped when a later
+        rack update for the same player sets everything it would, and only
+        the last letter transition per player is kept.
+        """
+        later_update: set[int] = set()
+        later_letter: set[int] = set()
+        kept = []
+        for event in reversed(self._rack_events):
+            if isinstance(event, RackUpdateLetterEvent):
+                if event.player in later_letter:
+                    continue
+                later_letter.add(event.player)
+            else:
+                is_refresh = not event.highlight_length and not event.guess_length and not event.guessed_tile_ids
+                if is_refresh and event.player in later_update:
+                    continue
+                later_update.add(event.player)
+            kept.append(event)
+        kept.reverse()
+        return kept
@@ -0,0 +1,244 @@
+"""Compiled, memory-mapped lexicon shared by Dictionary and AnagramHelper.
+
+Parsing the 178k-line sowpods.txt on every boot is slow on the Pi, and both
+Dictionary and AnagramHelper used to do it separately. This module compiles the
+word list once into a compact binary file next to the source (sowpods.txt ->
+sowpods.lex) and memory-maps it at startup. The build is redone automatically
+whenever the source file is newer than the compiled file.
+
+PACKING:
+- Letters are packed 5 bits each (A=1 .. Z=26), first letter in the most
+  significant slot, left-aligned to MAX_WORD_LENGTH slots. Numeric order of
+  packed words is therefore the same as alphabetical order.
+- A signature is the packed form of a word's letters in sorted order. It is an
+  exact encoding of the word's letter-count multiset: two words share a
+  signature iff they are anagrams of each other.
+
+The file also carries the word list as a minimized word graph (core.dawg),
+so Dictionary gets prefix queries and rack enumeration without building one.
+
+FILE LAYOUT (little endian; 4-byte fields first to keep them aligned):
+    header           magic, version, min_len, max_len, n_words, n_signatures,
+                     n_nodes, n_edges, dawg_root
+    words            n_words * uint32, sorted packed words
+    signatures       n_signatures * uint32, sorted packed signatures
+    node_edges       n_nodes * uint32, first edge of each graph node
+    edge_target      n_edges * uint32
+    counts           n_signatures * uint16, number of words per signature
+    node_edge_count  n_nodes * uint8
+    node_final       n_nodes * uint8
+    edge_letter      n_edges * uint8
+"""
+
+import logging
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Iterable, Iterator, Optional
+
+from core.dawg import Dawg
+
+logger = logging.getLogger(__name__)
+
+# Word length bounds compiled into the lexicon
+MIN_WORD_LENGTH = 3
+MAX_WORD_LENGTH = 6
+
+LETTER_BITS = 5
+LEXICON_SUFFIX = ".lex"
+
+_MAGIC = b"LEXC"
+_VERSION = 2
+_HEADER = struct.Struct("<4sHBBIIIII")
+_HEADER_PREFIX = struct.Struct("<4sH")
+
+
+def pack_letters(letters: Iterable[str]) -> Optional[int]:
+    """Pack up to MAX_WORD_LENGTH uppercase letters into an int.
+
+    Returns None if any character is not A-Z or there are too many letters.
+    """
+    packed = 0
+    count = 0
+    for c in letters:
+        value = ord(c) - 64
+        if not 1 <= value <= 26 or count == MAX_WORD_LENGTH:
+            return None
+        packed = (packed << LETTER_BITS) | value
+        count += 1
+    return packed << (LETTER_BITS * (MAX_WORD_LENGTH - count))
+
+
+def pack_signature(letters: Iterable[str]) -> Optional[int]:
+    """Pack the letter multiset of `letters` (uppercase) into a signature."""
+    return pack_letters(sorted(letters))
+
+
+def lexicon_path_for(source_path: str) -> str:
+    """Path of the compiled lexicon for a word list (sowpods.txt -> sowpods.lex)."""
+    return os.path.splitext(source_path)[0] + LEXICON_SUFFIX
+
+
+def is_stale(source_path: str, lexicon_path: str) -> bool:
+    """True if the compiled lexicon is missing or older than its source."""
+    if not os.path.exists(lexicon_path):
+        return True
+    return os.path.getmtime(source_path) > os.path.getmtime(lexicon_path)
+
+
+def build(source_path: str, lexicon_path: str) -> None:
+    """Compile a plain word list into the binary lexicon format."""
+    words = set()
+    with open(source_path, "r") as f:
+        for line in f:
+            word = line.strip().upper()
+            if MIN_WORD_LENGTH <= len(word) <= MAX_WORD_LENGTH:
+                packed = pack_letters(word)
+                if packed is not None:
+                    words.add((packed, pack_signature(word), word))
+
+    signature_counts: dict[int, int] = {}
+    for _, signature, _ in words:
+        signature_counts[signature] = signature_counts.get(signature, 0) + 1
+
+    packed_words = sorted(packed for packed, _, _ in words)
+    signatures = sorted(signature_counts)
+    # Packed order is alphabetical order, so this is already sorted
+    dawg = Dawg.from_sorted(word for _, _, word in sorted(words))
+    node_edges, node_edge_count, node_final, edge_letter, edge_target = dawg.arrays()
+
+    # Write to a temp file and rename so a concurrent reader never sees a partial build
+    tmp_path = f"{lexicon_path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, MIN_WORD_LENGTH, MAX_WORD_LENGTH,
+                             len(packed_words), len(signatures),
+                             len(node_final), len(edge_target), dawg.root))
+        f.write(struct.pack(f"<{len(packed_words)}I", *packed_words))
+        f.write(struct.pack(f"<{len(signatures)}I", *signatures))
+        f.write(struct.pack(f"<{len(node_edges)}I", *node_edges))
+        f.write(struct.pack(f"<{len(edge_target)}I", *edge_target))
+        f.write(struct.pack(f"<{len(signatures)}H", *(signature_counts[s] for s in signatures)))
+        f.write(bytes(node_edge_count))
+        f.write(bytes(node_final))
+        f.write(bytes(edge_letter))
+    os.replace(tmp_path, lexicon_path)
+    logger.info(f"Built lexicon {lexicon_path}: {len(packed_words)} words, {len(signatures)} signatures")
+
+
+class SignatureCounts(Mapping):
+    """Read-only signature -> word count mapping over the mmapped signature and count tables.
+
+    Lookups go through a dict built once here: the table is small, and the
+    pure-Python scorers look up many signatures per rack. `signatures` and
+    `counts` expose the tables themselves for vectorized readers (NumPy can
+    wrap them without a copy).
+    """
+
+    def __init__(self, signatures: memoryview, counts: memoryview) -> None:
+        self.signatures = signatures
+        self.counts = counts
+        self._by_signature: dict[int, int] = dict(zip(signatures, counts))
+
+    def __getitem__(self, signature: int) -> int:
+        return self._by_signature[signature]
+
+    def get(self, signature: int, default: int = 0) -> int:
+        return self._by_signature.get(signature, default)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._by_signature)
+
+    def __len__(self) -> int:
+        return len(self._by_signature)
+
+
+class Lexicon:
+    """Read-only view of a compiled lexicon file backed by mmap."""
+
+    def __init__(self, lexicon_path: str) -> None:
+        self.path = lexicon_path
+        with open(lexicon_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version = _HEADER_PREFIX.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{lexicon_path} is not a version {_VERSION} lexicon")
+        (_, _, self.min_len, self.max_len, n_words, n_signatures,
+         n_nodes, n_edges, self._dawg_root) = _HEADER.unpack_from(self._mmap, 0)
+
+        view = memoryview(self._mmap)
+        offset = _HEADER.size
+
+        def section(length: int, item_format: str) -> memoryview:
+            nonlocal offset
+            start = offset
+            offset += length * struct.calcsize(item_format)
+            return view[start:offset].cast(item_format)
+
+        self._words = section(n_words, "I")
+        self._signatures = section(n_signatures, "I")
+        self._node_edges = section(n_nodes, "I")
+        self._edge_target = section(n_edges, "I")
+        self._counts = section(n_signatures, "H")
+        self._node_edge_count = section(n_nodes, "B")
+        self._node_final = section(n_nodes, "B")
+        self._edge_letter = section(n_edges, "B")
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def is_word(self, word: str) -> bool:
+        """O(log n) membership test against the mmapped word table."""
+        if not self.min_len <= len(word) <= self.max_len:
+            return False
+        packed = pack_letters(word)
+        if packed is None:
+            return False
+        i = bisect_left(self._words, packed)
+        return i < len(self._words) and self._words[i] == packed
+
+    def anagram_count(self, signature: int) -> int:
+        """Number of words whose letters are exactly this signature's multiset."""
+        i = bisect_left(self._signatures, signature)
+        if i < len(self._signatures) and self._signatures[i] == signature:
+            return self._counts[i]
+        return 0
+
+    def signature_counts(self) -> "SignatureCounts":
+        """All signatures with their word counts (see SignatureCounts)."""
+        return SignatureCounts(self._signatures, self._counts)
+
+    def dawg(self) -> Dawg:
+        """A new word graph over the mmapped arrays (it copies them if words are added)."""
+        return Dawg.from_arrays(self._node_edges, self._node_edge_count, self._node_final,
+                                self._edge_letter, self._edge_target, self._dawg_root, len(self._words))
+
+
+_loaded: dict[str, Lexicon] = {}
+
+
+def load(source_path: str) -> Lexicon:
+    """Return the shared Lexicon for a word list, rebuilding it if stale.
+
+    Instances are cached per path so Dictionary and AnagramHelper share one mmap.
+    """
+    lexicon_path = lexicon_path_for(source_path)
+    cached = _loaded.get(lexicon_path)
+    if cached is not None and not is_stale(source_path, lexicon_path):
+        return cached
+
+    if not os.path.exists(source_path):
+        raise FileNotFoundError(f"Dictionary not found at {source_path}")
+    if is_stale(source_path, lexicon_path):
+        build(source_path, lexicon_path)
+
+    try:
+        lexicon = Lexicon(lexicon_path)
+    except ValueError:
+        # Format changed since the file was written
+        build(source_path, lexicon_path)
+        lexicon = Lexicon(lexicon_path)
+    _loaded[lexicon_path] = lexicon
+    return lexicon
@@ -0,0 +1,59 @@
+"""Every configured lexicon, loaded once and kept resident between games.
+
+A game picks its lexicon by id (GameParams.lexicon). All the lexicons in
+game_config.LEXICONS are loaded up front: each Dictionary memory-maps its
+compiled word list, and each word list's anagram index and next-letter table
+are cached by AnagramHelper and next_letter_table, so switching lexicons
+between games is a dict lookup.
+"""
+
+import logging
+from typing import Callable, Optional
+
+from config import game_config
+from core import next_letter_table
+from core.anagram_helper import AnagramHelper
+from core.dictionary import Dictionary
+
+logger = logging.getLogger(__name__)
+
+
+class LexiconRegistry:
+    def __init__(self, lexicons: Optional[dict[str, dict[str, str]]] = None,
+                 default_id: str = game_config.DEFAULT_LEXICON, open: Callable = open) -> None:
+        self._lexicons = game_config.LEXICONS if lexicons is None else lexicons
+        if default_id not in self._lexicons:
+            raise ValueError(f"Default lexicon {default_id!r} is not configured")
+        self.default_id = default_id
+        self._open = open
+        self._dictionaries: dict[str, Dictionary] = {}
+
+    def ids(self) -> list[str]:
+        return list(self._lexicons)
+
+    def word_list(self, lexicon_id: Optional[str] = None) -> str:
+        """Path of a lexicon's word list (the default lexicon's for None)."""
+        return self._lexicons[lexicon_id or self.default_id]["words"]
+
+    def load(self) -> None:
+        """Load every lexicon now, so no game start pays for it."""
+        for lexicon_id in self._lexicons:
+            self.get(lexicon_id)
+
+    def get(self, lexicon_id: Optional[str] = None) -> Dictionary:
+        """The Dictionary for a lexicon id (the default lexicon for None).
+
+        Raises KeyError for an id that isn't configured.
+        """
+        lexicon_id = lexicon_id or self.default_id
+        dictionary = self._dictionaries.get(lexicon_id)
+        if dictionary is None:
+            config = self._lexicons[lexicon_id]
+            dictionary = Dictionary(game_config.MIN_LETTERS, game_config.MAX_LETTERS, open=self._open)
+            dictionary.load(config["words"], config["bingos"], config.get("bingo_stats"))
+            # Warm the per-word-list caches TileGenerator switches between
+            AnagramHelper.get_instance(config["words"])
+            next_letter_table.load(config["words"])
+            self._dictionaries[lexicon_id] = dictionary
+            logger.info(f"Loaded lexicon {lexicon_id} from {config['words']}")
+        return dictionary
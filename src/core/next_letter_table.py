@@ -0,0 +1,162 @@
+"""Precomputed next-letter scores for every rack, backed by mmap.
+
+TileGenerator scores all 26 candidate letters every time a tile is replaced.
+The set of possible racks is finite: a rack of k letters is a multiset over
+A-Z, so there are C(26 + k - 1, k) of them (736,281 for k = 6). This module
+computes the 26 anagram counts for every one of them offline and stores them
+in a flat array, turning next-letter scoring into a single O(1) read.
+
+INDEXING:
+- A rack's letters are sorted and mapped to indices a_0 <= a_1 <= ... (A=0).
+- Adding i to a_i gives a strictly increasing sequence b_i, i.e. a k-subset of
+  range(26 + k - 1), which is ranked with the combinatorial number system:
+  rank = sum(C(b_i, i + 1)). Ranks are dense in [0, n_racks).
+
+FILE LAYOUT (little endian), next to the word list (sowpods.txt -> sowpods.next):
+    header  magic, version, rack_size, item_size, n_racks
+    scores  n_racks * 26 * item_size, anagram counts for rack + A..Z
+
+Building the table needs NumPy and is spread over a process pool (see
+core.rack_analytics); reading it does not.
+"""
+
+import logging
+import mmap
+import os
+import string
+import struct
+from itertools import combinations_with_replacement
+from math import comb
+from typing import Optional
+
+from core import anagram_batch
+from core import lexicon
+from core import rack_analytics
+
+logger = logging.getLogger(__name__)
+
+TABLE_SUFFIX = ".next"
+
+_N_LETTERS = len(string.ascii_uppercase)
+_MAGIC = b"NXLT"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHBBI")
+_BUILD_CHUNK = 2000
+
+
+def table_path_for(source_path: str) -> str:
+    """Path of the next-letter table for a word list (sowpods.txt -> sowpods.next)."""
+    return os.path.splitext(source_path)[0] + TABLE_SUFFIX
+
+
+def rack_count(rack_size: int) -> int:
+    """Number of distinct racks (letter multisets) of rack_size letters."""
+    return comb(_N_LETTERS + rack_size - 1, rack_size)
+
+
+def _binomials(rack_size: int) -> list[list[int]]:
+    """_binomials(k)[i][b] == C(b, i + 1) for every position i of a rack."""
+    return [[comb(b, i + 1) for b in range(_N_LETTERS + rack_size)] for i in range(rack_size)]
+
+
+def _score_chunk(helper, racks):
+    return helper.score_racks(racks)
+
+
+def build(source_path: str, table_path: str, rack_size: int, workers: Optional[int] = 1) -> None:
+    """Score every rack of rack_size letters against a word list and write the table.
+
+    workers=None uses every CPU.
+    """
+    if not anagram_batch.available():
+        raise RuntimeError("Building a next-letter table requires NumPy")
+    np = anagram_batch.np
+
+    lexicon.load(source_path)  # Compile the lexicon once, before any worker maps it
+    n_racks = rack_count(rack_size)
+    racks = np.array(list(combinations_with_replacement(range(_N_LETTERS), rack_size)),
+                     dtype=np.int64).reshape(n_racks, rack_size)
+
+    offsets = np.arange(rack_size, dtype=np.int64)
+    binomials = np.array(_binomials(rack_size), dtype=np.int64)
+    ranks = binomials[offsets, racks + offsets].sum(axis=1)
+
+    scores = np.zeros((n_racks, _N_LETTERS), dtype=np.int64)
+    starts = range(0, n_racks, _BUILD_CHUNK)
+    chunks = (racks[start:start + _BUILD_CHUNK] + 1 for start in starts)
+    for start, chunk_scores in zip(starts, rack_analytics.map_batches(_score_chunk, chunks, source_path, workers)):
+        scores[ranks[start:start + _BUILD_CHUNK]] = chunk_scores
+
+    item_size = 1 if scores.max() <= 0xFF else 2
+    dtype = np.uint8 if item_size == 1 else np.dtype("<u2")
+
+    # Write to a temp file and rename so a concurrent reader never sees a partial build
+    tmp_path = f"{table_path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, rack_size, item_size, n_racks))
+        f.write(scores.astype(dtype).tobytes())
+    os.replace(tmp_path, table_path)
+    logger.info(f"Built next-letter table {table_path}: {n_racks} racks of {rack_size} letters")
+
+
+class NextLetterTable:
+    """Read-only view of a next-letter table file backed by mmap."""
+
+    def __init__(self, table_path: str) -> None:
+        self.path = table_path
+        with open(table_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.rack_size, item_size, n_racks = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{table_path} is not a version {_VERSION} next-letter table")
+        if n_racks != rack_count(self.rack_size):
+            raise ValueError(f"{table_path} is truncated or corrupt")
+
+        end = _HEADER.size + n_racks * _N_LETTERS * item_size
+        self._scores = memoryview(self._mmap)[_HEADER.size:end].cast("B" if item_size == 1 else "H")
+        self._binomials = _binomials(self.rack_size)
+
+    def scores(self, letters: str) -> Optional[list[int]]:
+        """Anagram counts for letters + each of A-Z, in alphabetical order.
+
+        Returns None if the rack is not exactly rack_size letters A-Z (e.g. it
+        contains '?'); callers then fall back to live scoring.
+        """
+        if len(letters) != self.rack_size:
+            return None
+        rank = 0
+        for i, c in enumerate(sorted(letters.upper())):
+            value = ord(c) - 65
+            if not 0 <= value < _N_LETTERS:
+                return None
+            rank += self._binomials[i][value + i]
+        start = rank * _N_LETTERS
+        return self._scores[start:start + _N_LETTERS].tolist()
+
+
+_loaded: dict[str, NextLetterTable] = {}
+
+
+def load(source_path: str) -> Optional[NextLetterTable]:
+    """Return the next-letter table for a word list, or None if it isn't usable.
+
+    Unlike lexicons, tables are never built at startup (a full build takes
+    minutes); a missing, stale or unreadable table just disables the lookup.
+    """
+    table_path = table_path_for(source_path)
+    if lexicon.is_stale(source_path, table_path):
+        if os.path.exists(table_path):
+            logger.warning(f"Ignoring next-letter table {table_path}: older than {source_path}")
+        return None
+
+    cached = _loaded.get(table_path)
+    if cached is not None:
+        return cached
+    try:
+        table = NextLetterTable(table_path)
+    except ValueError as e:
+        logger.warning(f"Ignoring next-letter table: {e}")
+        return None
+    _loaded[table_path] = table
+    return table
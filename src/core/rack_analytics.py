@@ -0,0 +1,100 @@
+"""Offline rack analytics on AnagramHelper's index, fanned out over processes.
+
+Bingo stats, replacement-letter rankings and the next-letter table all score
+many racks against one word list. Racks are cut into batches and handed to a
+process pool; every worker builds its AnagramHelper from the same compiled
+lexicon, which is memory-mapped read-only, so the index pages are shared by
+all workers instead of copied or pickled. Results come back in input order,
+batch by batch, so callers can stream them straight to a file.
+
+With workers=1 everything runs in the calling process.
+"""
+
+import logging
+import multiprocessing
+import os
+import string
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+from core.anagram_helper import AnagramHelper
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_BATCH_SIZE = 500
+
+# The worker process's helper, set by _init_worker
+_worker_helper: Optional[AnagramHelper] = None
+
+
+def _init_worker(source_path: str) -> None:
+    global _worker_helper
+    _worker_helper = AnagramHelper(source_path)
+
+
+def _run_batch(task: tuple[Callable[[AnagramHelper, Any], Any], Any]) -> Any:
+    func, batch = task
+    return func(_worker_helper, batch)
+
+
+def map_batches(func: Callable[[AnagramHelper, T], R], batches: Iterable[T],
+                source_path: str, workers: Optional[int] = None) -> Iterator[R]:
+    """Yield func(helper, batch) for each batch, in order, computed by `workers` processes.
+
+    func must be a module-level function so it can be sent to the workers.
+    workers defaults to the number of CPUs.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        helper = AnagramHelper(source_path)
+        for batch in batches:
+            yield func(helper, batch)
+        return
+
+    logger.info(f"Scoring racks against {source_path} with {workers} processes")
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(source_path,)) as pool:
+        yield from pool.imap(_run_batch, ((func, batch) for batch in batches))
+
+
+def _batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _count_batch(helper: AnagramHelper, racks: list[str]) -> list[tuple[str, int]]:
+    return [(rack, helper.count_anagrams(rack)) for rack in racks]
+
+
+def count_anagrams(racks: Iterable[str], source_path: str, workers: Optional[int] = None,
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[tuple[str, int]]:
+    """(rack, number of words its letters can form) for every rack, in order."""
+    for results in map_batches(_count_batch, _batched(racks, batch_size), source_path, workers):
+        yield from results
+
+
+def _replacement_batch(helper: AnagramHelper, racks: list[str]) -> list[tuple[str, list[float]]]:
+    results = []
+    for rack in racks:
+        # Replacing tile i with X gives (rack without tile i) + X, which score_candidates covers for all X
+        totals = [0] * len(string.ascii_uppercase)
+        for i in range(len(rack)):
+            for letter, score in helper.score_candidates(rack[:i] + rack[i + 1:]):
+                totals[ord(letter) - 65] += score
+        results.append((rack, [total / len(rack) for total in totals]))
+    return results
+
+
+def replacement_scores(racks: Iterable[str], source_path: str, workers: Optional[int] = None,
+                       batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[tuple[str, list[float]]]:
+    """For every rack, the expected word count after a random tile becomes each of A-Z.
+
+    Scores are in alphabetical order and average the word counts over every
+    position the new letter could replace.
+    """
+    racks = (rack.upper() for rack in racks)
+    for results in map_batches(_replacement_batch, _batched(racks, batch_size), source_path, workers):
+        yield from results
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 import logging
 from config import game_config
 from core import tiles
@@ -23,14 +23,18 @@ class RackManager:
             tiles.Rack('?' * game_config.MAX_LETTERS) for _ in range(game_config.MAX_PLAYERS)
         ]
 
+    def set_dictionary(self, dictionary: Dictionary) -> None:
+        """Draw future starting racks from another dictionary."""
+        self._dictionary = dictionary
+
     def get_rack(self, player_idx: int) -> tiles.Rack:
         return self._racks[player_idx]
 
-    def initialize_racks_for_fair_play(self) -> None:
+    def initialize_racks_for_fair_play(self, level: Optional[int] = None) -> None:
         """
         Initialize all racks with identical tiles for competitive fairness.
         """
-        initial_rack = self._dictionary.get_rack()
+        initial_rack = self._dictionary.get_rack(level)
         initial_tiles = initial_rack.get_tiles()
         
         initial_letters = "".join(t.letter for t in initial_tiles)
@@ -42,12 +46,25 @@ class RackManager:
             player_tiles = [tiles.Tile(t.letter, t.id) for t in initial_tiles]
             self._racks[player].set_tiles(player_tiles)
             self._racks[player].set_next_letter(next_letter)
+        self._speculate_next_letter(next_letter)
+
+    def _speculate_next_letter(self, next_letter: str) -> None:
+        """
+        Pre-score every rack the falling letter can produce, one per landing
+        position, so accept_new_letter() doesn't pay for scoring on the frame
+        the letter lands. All racks hold the same letters, so rack 0 stands in
+        for whichever rack gets hit.
+        """
+        letters = self._racks[0].letters()
+        self._tile_generator.speculate(
+            [letters[:i] + next_letter + letters[i + 1:] for i in range(len(letters))])
 
     def update_next_letter(self, current_letters: str) -> None:
         """Update the pending next letter based on current board state."""
         next_val = self._tile_generator.get_next_letter(current_letters)
         for rack in self._racks:
             rack.set_next_letter(next_val)
+        self._speculate_next_letter(next_val)
 
     def accept_new_letter(self, new_letter: str, position: int, hit_rack_idx: int, position_offset: int) -> tiles.Tile:
         """
@@ -74,5 +91,6 @@ class RackManager:
         next_letter = self._tile_generator.get_next_letter(hit_rack.letters())
         for rack in self._racks:
             rack.set_next_letter(next_letter)
+        self._speculate_next_letter(next_letter)
 
         return changed_tile
@@ -0,0 +1,68 @@
+"""Every dictionary word that can be formed from the shared letter pool.
+
+Both players share one letter pool, so one set of solutions serves the whole
+game. It is recomputed from the dictionary only when the pool (or the
+dictionary) changes wholesale; when a caught letter replaces one tile, only
+the words that involve the replaced or the new letter are touched:
+
+- Words that need more copies of the old letter than remain are dropped.
+- Words that use every copy of the new letter are the only ones the new tile
+  makes possible, so only those are enumerated and added.
+"""
+
+import logging
+from collections import Counter
+
+from typing import Optional
+
+from core.dictionary import Dictionary
+
+logger = logging.getLogger(__name__)
+
+
+class RackSolutions:
+    def __init__(self) -> None:
+        self._dictionary: Optional[Dictionary] = None
+        self._pool = ""  # Sorted letters the solutions were computed for
+        self._counts: Counter[str] = Counter()
+        self._words: set[str] = set()
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._words
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def words(self) -> set[str]:
+        return self._words
+
+    def sync(self, dictionary: Dictionary, letters: str) -> None:
+        """Make sure the solutions are for `letters`, recomputing them if the pool or dictionary differs."""
+        pool = "".join(sorted(letters))
+        if pool == self._pool and dictionary is self._dictionary:
+            return
+        self._dictionary = dictionary
+        self._pool = pool
+        self._counts = Counter(pool)
+        self._words = set(self._dictionary.words_from_rack(pool))
+        logger.debug(f"RackSolutions: {len(self._words)} words for {pool}")
+
+    def replace_letter(self, old_letter: str, new_letter: str) -> None:
+        """Update the solutions for one tile of the pool changing from old_letter to new_letter.
+
+        If old_letter isn't in the pool (nothing synced yet), this is a no-op and
+        the next sync() recomputes from scratch.
+        """
+        if old_letter == new_letter or not self._counts[old_letter]:
+            return
+        self._counts[old_letter] -= 1
+        self._counts[new_letter] += 1
+        self._pool = "".join(sorted(self._counts.elements()))
+
+        remaining = self._counts[old_letter]
+        self._words = {w for w in self._words if w.count(old_letter) <= remaining}
+        self._words.update(self._dictionary.words_from_rack_using(self._pool, new_letter))
+
+    def remaining(self, found: set[str]) -> set[str]:
+        """Solutions not in `found`."""
+        return self._words - found
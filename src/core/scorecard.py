@@ -1,9 +1,12 @@
+import bisect
+from collections import Counter
 from enum import Enum
 import logging
 
 from config import game_config
 from core import dictionary
 from core import tiles
+from core.rack_solutions import RackSolutions
 
 Play = Enum("Play", ["GOOD", "MISSING_LETTERS", "DUPE_WORD", "BAD_WORD"])
 
@@ -11,10 +14,41 @@ class ScoreCard:
     def __init__(self, player_rack:tiles.Rack, dictionary: dictionary.Dictionary) -> None:
         self.guesses: set[tuple[int, str]] = set()  # (player, word) tuples
         self.staged_words: set[str] = set()  # Words being staged before final acceptance
-        self.possible_words: set[str] = set()  # Words that can still be made with current letters
-        self.remaining_words: set[str] = set()  # Words that can't be made with current letters
+        self._possible_words: set[str] = set()  # Words that can still be made with current letters
+        self._remaining_words: set[str] = set()  # Words that can't be made with current letters
+        self._possible_sorted: list[str] = []  # The same words, kept in display order
+        self._remaining_sorted: list[str] = []
         self.player_rack = player_rack
         self.dictionary = dictionary
+        self.solutions = RackSolutions()  # Words that can be made from the shared pool, synced lazily
+        # Previous guesses are re-checked incrementally as tiles change:
+        self._guess_counts: dict[str, Counter[str]] = {}  # Guessed word -> its letter counts
+        self._guesses_by_letter: dict[str, set[str]] = {}  # Letter -> guessed words containing it
+        self._pool_counts = [0] * tiles.N_LETTERS  # Rack.letter_counts() possible_words was computed for
+        # What the guess displays were last sent, and the guesses placed since:
+        self._published_possible: set[str] = set()
+        self._published_remaining: set[str] = set()
+        self._dirty: set[str] = set()
+
+    @property
+    def possible_words(self) -> set[str]:
+        return self._possible_words
+
+    @possible_words.setter
+    def possible_words(self, words: set[str]) -> None:
+        self._dirty |= self._possible_words | words
+        self._possible_words = set(words)
+        self._possible_sorted = sorted(self._possible_words)
+
+    @property
+    def remaining_words(self) -> set[str]:
+        return self._remaining_words
+
+    @remaining_words.setter
+    def remaining_words(self, words: set[str]) -> None:
+        self._dirty |= self._remaining_words | words
+        self._remaining_words = set(words)
+        self._remaining_sorted = sorted(self._remaining_words)
 
     def calculate_score(self, word: str) -> int:
         return len(word) + (10 if len(word) == game_config.MAX_LETTERS else 0)
@@ -26,21 +60,115 @@ class ScoreCard:
         self.staged_words.add(guess)
 
     def is_good_guess(self, guess: str) -> bool:
-        return self.dictionary.is_word(guess) and guess not in self.staged_words
+        # Guesses are spelled with rack tiles, so a real word is one of the rack's solutions.
+        # sync() is a no-op unless the rack or dictionary was changed behind our back.
+        self.solutions.sync(self.dictionary, self.player_rack.letters())
+        return guess in self.solutions and guess not in self.staged_words
+
+    def replace_letter(self, old_letter: str, new_letter: str) -> None:
+        """A tile of the shared pool changed letter; update the solutions and previous guesses.
+
+        Only previous guesses containing old_letter or new_letter can change sides.
+        """
+        self.solutions.replace_letter(old_letter, new_letter)
+        if old_letter == new_letter:
+            return
+        for letter, delta in ((old_letter, -1), (new_letter, 1)):
+            if 'A' <= letter <= 'Z':
+                self._pool_counts[ord(letter) - 65] += delta
+        if tuple(self._pool_counts) != self.player_rack.letter_counts():
+            # The rack was changed some other way; start over
+            self.update_previous_guesses()
+            return
+        for word in (self._guesses_by_letter.get(old_letter, set()) |
+                     self._guesses_by_letter.get(new_letter, set())):
+            self._place_previous_guess(word)
+
+    def words_remaining(self) -> list[str]:
+        """Words that can be made from the current letters and haven't been played yet."""
+        self.solutions.sync(self.dictionary, self.player_rack.letters())
+        return sorted(self.solutions.remaining(self.staged_words))
 
     def add_guess(self, guess: str, player: int) -> None:
         logging.info(f"guessing {guess}")
         self.player_rack.guess(guess)
         self.guesses.add((player, guess))
-        self.update_previous_guesses()
+        if tuple(self._pool_counts) != self.player_rack.letter_counts():
+            self.update_previous_guesses()
+        else:
+            self._index_guess(guess)
+            self._place_previous_guess(guess)
 
     def update_previous_guesses(self) -> None:
-        self.possible_words = {word for _, word in self.guesses 
-                             if not self.player_rack.missing_letters(word)}
-        self.remaining_words = {word for _, word in self.guesses} - self.possible_words
+        """Recompute possible_words and remaining_words from scratch."""
+        self._pool_counts = list(self.player_rack.letter_counts())
+        self.possible_words = set()
+        self.remaining_words = set()
+        for _, word in self.guesses:
+            self._index_guess(word)
+            self._place_previous_guess(word)
+
+    def _index_guess(self, word: str) -> None:
+        if word in self._guess_counts:
+            return
+        self._guess_counts[word] = Counter(word)
+        for letter in self._guess_counts[word]:
+            self._guesses_by_letter.setdefault(letter, set()).add(word)
+
+    def _place_previous_guess(self, word: str) -> None:
+        """Put a guessed word in possible_words or remaining_words for the current pool."""
+        pool = self._pool_counts
+        if all('A' <= letter <= 'Z' and n <= pool[ord(letter) - 65]
+               for letter, n in self._guess_counts[word].items()):
+            self._move(word, self._remaining_words, self._remaining_sorted,
+                       self._possible_words, self._possible_sorted)
+        else:
+            self._move(word, self._possible_words, self._possible_sorted,
+                       self._remaining_words, self._remaining_sorted)
+
+    def _move(self, word: str, from_words: set[str], from_sorted: list[str],
+              to_words: set[str], to_sorted: list[str]) -> None:
+        if word in from_words:
+            from_words.remove(word)
+            del from_sorted[bisect.bisect_left(from_sorted, word)]
+        if word not in to_words:
+            to_words.add(word)
+            bisect.insort(to_sorted, word)
+            self._dirty.add(word)
 
     def get_previous_guesses(self) -> list[str]:
-        return sorted(list(self.possible_words))
+        return list(self._possible_sorted)
 
     def get_remaining_previous_guesses(self) -> list[str]:
-        return sorted(list(self.remaining_words))
+        return list(self._remaining_sorted)
+
+    def publish_previous_guesses(self) -> list[str]:
+        """get_previous_guesses(), for sending to the display in full."""
+        self._published_possible = set(self._possible_words)
+        return self.get_previous_guesses()
+
+    def publish_remaining_previous_guesses(self) -> list[str]:
+        """get_remaining_previous_guesses(), for sending to the display in full."""
+        self._published_remaining = set(self._remaining_words)
+        return self.get_remaining_previous_guesses()
+
+    def take_previous_guesses_delta(self) -> tuple[list[str], list[str], list[str], list[str]]:
+        """What changed in both guess lists since they were last published.
+
+        Returns sorted (added, removed, remaining_added, remaining_removed); a
+        word moving between the lists shows up as removed from one and added
+        to the other. Only the guesses placed since the last call are checked.
+        """
+        added, removed, remaining_added, remaining_removed = [], [], [], []
+        for word in sorted(self._dirty):
+            for current, published, word_added, word_removed in (
+                    (self._possible_words, self._published_possible, added, removed),
+                    (self._remaining_words, self._published_remaining, remaining_added, remaining_removed)):
+                if word in current and word not in published:
+                    published.add(word)
+                    word_added.append(word)
+                elif word not in current and word in published:
+                    published.remove(word)
+                    word_removed.append(word)
+        self._dirty.clear()
+        return added, removed, remaining_added, remaining_removed
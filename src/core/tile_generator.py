@@ -1,26 +1,57 @@
 import random
 import logging
+import string
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+from core import next_letter_table
 from core.anagram_helper import AnagramHelper
 from config import game_config
 
+# Scores candidate racks off the game loop. One worker is enough: at most
+# MAX_LETTERS racks are speculated per falling letter. Threads are started lazily.
+_speculation_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="next-letter")
+
 class TileGenerator:
     """
     Centralized service for generating tiles and managing RNG state.
     This ensures a Single Source of Truth for randomness, decoupled from Rack instances.
     """
-    def __init__(self):
-        self._anagram_helper = AnagramHelper.get_instance()
+    def __init__(self, dictionary_path: Optional[str] = None):
+        self._dictionary_path = dictionary_path or game_config.DICTIONARY_PATH
+        self._anagram_helper = AnagramHelper.get_instance(self._dictionary_path)
+        # Precomputed scores for every full rack; None means always score live
+        self._next_letter_table = next_letter_table.load(self._dictionary_path)
+        # Sorted rack letters -> candidates being scored in the background
+        self._speculative: dict[str, Future] = {}
         # Shared RNG state logic could go here if we needed to persist/restore it centrally
         self._random_state = random.getstate()
 
+    def set_word_list(self, dictionary_path: Optional[str]) -> None:
+        """
+        Score candidates against another word list (None for the default one).
+        Indexes and tables are cached per word list, so switching back and
+        forth doesn't reload anything.
+        """
+        dictionary_path = dictionary_path or game_config.DICTIONARY_PATH
+        if dictionary_path == self._dictionary_path:
+            return
+        self.speculate([])  # Speculated scores are for the old word list
+        self._dictionary_path = dictionary_path
+        self._anagram_helper = AnagramHelper.get_instance(dictionary_path)
+        self._next_letter_table = next_letter_table.load(dictionary_path)
+
     def get_next_letter(self, current_letters: str) -> str:
         """
         Generate the next letter based on the current letters (on the board/rack).
         Uses AnagramHelper to find viable candidates that form high-scoring words.
         """
-        # Score all candidates (A-Z) by anagram count
-        candidates = self._anagram_helper.score_candidates(current_letters)
+        # Score all candidates (A-Z) by anagram count, picking up speculated scores if any
+        future = self._speculative.get("".join(sorted(current_letters)))
+        if future is not None:
+            candidates = future.result()
+        else:
+            candidates = self._score_candidates(current_letters)
         logging.debug(f"gen_next_letter: Candidates: " + ", ".join([f"{l}:{s}" for l, s in candidates]))
         
         if not candidates:
@@ -46,3 +77,32 @@ class TileGenerator:
         
         logging.debug(f"gen_next_letter: Selected {best_letter} (score {score})")
         return best_letter
+
+    def speculate(self, racks: list[str]) -> None:
+        """
+        Start scoring the racks that get_next_letter() may be asked about next.
+        Only scoring runs in the background; the random choice still happens in
+        get_next_letter(), so RNG consumption order is unchanged.
+        Replaces any previous speculation.
+        """
+        for future in self._speculative.values():
+            future.cancel()
+        self._speculative = {}
+        for rack in racks:
+            key = "".join(sorted(rack))
+            if key not in self._speculative:
+                self._speculative[key] = _speculation_pool.submit(self._score_candidates, rack)
+
+    def _score_candidates(self, current_letters: str) -> list[tuple[str, int]]:
+        """
+        Score all candidates (A-Z), sorted by score descending.
+        Reads the precomputed table when the rack is in it, otherwise scores live.
+        Both paths produce the same list, so RNG consumption is unchanged.
+        """
+        if self._next_letter_table is not None:
+            scores = self._next_letter_table.scores(current_letters)
+            if scores is not None:
+                candidates = list(zip(string.ascii_uppercase, scores))
+                candidates.sort(key=lambda x: x[1], reverse=True)
+                return candidates
+        return self._anagram_helper.score_candidates(current_letters)
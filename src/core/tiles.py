@@ -30,6 +30,7 @@ from config import game_config
 
 MAX_LETTERS = game_config.MAX_LETTERS
 MIN_LETTERS = game_config.MIN_LETTERS
+N_LETTERS = 26  # Slots in a rack's letter-count vector, A-Z
 
 @dataclass(unsafe_hash=True)
 class Tile:
@@ -48,6 +49,11 @@ class Tile:
 def _tiles_to_letters(tiles: Sequence[Tile]) -> str:
     return ''.join(t.letter for t in tiles)
 
+def _slot(letter: str) -> int:
+    """Index of letter in a count vector, or -1 if it isn't A-Z (e.g. '?' or empty)."""
+    slot = ord(letter) - 65 if len(letter) == 1 else -1
+    return slot if 0 <= slot < N_LETTERS else -1
+
 class Rack:
     def __init__(self, letters: str) -> None:
         self._tiles = []
@@ -56,6 +62,8 @@ class Rack:
         self._last_guess: list[Tile]  = []
         self._next_letter = "?"
         self._id_to_pos_cache: dict[str, int] = {}
+        self._counts = [0] * N_LETTERS  # Tiles per letter A-Z
+        self._ids_by_letter: dict[str, list[str]] = {}  # Letter -> IDs of its tiles, in rack order
         self._rebuild_cache() 
 
     def __repr__(self) -> str:
@@ -66,8 +74,19 @@ class Rack:
         return self._tiles
 
     def _rebuild_cache(self) -> None:
-        """Rebuild the ID→position lookup cache."""
+        """Rebuild the ID→position lookup cache and the per-letter state."""
         self._id_to_pos_cache = {tile.id: i for i, tile in enumerate(self._tiles)}
+        self._counts = [0] * N_LETTERS
+        self._ids_by_letter = {}
+        for tile in self._tiles:
+            slot = _slot(tile.letter)
+            if slot >= 0:
+                self._counts[slot] += 1
+            self._ids_by_letter.setdefault(tile.letter, []).append(tile.id)
+
+    def letter_counts(self) -> tuple[int, ...]:
+        """How many tiles hold each of A-Z: the rack's letter multiset, usable as an anagram key."""
+        return tuple(self._counts)
 
     def id_to_position(self, id: str) -> int:
         """Get position of tile with given ID. O(1) cached lookup."""
@@ -84,26 +103,19 @@ class Rack:
         return _tiles_to_letters(self._last_guess)
 
     def letters_to_ids(self, letters: str) -> list[str]:
-        # Create a lookup of available tiles by letter
-        available_tiles = {}
-        for tile in self._tiles:
-            if tile.letter not in available_tiles:
-                available_tiles[tile.letter] = []
-            available_tiles[tile.letter].append(tile)
-        
-        # Build the result list
+        # A letter's tiles are handed out last-in-rack first; letters with no tiles left are skipped
+        used: dict[str, int] = {}
         ids = []
         for letter in letters:
-            if letter in available_tiles and available_tiles[letter]:
-                tile = available_tiles[letter].pop()  # Get and remove the first available tile
-                ids.append(tile.id)
+            letter_ids = self._ids_by_letter.get(letter, [])
+            n_used = used.get(letter, 0)
+            if n_used < len(letter_ids):
+                ids.append(letter_ids[-1 - n_used])
+                used[letter] = n_used + 1
         return ids
 
     def ids_to_tiles(self, ids: list[str]) -> list[Tile]:
-        tiles = []
-        for an_id in ids:
-            tiles.append(next(t for t in self._tiles if t.id == an_id))
-        return tiles
+        return [self._tiles[self._id_to_pos_cache[an_id]] for an_id in ids]
 
     def ids_to_letters(self, ids: list[str]) -> str:
         return _tiles_to_letters(self.ids_to_tiles(ids))
@@ -113,12 +125,13 @@ class Rack:
         self._last_guess = self.ids_to_tiles(self.letters_to_ids(guess))
 
     def missing_letters(self, word: str) -> str:
-        rack_hash = Counter(_tiles_to_letters(self._tiles))
-        word_hash = Counter(word)
-        if all(word_hash[letter] <= rack_hash[letter] for letter in word):
-            return ""
-        else:
-            return "".join([l for l in word_hash if word_hash[l] > rack_hash[l]])
+        needed = Counter(word)
+        missing = [l for l, n in needed.items() if n > self._count(l)]
+        return "".join(missing)
+
+    def _count(self, letter: str) -> int:
+        slot = _slot(letter)
+        return self._counts[slot] if slot >= 0 else len(self._ids_by_letter.get(letter, []))
 
     def letters(self) -> str:
         return _tiles_to_letters(self._tiles)
@@ -137,6 +150,20 @@ class Rack:
         # Update self: Create NEW Tile object (Immutable replacement)
         new_tile = Tile(new_letter, old_tile.id)
         self._tiles[position] = new_tile
+
+        # Move the tile's ID between letters, keeping each letter's IDs in rack order
+        old_slot, new_slot = _slot(old_tile.letter), _slot(new_letter)
+        if old_slot >= 0:
+            self._counts[old_slot] -= 1
+        if new_slot >= 0:
+            self._counts[new_slot] += 1
+        old_ids = self._ids_by_letter[old_tile.letter]
+        old_ids.remove(old_tile.id)
+        if not old_ids:
+            del self._ids_by_letter[old_tile.letter]
+        new_ids = self._ids_by_letter.setdefault(new_letter, [])
+        new_ids.append(new_tile.id)
+        new_ids.sort(key=self._id_to_pos_cache.__getitem__)
         
         logging.info(f"final: {str(self)}")
         return new_tile
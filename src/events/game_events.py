@@ -5,8 +5,8 @@ replacing the string-based event system with compile-time type safety.
 """
 
 from dataclasses import dataclass
-from enum import Enum
-from typing import Any
+from enum import Enum, IntEnum
+from typing import Any, ClassVar, Hashable, Optional
 from core import tiles
 
 
@@ -29,12 +29,25 @@ class EventType(str, Enum):
     INPUT_ADD_GUESS = "input.add_guess"
     INPUT_UPDATE_PREVIOUS_GUESSES = "input.update_previous_guesses"
     INPUT_REMAINING_PREVIOUS_GUESSES = "input.remaining_previous_guesses"
+    INPUT_PREVIOUS_GUESSES_DELTA = "input.previous_guesses_delta"
+
+
+class EventLane(IntEnum):
+    """EventEngine queue lanes, served lowest value first."""
+    GAMEPLAY = 0  # Guesses, the falling letter, starting and aborting
+    RACK = 1  # Rack redraws
+    DISPLAY = 2  # Previous/remaining guess lists
 
 
 @dataclass
 class GameEvent:
     """Base class for all game events."""
     event_type: EventType
+    lane: ClassVar[EventLane] = EventLane.RACK
+
+    def coalesce_key(self) -> Optional[Hashable]:
+        """Events with the same non-None key replace each other while queued, newest wins."""
+        return None
 
 
 # ============================================================================
@@ -44,6 +57,7 @@ class GameEvent:
 @dataclass
 class GameStageGuessEvent(GameEvent):
     """Triggered when a valid word guess is made."""
+    lane: ClassVar[EventLane] = EventLane.GAMEPLAY
     score: int
     last_guess: str
     player: int
@@ -60,6 +74,7 @@ class GameStageGuessEvent(GameEvent):
 @dataclass
 class GameOldGuessEvent(GameEvent):
     """Triggered when a duplicate/previously guessed word is submitted."""
+    lane: ClassVar[EventLane] = EventLane.GAMEPLAY
     old_guess: str
     player: int
     now_ms: int
@@ -74,6 +89,7 @@ class GameOldGuessEvent(GameEvent):
 @dataclass
 class GameBadGuessEvent(GameEvent):
     """Triggered when an invalid/not-in-dictionary word is guessed."""
+    lane: ClassVar[EventLane] = EventLane.GAMEPLAY
     player: int
 
     def __init__(self, player: int):
@@ -84,6 +100,7 @@ class GameBadGuessEvent(GameEvent):
 @dataclass
 class GameNextTileEvent(GameEvent):
     """Updates the next letter that will fall into the rack."""
+    lane: ClassVar[EventLane] = EventLane.GAMEPLAY
     next_letter: str
     now_ms: int
 
@@ -96,6 +113,7 @@ class GameNextTileEvent(GameEvent):
 @dataclass
 class GameAbortEvent(GameEvent):
     """Aborts the current game."""
+    lane: ClassVar[EventLane] = EventLane.GAMEPLAY
 
     def __init__(self):
         super().__init__(EventType.GAME_ABORT)
@@ -104,6 +122,7 @@ class GameAbortEvent(GameEvent):
 @dataclass
 class GameStartPlayerEvent(GameEvent):
     """Starts game for a specific player (enables multi-player mode)."""
+    lane: ClassVar[EventLane] = EventLane.GAMEPLAY
     now_ms: int
     player: int
 
@@ -138,6 +157,12 @@ class RackUpdateRackEvent(GameEvent):
         self.now_ms = now_ms
         self.guessed_tile_ids = guessed_tile_ids or ()
 
+    def coalesce_key(self) -> Optional[Hashable]:
+        # Only plain refreshes: a highlight or removal has to reach the display.
+        if self.highlight_length or self.guess_length or self.guessed_tile_ids:
+            return None
+        return (self.event_type, self.player)
+
 
 @dataclass
 class RackUpdateLetterEvent(GameEvent):
@@ -152,6 +177,9 @@ class RackUpdateLetterEvent(GameEvent):
         self.player = player
         self.now_ms = now_ms
 
+    def coalesce_key(self) -> Optional[Hashable]:
+        return (self.event_type, self.player)
+
 
 # ============================================================================
 # INPUT EVENTS
@@ -160,6 +188,7 @@ class RackUpdateLetterEvent(GameEvent):
 @dataclass
 class InputAddGuessEvent(GameEvent):
     """Adds a new guess to the previous guesses display."""
+    lane: ClassVar[EventLane] = EventLane.DISPLAY
     previous_guesses: list[str]
     guess: str
     player: int
@@ -176,6 +205,7 @@ class InputAddGuessEvent(GameEvent):
 @dataclass
 class InputUpdatePreviousGuessesEvent(GameEvent):
     """Updates the list of all previous guesses made in the game."""
+    lane: ClassVar[EventLane] = EventLane.DISPLAY
     previous_guesses: list[str]
     now_ms: int
 
@@ -188,6 +218,7 @@ class InputUpdatePreviousGuessesEvent(GameEvent):
 @dataclass
 class InputRemainingPreviousGuessesEvent(GameEvent):
     """Updates the display of remaining/unused previous guesses."""
+    lane: ClassVar[EventLane] = EventLane.DISPLAY
     previous_guesses: list[str]
     now_ms: int
 
@@ -195,3 +226,23 @@ class InputRemainingPreviousGuessesEvent(GameEvent):
         super().__init__(EventType.INPUT_REMAINING_PREVIOUS_GUESSES)
         self.previous_guesses = previous_guesses
         self.now_ms = now_ms
+
+
+@dataclass
+class InputPreviousGuessesDeltaEvent(GameEvent):
+    """Words added to and removed from the previous and remaining guess lists."""
+    lane: ClassVar[EventLane] = EventLane.DISPLAY
+    added: list[str]
+    removed: list[str]
+    remaining_added: list[str]
+    remaining_removed: list[str]
+    now_ms: int
+
+    def __init__(self, added: list[str], removed: list[str],
+                 remaining_added: list[str], remaining_removed: list[str], now_ms: int):
+        super().__init__(EventType.INPUT_PREVIOUS_GUESSES_DELTA)
+        self.added = added
+        self.removed = removed
+        self.remaining_added = remaining_added
+        self.remaining_removed = remaining_removed
+        self.now_ms = now_ms
@@ -244,6 +244,7 @@ class GameCoordinator:
         self.game.one_round = params.one_round
         self.game.min_win_score = params.min_win_score
         self.game.level = params.level
+        self.game.lexicon = params.lexicon
         self.game.next_column_ms = params.next_column_ms
         self.game.letter_linger_ms = params.letter_linger_ms
 
@@ -264,6 +265,7 @@ class GameCoordinator:
             self.current_setup_params['recovery_duration_multiplier'] = params.recovery_duration_multiplier
             logger.info(f"Updated recovery_duration_multiplier to {params.recovery_duration_multiplier} (duration_ms={recovery_duration_ms})")
 
+        self.game.stars = params.stars
         self.game.show_level = params.stars
         self.game.level_fade_start_ms = -1  # Reset level fade trigger to show level again
         self.game.descent_duration_s = params.descent_duration_s
@@ -296,8 +298,9 @@ class GameCoordinator:
         self.current_setup_params['min_win_score'] = params.min_win_score
         self.current_setup_params['stars'] = params.stars
         self.current_setup_params['level'] = params.level
+        self.current_setup_params['lexicon'] = params.lexicon
 
         logger.info(f"Applied game params: one_round={params.one_round}, min_win_score={params.min_win_score}, "
-                   f"stars={params.stars}, level={params.level}, descent_mode={params.descent_mode}, letter_drop_time_ms={self.game.letter.drop_time_ms}")
+                   f"stars={params.stars}, level={params.level}, lexicon={params.lexicon}, descent_mode={params.descent_mode}, letter_drop_time_ms={self.game.letter.drop_time_ms}")
 
         return needs_re_setup
@@ -72,6 +72,8 @@ class Game:
             raise ValueError(f"min_win_score must be non-negative, got {min_win_score}")
         self.min_win_score = min_win_score
         self.level = level
+        self.stars = stars  # game_on mode: racks are drawn for the level's difficulty
+        self.lexicon: Optional[str] = None  # Set per game from GameParams; None for the default
         self.next_column_ms = next_column_ms
         self.letter_linger_ms = letter_linger_ms
         self.show_level = stars  # Only show level in game_on mode (stars enabled)
@@ -137,6 +139,7 @@ class Game:
         self.melt_effect: Optional[MeltEffect] = None
         self.balloon_effects: list[BalloonEffect] = []
 
+        events.on("game.stage_guess")(self.mark_good_guess)
         events.on("game.stage_guess")(self.stage_guess)
         events.on("game.old_guess")(self.old_guess)
         events.on("game.bad_guess")(self.bad_guess)
@@ -145,6 +148,7 @@ class Game:
         events.on("game.start_player")(self.start_cubes_player)
         events.on("input.remaining_previous_guesses")(self.update_remaining_guesses)
         events.on("input.update_previous_guesses")(self.update_previous_guesses)
+        events.on("input.previous_guesses_delta")(self.update_previous_guesses_delta)
         events.on("input.add_guess")(self.add_guess)
         events.on("rack.update_rack")(self.update_rack)
         events.on("rack.update_letter")(self.update_letter)
@@ -204,12 +208,16 @@ class Game:
         """Update a single letter tile with animation."""
         await self.racks[player].update_letter(changed_tile, now_ms)
 
-    async def old_guess(self, old_guess: str, player: int, now_ms: int) -> None:
+    def mark_good_guess(self, score: int, last_guess: str, player: int, now_ms: int) -> None:
+        """Mark a good guess, in trigger order with old_guess and bad_guess."""
+        self.racks[player].guess_type = GuessType.GOOD
+
+    def old_guess(self, old_guess: str, player: int, now_ms: int) -> None:
         """Handle an old (duplicate) guess."""
         self.racks[player].guess_type = GuessType.OLD
         self.guesses_manager.old_guess(old_guess, now_ms)
 
-    async def bad_guess(self, player: int) -> None:
+    def bad_guess(self, player: int) -> None:
         """Handle a bad (invalid) guess."""
         self.racks[player].guess_type = GuessType.BAD
 
@@ -293,7 +301,8 @@ class Game:
         self.stop_time_s = -1000
         self.last_letter_time_s = now_s
         self.start_time_s = now_s
-        await self._app.start(now_ms)
+        self._app.set_lexicon(self.lexicon)
+        await self._app.start(now_ms, self.level if self.stars else None)
         self.sound_manager.play_start()
 
         # Publish to Game On broker
@@ -304,10 +313,8 @@ class Game:
         return 0
 
     async def stage_guess(self, score: int, last_guess: str, player: int, now_ms: int) -> None:
-        """Stage a good guess with shield animation."""
-        print(f"[DEBUG] stage_guess called with word='{last_guess}', player={player}")
+        """Stage a good guess with shield animation (mark_good_guess sets the rack's guess type)."""
         await self.sound_manager.queue_word_sound(last_guess, player)
-        self.racks[player].guess_type = GuessType.GOOD
         self.shields.append(Shield(
             self.rack_metrics.get_rect().topleft, 
             last_guess, 
@@ -408,8 +415,12 @@ class Game:
             next_letter = "!!!!!!"
         self.letter.change_letter(next_letter, now_ms)
 
-    async def add_guess(self, previous_guesses: list[str], guess: str, player: int, now_ms: int) -> None:
-        """Add a new guess to the display."""
+    def add_guess(self, previous_guesses: list[str], guess: str, player: int, now_ms: int) -> None:
+        """Add a new guess to the display.
+
+        Plain like the other guess-list handlers, so all of them run in trigger
+        order and a queued add can't redraw an older list over a newer one.
+        """
         if not self.running:
             return
             
@@ -419,16 +430,29 @@ class Game:
         self.guess_to_player[guess] = player
         self.guesses_manager.add_guess(previous_guesses, guess, player, now_ms)
 
-    async def update_previous_guesses(self, previous_guesses: list[str], now_ms: int) -> None:
+    def update_previous_guesses(self, previous_guesses: list[str], now_ms: int) -> None:
         """Update the previous guesses display."""
         self.guesses_manager.update_previous_guesses(previous_guesses, now_ms)
 
-    async def update_remaining_guesses(self, previous_guesses: list[str], now_ms: int) -> None:
+    def update_remaining_guesses(self, previous_guesses: list[str], now_ms: int) -> None:
         """Update the remaining/unused guesses display."""
         self.guesses_manager.update_remaining_guesses(previous_guesses, now_ms)
 
+    def update_previous_guesses_delta(self, added: list[str], removed: list[str],
+                                      remaining_added: list[str], remaining_removed: list[str],
+                                      now_ms: int) -> None:
+        """Apply the words that moved in or out of both guess displays."""
+        self.guesses_manager.apply_delta(added, removed, remaining_added, remaining_removed, now_ms)
+
     async def update(self, window: pygame.Surface, now_ms: int) -> list:
-        """Update all game components and handle collisions."""
+        """Update all game components and handle collisions.
+
+        The frame's cube updates and rack events are sent together at the end.
+        """
+        async with self._app.batch(now_ms):
+            return await self._update_frame(window, now_ms)
+
+    async def _update_frame(self, window: pygame.Surface, now_ms: int) -> list:
         incidents = []
         window.set_alpha(255)
         # Calculate if we should animate (Game Over and within 15s)
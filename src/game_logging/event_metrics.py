@@ -0,0 +1,85 @@
+"""Queue latency and handler timings for the EventEngine.
+
+Off by default: the engine only measures anything once an EventMetrics is
+assigned to its `metrics` attribute (main.py's --event-metrics flag does
+this). Each event name keeps the last WINDOW samples of
+
+- latency: time from trigger() queuing the event to the worker taking it,
+- handler time: how long each async handler ran, with a count of failures,
+
+and reports them as histograms over fixed millisecond buckets.
+"""
+
+import bisect
+import json
+import time
+from collections import defaultdict, deque
+from typing import Any, Iterable
+
+WINDOW = 1000
+BUCKETS_MS = (0.1, 0.5, 1, 2, 5, 10, 20, 50, 100, 500)
+
+
+def histogram(samples: Iterable[float]) -> dict[str, int]:
+    """Counts per bucket, keyed by upper bound ("<=1") with the overflow as ">500"."""
+    counts = [0] * (len(BUCKETS_MS) + 1)
+    for sample in samples:
+        counts[bisect.bisect_left(BUCKETS_MS, sample)] += 1
+    labels = [f"<={bound}" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"]
+    return dict(zip(labels, counts))
+
+
+def _summary(samples: deque) -> dict[str, Any]:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "max_ms": round(ordered[-1], 3) if ordered else 0,
+        "p50_ms": round(ordered[len(ordered) // 2], 3) if ordered else 0,
+        "p95_ms": round(ordered[int(len(ordered) * 0.95)], 3) if ordered else 0,
+        "histogram": histogram(ordered),
+    }
+
+
+class EventMetrics:
+    def __init__(self, window: int = WINDOW) -> None:
+        self.window = window
+        self._latency: dict[str, deque] = defaultdict(self._samples)
+        self._handlers: dict[str, dict[str, deque]] = defaultdict(lambda: defaultdict(self._samples))
+        self._errors: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def _samples(self) -> deque:
+        return deque(maxlen=self.window)
+
+    def record_latency(self, event_name: str, latency_ms: float) -> None:
+        self._latency[event_name].append(latency_ms)
+
+    def record_handler(self, event_name: str, handler: str, duration_ms: float, failed: bool) -> None:
+        self._handlers[event_name][handler].append(duration_ms)
+        if failed:
+            self._errors[event_name][handler] += 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Per event name: latency summary and, per handler, time summary and error count."""
+        result = {}
+        for event_name in sorted(set(self._latency) | set(self._handlers)):
+            handlers = {}
+            for handler, samples in self._handlers.get(event_name, {}).items():
+                handlers[handler] = {**_summary(samples),
+                                     "errors": self._errors.get(event_name, {}).get(handler, 0)}
+            result[event_name] = {
+                "latency": _summary(self._latency.get(event_name, deque())),
+                "handlers": handlers,
+            }
+        return result
+
+    def dump(self, path: str) -> None:
+        """Append one JSON line per event name to path."""
+        timestamp_ms = int(time.time() * 1000)
+        with open(path, "a", encoding="utf-8") as f:
+            for event_name, metrics in self.snapshot().items():
+                f.write(json.dumps({"timestamp_ms": timestamp_ms, "event": event_name, **metrics}) + "\n")
+
+    def reset(self) -> None:
+        self._latency.clear()
+        self._handlers.clear()
+        self._errors.clear()
@@ -0,0 +1,85 @@
+"""Structured tracing for hot paths, off unless its category is enabled.
+
+Per-guess and per-MQTT-message diagnostics used to go to print() and INFO
+logs on every call, which costs frame time on the Pi. Each hot path now has
+a Category, and its call sites check a plain attribute before building
+anything:
+
+    if trace.GUESS.enabled:
+        trace.GUESS.emit("guess_tiles", player=player, tile_ids=word_tile_ids)
+
+so a disabled category costs one attribute load. Enabled records are dicts
+({"category", "event", "time_ms", **fields}) handed to a sink, by default a
+JSON line on the "trace" logger.
+
+Categories are enabled with the TRACE environment variable or main.py's
+--trace flag, as a comma-separated list of names or "all".
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Iterable
+
+logger = logging.getLogger("trace")
+
+
+def _log_record(record: dict[str, Any]) -> None:
+    logger.info(json.dumps(record, default=str))
+
+
+_sink: Callable[[dict[str, Any]], None] = _log_record
+
+
+class Category:
+    __slots__ = ("name", "enabled")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.enabled = False
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Send a record. Call sites check `enabled` first so disabled categories skip the arguments too."""
+        if self.enabled:
+            _sink({"category": self.name, "event": event,
+                   "time_ms": int(time.monotonic() * 1000), **fields})
+
+
+GUESS = Category("guess")  # App.guess_tiles: tiles, letters and how the guess was judged
+CUBES = Category("cubes")  # Cube chains and neighbor tables in CubeSetManager
+MQTT = Category("mqtt")  # Messages received from the cubes and how they were routed
+
+CATEGORIES = {category.name: category for category in (GUESS, CUBES, MQTT)}
+
+
+def enable(names: Iterable[str]) -> None:
+    """Turn on the named categories ("all" for every one). Unknown names raise ValueError."""
+    for name in names:
+        name = name.strip()
+        if not name:
+            continue
+        if name == "all":
+            for category in CATEGORIES.values():
+                category.enabled = True
+        elif name in CATEGORIES:
+            CATEGORIES[name].enabled = True
+        else:
+            raise ValueError(f"Unknown trace category {name!r}, expected one of {sorted(CATEGORIES)} or 'all'")
+
+
+def disable_all() -> None:
+    for category in CATEGORIES.values():
+        category.enabled = False
+
+
+def set_sink(sink: Callable[[dict[str, Any]], None] | None) -> None:
+    """Send records to sink instead of the "trace" logger; None restores the logger."""
+    global _sink
+    _sink = sink or _log_record
+
+
+try:
+    enable(os.environ.get("TRACE", "").split(","))
+except ValueError as e:
+    logger.warning(str(e))
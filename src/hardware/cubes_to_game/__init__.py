@@ -24,13 +24,17 @@ from .coordination import (
     # ABC start management
     activate_abc_start_if_ready,
     is_any_player_in_countdown,
-    check_countdown_completion,
+    advance_countdown,
     # Guess feedback
     good_guess,
     old_guess,
     bad_guess,
     # MQTT handling
     handle_mqtt_message,
+    apply_settled_neighbor_reports,
+    set_neighbor_settle_ms,
+    # Publish feedback
+    publish_failed,
 )
 
 # Re-export state management functions and variables
@@ -49,10 +53,6 @@ from .state import (
     set_guess_tiles_callback,
     set_remove_highlight_callback,
     set_start_game_callback,
-    # Global state variables (for direct access)
-    ABC_COUNTDOWN_DELAY_MS,
-    cube_to_cube_set,
-    locked_cubes,
 )
 
 # Import state module for dynamic attribute access
@@ -60,13 +60,18 @@ from . import state as _state
 
 # Re-export classes for testing and advanced usage
 from .cube_set_manager import CubeSetManager
-from .abc_manager import ABCManager
+from .abc_manager import ABCManager, CountdownState
+from .neighbor_filter import NeighborFilter
+from .cube_display import CubeDisplay
+from .timers import GameTimeTimers
+from .session import CubesSession
 
 
-# Dynamic attribute access for managers - allows tests to get them properly
+# Dynamic attribute access for the default session's managers and state - allows tests to get them properly
 def __getattr__(name):
-    """Dynamically look up manager instances from state module."""
-    if name in ('cube_set_managers', 'abc_manager'):
+    """Dynamically look up the default session's managers and state from state module."""
+    if name in ('cube_set_managers', 'abc_manager', 'neighbor_filter',
+                'ABC_COUNTDOWN_DELAY_MS', 'cube_to_cube_set', 'locked_cubes'):
         return getattr(_state, name)
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
@@ -90,19 +95,29 @@ __all__ = [
     # ABC start management
     'activate_abc_start_if_ready',
     'is_any_player_in_countdown',
-    'check_countdown_completion',
+    'advance_countdown',
     # Guess feedback
     'good_guess',
     'old_guess',
     'bad_guess',
     # MQTT handling
     'handle_mqtt_message',
+    'apply_settled_neighbor_reports',
+    'set_neighbor_settle_ms',
+    # Publish feedback
+    'publish_failed',
     # Manager instances
     'cube_set_managers',
     'abc_manager',
+    'neighbor_filter',
     # Manager classes (for testing and advanced usage)
     'CubeSetManager',
     'ABCManager',
+    'CountdownState',
+    'NeighborFilter',
+    'CubeDisplay',
+    'GameTimeTimers',
+    'CubesSession',
     # State management
     'set_abc_countdown_delay',
     'set_game_running',
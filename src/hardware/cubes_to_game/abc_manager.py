@@ -1,12 +1,16 @@
 """ABC sequence and countdown management for game start.
 
 This module manages the ABC countdown sequence that players use to start a game.
+The countdown's stages are scheduled on game-time timers, which the frame
+runs through advance_countdown once they are due.
 """
 
 import logging
-from typing import List
+from dataclasses import dataclass
+from enum import Enum
+from typing import Awaitable, Callable, List, Optional
 
-from . import state
+from .timers import GameTimeTimers
 
 
 def _find_non_touching_cubes_for_player(manager) -> List[str]:
@@ -35,31 +39,94 @@ def _find_non_touching_cubes_for_player(manager) -> List[str]:
     return selected_cubes[:3]
 
 
+class CountdownState(Enum):
+    IDLE = "idle"  # No ABC letters handed out
+    WAITING_FOR_ABC = "waiting_for_abc"  # A, B, C shown; waiting for a player to line them up
+    COUNTING_DOWN = "counting_down"  # Cubes turning to '?' one stage at a time, then the game starts
+
+
+COUNTDOWN_STAGES = ['non_abc_1', 'non_abc_2', 'non_abc_3', 'A', 'B', 'C']
+
+
+@dataclass
+class _Countdown:
+    """What a running countdown needs when its timers fire."""
+    publish_queue: object
+    sound_manager: object
+    cube_set_managers: list
+    start_cube_set: Callable[[int, int], Awaitable[None]]  # (player, start ms)
+
+
 class ABCManager:
-    """Manages ABC sequence and countdown logic."""
+    """Manages ABC sequence and countdown logic.
 
-    def __init__(self):
-        # ABC sequence state
-        self.abc_start_active = False
+    A state machine: IDLE until ABC letters are handed out, WAITING_FOR_ABC
+    until a player lines up A-B-C, then COUNTING_DOWN. Each countdown stage
+    and the final game start are scheduled on `timers` (see timers.py) when
+    the previous one runs, so the frame only checks the next deadline.
+    """
+
+    def __init__(self, timers=None):
+        self.timers = timers if timers is not None else GameTimeTimers()
+        self._timer = None  # Handle for the next scheduled countdown transition
+        self._incidents: List[str] = []  # Countdown incidents not yet taken for the game log
+        self.reset()
+
+    def reset(self):
+        """Reset all ABC/countdown state, dropping any scheduled countdown transition."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self.state = CountdownState.IDLE
         self.player_abc_cubes = {}  # Maps player number to their ABC cube assignments
 
         # Countdown state
         self.player_countdown_active = {}  # Track which players are in countdown phase
-        self.global_countdown_schedule = []  # List of (time, replacement_type)
-        self.countdown_complete_time = None  # When the global countdown will complete
-
-    def reset(self):
-        """Reset all ABC/countdown state."""
-        self.abc_start_active = False
-        self.player_abc_cubes = {}
-        self.player_countdown_active = {}
-        self.global_countdown_schedule = []
-        self.countdown_complete_time = None
+        self.countdown_schedule = []  # List of (time, stage) for the running countdown
+        self.stages_done = 0  # How many of countdown_schedule have run
+        self.countdown_complete_time = None  # When the running countdown will start the game
+        self._countdown: Optional[_Countdown] = None
+
+    @property
+    def abc_start_active(self) -> bool:
+        """Whether ABC letters have been handed out (waiting for A-B-C, or counting down)."""
+        return self.state is not CountdownState.IDLE
+
+    @property
+    def stage(self) -> Optional[str]:
+        """The countdown stage that ran last; None before the first one."""
+        if self.stages_done == 0:
+            return None
+        return self.countdown_schedule[self.stages_done - 1][1]
 
     def is_any_player_in_countdown(self) -> bool:
         """Check if any player is currently in countdown phase."""
         return bool(self.player_countdown_active)
 
+    def next_deadline_ms(self) -> Optional[int]:
+        """When the countdown's next transition is scheduled; None when no countdown is running."""
+        if self.state is not CountdownState.COUNTING_DOWN:
+            return None
+        if self.stages_done < len(self.countdown_schedule):
+            return self.countdown_schedule[self.stages_done][0]
+        return self.countdown_complete_time
+
+    def diagnostics(self) -> dict:
+        """The state machine's current state, for logs and debugging."""
+        return {
+            "state": self.state.value,
+            "stage": self.stage,
+            "next_transition_ms": self.next_deadline_ms(),
+            "complete_ms": self.countdown_complete_time,
+            "abc_players": sorted(self.player_abc_cubes),
+            "countdown_players": sorted(self.player_countdown_active),
+        }
+
+    def take_incidents(self) -> List[str]:
+        """Incidents from countdown stages run since the last call."""
+        incidents, self._incidents = self._incidents, []
+        return incidents
+
     async def assign_abc_letters_to_available_players(self, publish_queue, now_ms: int, cube_set_managers: list) -> None:
         """Assign ABC letters to players who have enough cubes but don't have ABC assignments yet.
 
@@ -68,7 +135,8 @@ class ABCManager:
             now_ms: Current timestamp
             cube_set_managers: List of CubeSetManager instances
         """
-        self.abc_start_active = True
+        if self.state is CountdownState.IDLE:
+            self.state = CountdownState.WAITING_FOR_ABC
         letters = ["A", "B", "C"]
         for manager in cube_set_managers:
             # Skip if this player already has ABC assignments
@@ -84,9 +152,9 @@ class ABCManager:
                 }
                 for i, letter in enumerate(letters):
                     cube_id = player_abc_cubes[i]
-                    # Publish letter using queue
-                    await publish_queue.put((f"cube/{cube_id}/letter", letter, True, now_ms))
+                    manager.display.set(cube_id, "letter", letter)
                     logging.info(f"activating abc: {cube_id}: {letter}")
+                await manager.display.reconcile(publish_queue, now_ms)
 
     async def activate_abc_start_sequence(self, publish_queue, now_ms: int, cube_set_managers: list) -> None:
         """Activate the ABC sequence start system.
@@ -118,7 +186,7 @@ class ABCManager:
         Returns:
             Player number if complete, None otherwise
         """
-        if not self.abc_start_active:
+        if self.state is CountdownState.IDLE:
             return None
         # Check all cube managers for ABC sequence using the stored assignments
         for manager in cube_set_managers:
@@ -176,7 +244,9 @@ class ABCManager:
             cube_id = abc_cubes['C']
 
         if cube_id:
-            await publish_queue.put((f"cube/{cube_id}/letter", "?", True, now_ms))
+            display = cube_set_managers[player].display
+            display.set(cube_id, "letter", "?")
+            await display.reconcile(publish_queue, now_ms)
             sound_manager.play_chunk()
 
     async def apply_past_letter_stages(self, publish_queue, player: int, now_ms: int, sound_manager,
@@ -190,9 +260,9 @@ class ABCManager:
             sound_manager: SoundManager instance
             cube_set_managers: List of CubeSetManager instances
         """
-        # Apply all stages that should have already happened
-        for stage_time, stage_type in self.global_countdown_schedule:
-            if stage_time < now_ms:  # This stage is in the past
+        # Apply the stages that are due but have not run yet
+        for stage_time, stage_type in self.countdown_schedule[self.stages_done:]:
+            if stage_time < now_ms:
                 await self.execute_letter_stage_for_player(publish_queue, player, stage_type, now_ms, sound_manager,
                                                             cube_set_managers)
 
@@ -231,7 +301,8 @@ class ABCManager:
 
         await self.apply_past_letter_stages(publish_queue, player, now_ms, sound_manager, cube_set_managers)
 
-    async def start_abc_countdown(self, publish_queue, player: int, now_ms: int, abc_countdown_delay_ms: int) -> None:
+    async def start_abc_countdown(self, publish_queue, player: int, now_ms: int, abc_countdown_delay_ms: int,
+                                  sound_manager, cube_set_managers: list, start_cube_set) -> None:
         """Start the global ABC countdown sequence.
 
         Args:
@@ -239,21 +310,57 @@ class ABCManager:
             player: Player number who triggered the countdown
             now_ms: Current timestamp
             abc_countdown_delay_ms: Delay between countdown stages
+            sound_manager: SoundManager instance
+            cube_set_managers: List of CubeSetManager instances
+            start_cube_set: Awaited with (player, start ms) for each player when the countdown completes
         """
         delay_ms = abc_countdown_delay_ms
+        self.state = CountdownState.COUNTING_DOWN
         self.player_countdown_active[player] = True
 
         logging.info(f"ABC sequence complete for player {player}! Starting global countdown")
 
-        # Create global countdown schedule: 3 non-ABC stages, then A, B, C (500ms intervals)
-        stages = ['non_abc_1', 'non_abc_2', 'non_abc_3', 'A', 'B', 'C']
-        self.global_countdown_schedule = [(now_ms + i * delay_ms, stage) for i, stage in enumerate(stages)]
+        # Global countdown schedule: 3 non-ABC stages, then A, B, C, one delay apart
+        self.countdown_schedule = [(now_ms + i * delay_ms, stage) for i, stage in enumerate(COUNTDOWN_STAGES)]
+        self.stages_done = 0
 
         # Game will start after the last replacement
-        self.countdown_complete_time = now_ms + len(stages) * delay_ms
+        self.countdown_complete_time = now_ms + len(COUNTDOWN_STAGES) * delay_ms
+        self._countdown = _Countdown(publish_queue, sound_manager, cube_set_managers, start_cube_set)
+        self._schedule_next_transition()
+
+    def _schedule_next_transition(self) -> None:
+        if self.stages_done < len(self.countdown_schedule):
+            self._timer = self.timers.call_at(self.countdown_schedule[self.stages_done][0], self._run_next_stage)
+        else:
+            self._timer = self.timers.call_at(self.countdown_complete_time, self._complete_countdown)
+
+    async def _run_next_stage(self, now_ms: int) -> None:
+        self._timer = None
+        countdown = self._countdown
+        _, stage_type = self.countdown_schedule[self.stages_done]
+        self.stages_done += 1
+        await self.execute_countdown_stage(countdown.publish_queue, stage_type, now_ms, countdown.sound_manager,
+                                           countdown.cube_set_managers)
+        self._incidents.append(f"abc_countdown_replacement: {stage_type}")
+        if self._countdown is countdown:  # Not reset while the stage was publishing
+            self._schedule_next_transition()
+
+    async def _complete_countdown(self, now_ms: int) -> None:
+        self._timer = None
+        countdown = self._countdown
+        start_ms = self.countdown_complete_time
+        countdown.sound_manager.play_crash()
+        try:
+            # All players in countdown complete at the same time
+            for player in list(self.player_countdown_active.keys()):
+                logging.info(f"ABC countdown complete for player {player}! Starting game at {now_ms}")
+                await countdown.start_cube_set(player, start_ms)
+        finally:
+            self.reset()
 
     async def handle_abc_completion(self, publish_queue, completed_player: int, now_ms: int, sound_manager,
-                                     cube_set_managers: list, abc_countdown_delay_ms: int) -> None:
+                                     cube_set_managers: list, abc_countdown_delay_ms: int, start_cube_set) -> None:
         """Handle when a player completes their ABC sequence.
 
         If someone is already in countdown, join them. Otherwise start a new countdown.
@@ -265,6 +372,7 @@ class ABCManager:
             sound_manager: SoundManager instance
             cube_set_managers: List of CubeSetManager instances
             abc_countdown_delay_ms: Delay between countdown stages
+            start_cube_set: Awaited with (player, start ms) for each player when the countdown completes
         """
         # Play ping sound when ABC cubes are connected
         sound_manager.play_crash()
@@ -274,55 +382,5 @@ class ABCManager:
                                                    cube_set_managers)
         else:
             logging.info(f"Player {completed_player} starting new countdown")
-            await self.start_abc_countdown(publish_queue, completed_player, now_ms, abc_countdown_delay_ms)
-
-    async def check_countdown_completion(self, publish_queue, now_ms: int, sound_manager, cube_set_managers: list,
-                                          start_game_callback) -> list:
-        """Check if countdown stages need to be executed and if countdown has completed.
-
-        Args:
-            publish_queue: Queue for MQTT messages
-            now_ms: Current timestamp
-            sound_manager: SoundManager instance
-            cube_set_managers: List of CubeSetManager instances
-            start_game_callback: Callback to start the game
-
-        Returns:
-            List of incidents for any countdown replacements that occurred
-        """
-        incidents = []
-
-        # Execute any pending global countdown stages
-        if self.global_countdown_schedule:
-            remaining_stages = []
-            for stage_time, stage_type in self.global_countdown_schedule:
-                if now_ms >= stage_time:
-                    # Execute this stage for all active countdown players
-                    await self.execute_countdown_stage(publish_queue, stage_type, now_ms, sound_manager,
-                                                        cube_set_managers)
-                    incidents.append(f"abc_countdown_replacement: {stage_type}")
-                else:
-                    remaining_stages.append((stage_time, stage_type))
-            self.global_countdown_schedule = remaining_stages
-
-        # Check for completed countdowns
-        completed_players = []
-        if self.countdown_complete_time is not None and now_ms >= self.countdown_complete_time:
-            sound_manager.play_crash()
-            # All players in countdown complete at the same time
-            for player in list(self.player_countdown_active.keys()):
-                logging.info(f"ABC countdown complete for player {player}! Starting game at {now_ms}")
-
-                state.add_started_cube_set(player)
-                completed_players.append(player)
-
-                await start_game_callback(True, self.countdown_complete_time, player)
-            self.reset()
-
-        # If any player completed countdown, clean up countdown state
-        if completed_players:
-            # Clear global countdown state
-            self.global_countdown_schedule = []
-            self.countdown_complete_time = None
-
-        return incidents
+            await self.start_abc_countdown(publish_queue, completed_player, now_ms, abc_countdown_delay_ms,
+                                           sound_manager, cube_set_managers, start_cube_set)
@@ -2,46 +2,44 @@
 
 This module serves as the main orchestrator, tying together all other modules
 and providing the public API for the cubes-to-game system.
+
+Every function takes an optional session (a CubesSession holding the
+installation's managers and state); without one it uses the default session
+in state.py.
 """
 
+import functools
 import logging
-from typing import List
+from typing import List, Optional
 
-from config import game_config
 from core import tiles
+from game_logging import trace
 
 # Import our modules
 from . import state
-from .abc_manager import ABCManager
-from .cube_set_manager import CubeSetManager
+from .session import CubesSession
 
-# Initialize global managers in state module for shared access
-# This allows tests to replace these and have all code see the replacement
-state.cube_set_managers = [CubeSetManager(cube_set_id) for cube_set_id in range(game_config.MAX_PLAYERS)]
-state.abc_manager = ABCManager()
 
-# Create module-level references for convenience (these will be exported)
-cube_set_managers = state.cube_set_managers
-abc_manager = state.abc_manager
+def __getattr__(name):
+    """The default session's managers, looked up on each access so a replaced one is seen."""
+    if name in ('cube_set_managers', 'abc_manager'):
+        return getattr(state.session, name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-async def _publish_letter(publish_queue, letter, cube_id, now_ms):
-    """Publish a letter to a specific cube."""
-    await publish_queue.put((f"cube/{cube_id}/letter", letter, True, now_ms))
-
-
 def _get_all_cube_ids() -> List[str]:
     """Get all valid cube IDs (1-6 for Player 0, 11-16 for Player 1)."""
     return [str(i) for i in range(1, 7)] + [str(i) for i in range(11, 17)]
 
 
-def _has_received_initial_neighbor_reports() -> bool:
+def _has_received_initial_neighbor_reports(session: Optional[CubesSession] = None) -> bool:
     """Check if we've received at least some neighbor reports from cubes."""
-    for manager in cube_set_managers:
+    session = state.resolve(session)
+    for manager in session.cube_set_managers:
         if manager.cubes_to_neighbors:  # If any manager has received neighbor reports
             return True
     return False
@@ -51,46 +49,53 @@ def _has_received_initial_neighbor_reports() -> bool:
 # Letter and Tile Management
 # =============================================================================
 
-async def accept_new_letter(publish_queue, letter, tile_id, cube_set_id: int, now_ms: int):
+async def accept_new_letter(publish_queue, letter, tile_id, cube_set_id: int, now_ms: int,
+                            session: Optional[CubesSession] = None):
     """Accept a new letter into the rack."""
-    cube_id = state.cube_set_managers[cube_set_id].tiles_to_cubes[tile_id]
-    state.cube_set_managers[cube_set_id].cubes_to_letters[cube_id] = letter
-    await _publish_letter(publish_queue, letter, cube_id, now_ms)
+    session = state.resolve(session)
+    manager = session.cube_set_managers[cube_set_id]
+    cube_id = manager.tiles_to_cubes[tile_id]
+    manager.cubes_to_letters[cube_id] = letter
+    manager.display.set(cube_id, "letter", letter)
+    await manager.display.reconcile(publish_queue, now_ms)
 
 
-async def load_rack(publish_queue, tiles_with_letters: list[tiles.Tile], cube_set_id: int, player: int, now_ms: int):
+async def load_rack(publish_queue, tiles_with_letters: list[tiles.Tile], cube_set_id: int, player: int, now_ms: int,
+                    session: Optional[CubesSession] = None):
     """Load rack and potentially submit a guess if tiles changed."""
+    session = state.resolve(session)
     # Load the rack
-    await state.cube_set_managers[cube_set_id].load_rack(
-        publish_queue, tiles_with_letters, now_ms, state._started_players
+    await session.cube_set_managers[cube_set_id].load_rack(
+        publish_queue, tiles_with_letters, now_ms, session.started_players
     )
 
     # If tiles changed, re-guess in case any guessed tiles were updated
-    if state.last_tiles_with_letters != tiles_with_letters:
-        logging.info(f"LOAD RACK guessing")
-        await guess_last_tiles(publish_queue, cube_set_id, player, now_ms)
-        state.last_tiles_with_letters = tiles_with_letters
+    if session.last_tiles_with_letters != tiles_with_letters:
+        await guess_last_tiles(publish_queue, cube_set_id, player, now_ms, session)
+        session.last_tiles_with_letters = tiles_with_letters
 
 
-async def guess_tiles(publish_queue, word_tiles_list, cube_set_id: int, player: int, now_ms: int):
+async def guess_tiles(publish_queue, word_tiles_list, cube_set_id: int, player: int, now_ms: int,
+                      session: Optional[CubesSession] = None):
     """
     Submit a guess for tiles.
 
-    IMPORTANT: state.last_guess_tiles is a LIST OF GUESSES (list of lists), where each inner
+    IMPORTANT: session.last_guess_tiles is a LIST OF GUESSES (list of lists), where each inner
     list is a guess containing tile IDs. This is because multiple cube chains can form
     multiple words simultaneously.
 
     Example: [['1', '2', '3'], ['4', '5']] means two guesses: one with tiles 1-2-3, another with tiles 4-5.
 
-    When iterating over state.last_guess_tiles, each iteration gives you one guess (a list of tile IDs).
+    When iterating over session.last_guess_tiles, each iteration gives you one guess (a list of tile IDs).
     """
-    previous_tiles = state.last_guess_tiles
-    state.last_guess_tiles = word_tiles_list
+    session = state.resolve(session)
+    previous_tiles = session.last_guess_tiles
+    session.last_guess_tiles = word_tiles_list
 
     # Detect which chains were removed by comparing previous and current tile sets
     # Convert each chain to a sorted tuple for set comparison (order-independent)
     # Only check for removals if we had previous tiles
-    if state.remove_highlight_callback and previous_tiles:
+    if session.remove_highlight_callback and previous_tiles:
         previous_chains = {tuple(sorted(chain)) for chain in previous_tiles}
         current_chains = {tuple(sorted(chain)) for chain in word_tiles_list}
         removed_chains = previous_chains - current_chains
@@ -98,221 +103,313 @@ async def guess_tiles(publish_queue, word_tiles_list, cube_set_id: int, player:
         # Remove highlights for chains that disappeared (if any)
         if removed_chains:
             for chain in removed_chains:
-                await state.remove_highlight_callback(list(chain), player)
+                await session.remove_highlight_callback(list(chain), player)
 
     # If there are any remaining chains, process them
     if word_tiles_list:
-        await guess_last_tiles(publish_queue, cube_set_id, player, now_ms)
+        await guess_last_tiles(publish_queue, cube_set_id, player, now_ms, session)
 
 
-async def guess_last_tiles(publish_queue, cube_set_id: int, player: int, now_ms: int) -> None:
+async def guess_last_tiles(publish_queue, cube_set_id: int, player: int, now_ms: int,
+                           session: Optional[CubesSession] = None) -> None:
     """Process the last guess for a player."""
-    manager = state.cube_set_managers[cube_set_id]
+    session = state.resolve(session)
+    manager = session.cube_set_managers[cube_set_id]
     # If no explicit guess but we have a cube chain, try to form words from it
-    if not state.last_guess_tiles and manager.cube_chain:
-        word_tiles_list = manager._form_words_from_chain()
+    if not session.last_guess_tiles and manager.cube_chain:
+        word_tiles_list = manager.words()
         if word_tiles_list:
-            state.last_guess_tiles = word_tiles_list
+            session.last_guess_tiles = word_tiles_list
 
-    logging.info(f"guess_last_tiles last_guess_tiles {state.last_guess_tiles}")
-    for guess in state.last_guess_tiles:
-        await state.guess_tiles_callback(guess, True, player, now_ms)
+    if trace.GUESS.enabled:
+        trace.GUESS.emit("guess_last_tiles", cube_set=cube_set_id, player=player,
+                         last_guess_tiles=session.last_guess_tiles)
+    for guess in session.last_guess_tiles:
+        await session.guess_tiles_callback(guess, True, player, now_ms)
 
-    await state.cube_set_managers[cube_set_id]._mark_tiles_for_guess(
-        publish_queue, state.last_guess_tiles, now_ms, state._started_players
+    await manager._mark_tiles_for_guess(
+        publish_queue, session.last_guess_tiles, now_ms, session.started_players
     )
 
 
-async def flash_guess(publish_queue, tiles: list[str], cube_set_id: int, now_ms: int):
+async def flash_guess(publish_queue, tiles: list[str], cube_set_id: int, now_ms: int,
+                      session: Optional[CubesSession] = None):
     """Flash tiles for a guess."""
-    await state.cube_set_managers[cube_set_id].flash_guess(publish_queue, tiles, now_ms)
+    session = state.resolve(session)
+    await session.cube_set_managers[cube_set_id].flash_guess(publish_queue, tiles, now_ms)
 
 
 # =============================================================================
 # Letter Lock Management
 # =============================================================================
 
-async def letter_lock(publish_queue, cube_set_id, tile_id: str | None, now_ms: int) -> bool:
+async def letter_lock(publish_queue, cube_set_id, tile_id: str | None, now_ms: int,
+                      session: Optional[CubesSession] = None) -> bool:
     """Lock a letter for a player."""
-    cube_id = state.cube_set_managers[cube_set_id].tiles_to_cubes.get(tile_id) if tile_id else None
+    session = state.resolve(session)
+    manager = session.cube_set_managers[cube_set_id]
+    display = manager.display
+    cube_id = manager.tiles_to_cubes.get(tile_id) if tile_id else None
 
-    if last_cube_id := state.locked_cubes.get(cube_set_id, None):
+    if last_cube_id := session.locked_cubes.get(cube_set_id, None):
         if last_cube_id == cube_id:
             return False
 
         # Unlock last cube
-        await publish_queue.put((f"cube/{last_cube_id}/lock", None, True, now_ms))
+        display.set(last_cube_id, "lock", None)
 
-    state.locked_cubes[cube_set_id] = cube_id
+    session.locked_cubes[cube_set_id] = cube_id
     if cube_id:
-        await publish_queue.put((f"cube/{cube_id}/lock", "1", True, now_ms))
+        display.set(cube_id, "lock", "1")
+    await display.reconcile(publish_queue, now_ms)
     return True
 
 
-async def unlock_all_letters(publish_queue, now_ms: int) -> None:
+async def unlock_all_letters(publish_queue, now_ms: int, session: Optional[CubesSession] = None) -> None:
     """Unlock all locked letters across all cube sets."""
-    for cube_set_id, cube_id in state.locked_cubes.items():
+    session = state.resolve(session)
+    for cube_set_id, cube_id in session.locked_cubes.items():
         if cube_id:
-            await publish_queue.put((f"cube/{cube_id}/lock", None, True, now_ms))
-    state.locked_cubes.clear()
+            display = session.cube_set_managers[cube_set_id].display
+            display.set(cube_id, "lock", None)
+            await display.reconcile(publish_queue, now_ms)
+    session.locked_cubes.clear()
+
+
+# =============================================================================
+# Publish Feedback
+# =============================================================================
+
+def publish_failed(topic: str, message, session: Optional[CubesSession] = None) -> None:
+    """Called by the publisher when a message could not be sent, so the cube's display sends it again."""
+    session = state.resolve(session)
+    parts = topic.split("/")
+    if len(parts) != 3 or parts[0] != "cube":
+        return
+    _, cube_id, field = parts
+    cube_set_id = session.cube_to_cube_set.get(cube_id)
+    if cube_set_id is not None:
+        session.cube_set_managers[cube_set_id].display.publish_failed(cube_id, field, message)
 
 
 # =============================================================================
 # Bulk Operations
 # =============================================================================
 
-async def clear_all_borders(publish_queue, now_ms: int) -> None:
+async def clear_all_borders(publish_queue, now_ms: int, session: Optional[CubesSession] = None) -> None:
     """Clear all borders on all cubes across all players using consolidated messaging."""
-    for manager in cube_set_managers:
+    session = state.resolve(session)
+    for manager in session.cube_set_managers:
+        # Sent even where the border looks clear already: this wipes borders left from a previous run
+        manager.display.forget("border")
         for cube_id in manager.cube_list:
             # Use consolidated border protocol: ":" clears all borders
-            await publish_queue.put((f"cube/{cube_id}/border", ":", True, now_ms))
+            manager.display.set(cube_id, "border", ":")
+        await manager.display.reconcile(publish_queue, now_ms)
 
 
-async def clear_all_letters(publish_queue, now_ms: int) -> None:
+async def clear_all_letters(publish_queue, now_ms: int, session: Optional[CubesSession] = None) -> None:
     """Clear letters on all cubes across all players by setting space and retaining."""
-    for manager in cube_set_managers:
+    session = state.resolve(session)
+    for manager in session.cube_set_managers:
+        manager.display.forget("letter")
         for cube_id in manager.cube_list:
-            await publish_queue.put((f"cube/{cube_id}/letter", " ", True, now_ms))
+            manager.display.set(cube_id, "letter", " ")
+        await manager.display.reconcile(publish_queue, now_ms)
 
 
-async def clear_remaining_abc_cubes(publish_queue, now_ms: int) -> None:
-    """Clear ABC cubes for any remaining players in state.abc_manager.player_abc_cubes."""
-    for player_num in list(state.abc_manager.player_abc_cubes.keys()):
+async def clear_remaining_abc_cubes(publish_queue, now_ms: int, session: Optional[CubesSession] = None) -> None:
+    """Clear ABC cubes for any remaining players in the session's abc_manager.player_abc_cubes."""
+    session = state.resolve(session)
+    player_abc_cubes = session.abc_manager.player_abc_cubes
+    for player_num in list(player_abc_cubes.keys()):
         # Clear ABC letters for this player
-        abc_assignments = state.abc_manager.player_abc_cubes[player_num]
+        abc_assignments = player_abc_cubes[player_num]
+        display = session.cube_set_managers[player_num].display
         for _, cube_id in abc_assignments.items():
-            await publish_queue.put((f"cube/{cube_id}/letter", " ", True, now_ms))
+            display.set(cube_id, "letter", " ")
+        await display.reconcile(publish_queue, now_ms)
         # Remove this player from ABC tracking
-        del state.abc_manager.player_abc_cubes[player_num]
+        del player_abc_cubes[player_num]
 
 
 # =============================================================================
 # ABC Start Management
 # =============================================================================
 
-async def activate_abc_start_if_ready(publish_queue, now_ms: int) -> None:
+async def activate_abc_start_if_ready(publish_queue, now_ms: int, session: Optional[CubesSession] = None) -> None:
     """Activate ABC start sequence if conditions are met and assign letters to new players."""
+    session = state.resolve(session)
     # Don't activate ABC if game_on mode has ended (waiting for next game via MQTT)
-    if state.game_on_mode_ended:
+    if session.game_on_mode_ended:
         return
 
-    if not state.get_game_running() and _has_received_initial_neighbor_reports():
-        await state.abc_manager.assign_abc_letters_to_available_players(publish_queue, now_ms, state.cube_set_managers)
+    if not session.game_running and _has_received_initial_neighbor_reports(session):
+        await session.abc_manager.assign_abc_letters_to_available_players(publish_queue, now_ms,
+                                                                          session.cube_set_managers)
 
 
-def is_any_player_in_countdown() -> bool:
+def is_any_player_in_countdown(session: Optional[CubesSession] = None) -> bool:
     """Check if any player is currently in countdown phase."""
-    return state.abc_manager.is_any_player_in_countdown()
+    session = state.resolve(session)
+    return session.abc_manager.is_any_player_in_countdown()
 
 
-async def check_countdown_completion(publish_queue, now_ms: int, sound_manager) -> list:
-    """Check if countdown stages need to be executed and if countdown has completed.
+async def advance_countdown(now_ms: int, session: Optional[CubesSession] = None) -> list:
+    """Run countdown transitions due by now_ms and return the countdown incidents since the last call."""
+    session = state.resolve(session)
+    abc_manager = session.abc_manager
+    await abc_manager.timers.advance(now_ms)
+    return abc_manager.take_incidents()
 
-    This is a convenience wrapper that calls ABCManager.check_countdown_completion
-    with the required dependencies.
 
-    Returns:
-        List of incidents for any countdown replacements that occurred
-    """
-    return await state.abc_manager.check_countdown_completion(
-        publish_queue, now_ms, sound_manager, state.cube_set_managers,
-        state.start_game_callback
-    )
+async def _start_cube_set(session: CubesSession, player: int, start_ms: int) -> None:
+    """Start a cube set's game once its ABC countdown completes."""
+    session.add_started_cube_set(player)
+    await session.start_game_callback(True, start_ms, player)
 
 
 # =============================================================================
 # Guess Feedback
 # =============================================================================
 
-async def good_guess(publish_queue, tiles: list[str], cube_set_id: int, player: int, now_ms: int):
+async def good_guess(publish_queue, tiles: list[str], cube_set_id: int, player: int, now_ms: int,
+                     session: Optional[CubesSession] = None):
     """Mark a guess as good (green border)."""
-    state.cube_set_managers[cube_set_id].border_color = "0x07E0"
-    await flash_guess(publish_queue, tiles, cube_set_id, now_ms)
+    session = state.resolve(session)
+    session.cube_set_managers[cube_set_id].border_color = "0x07E0"
+    await flash_guess(publish_queue, tiles, cube_set_id, now_ms, session)
 
 
-async def old_guess(publish_queue, tiles: list[str], cube_set_id: int, player: int):
+async def old_guess(publish_queue, tiles: list[str], cube_set_id: int, player: int,
+                    session: Optional[CubesSession] = None):
     """Mark a guess as old/duplicate (yellow border)."""
-    state.cube_set_managers[cube_set_id].border_color = "0xFFE0"
+    session = state.resolve(session)
+    session.cube_set_managers[cube_set_id].border_color = "0xFFE0"
 
 
-async def bad_guess(publish_queue, tiles: list[str], cube_set_id: int, player: int):
+async def bad_guess(publish_queue, tiles: list[str], cube_set_id: int, player: int,
+                    session: Optional[CubesSession] = None):
     """Mark a guess as bad/invalid (white border)."""
-    state.cube_set_managers[cube_set_id].border_color = "0xFFFF"
+    session = state.resolve(session)
+    session.cube_set_managers[cube_set_id].border_color = "0xFFFF"
 
 
 # =============================================================================
 # Initialization
 # =============================================================================
 
-async def init(subscribe_client):
+async def init(subscribe_client, session: Optional[CubesSession] = None):
     """Initialize the cubes-to-game system."""
+    session = state.resolve(session)
     # Subscribe to direct neighbor topics only
     await subscribe_client.subscribe("cube/right/#")
 
     all_cubes = _get_all_cube_ids()
 
-    # Clear and rebuild the global cube_to_cube_set mapping
-    state.cube_to_cube_set.clear()
+    # Clear and rebuild the cube_to_cube_set mapping
+    session.cube_to_cube_set.clear()
 
     # Initialize player game states
-    state.reset_player_started_state()
-    state.reset_started_cube_sets()
-    state.reset_game_on_mode_ended()
+    session.reset_player_started_state()
+    session.reset_started_cube_sets()
+    session.game_on_mode_ended = False
 
     # Reset ABC manager state
-    state.abc_manager.reset()
+    session.abc_manager.reset()
+    session.neighbor_filter.reset()
 
     # Initialize managers for each cube set
-    for cube_set_id, manager in enumerate(cube_set_managers):
+    for cube_set_id, manager in enumerate(session.cube_set_managers):
         await manager.init(all_cubes)
-        # Add to global cube_to_cube_set mapping
+        # Add to the cube_to_cube_set mapping
         for cube in manager.cube_list:
-            state.cube_to_cube_set[cube] = cube_set_id
-    logging.info(f"INIT: cube_list p0={state.cube_set_managers[0].cube_list} p1={state.cube_set_managers[1].cube_list}")
-    logging.info(f"INIT: cube_to_cube_set={state.cube_to_cube_set}")
+            session.cube_to_cube_set[cube] = cube_set_id
+    logging.info(f"INIT: cube_list p0={session.cube_set_managers[0].cube_list} p1={session.cube_set_managers[1].cube_list}")
+    logging.info(f"INIT: cube_to_cube_set={session.cube_to_cube_set}")
 
 
 # =============================================================================
 # MQTT Message Handler
 # =============================================================================
 
-async def handle_mqtt_message(publish_queue, message, now_ms: int, sound_manager):
+async def handle_mqtt_message(publish_queue, message, now_ms: int, sound_manager,
+                              session: Optional[CubesSession] = None):
     """Handle incoming MQTT messages from cubes."""
+    session = state.resolve(session)
     topic_str = getattr(message.topic, 'value', str(message.topic))
     payload_data = message.payload.decode() if message.payload is not None else ""
-    logging.info(f"MQTT recv: topic={topic_str} payload={payload_data}")
+    if trace.MQTT.enabled:
+        trace.MQTT.emit("recv", topic=topic_str, payload=payload_data)
 
     # Direct neighbor cube id from /cube/right/SENDER
     if topic_str.startswith("cube/right/"):
         sender_cube = topic_str.removeprefix("cube/right/")
         neighbor_cube = payload_data
-        cube_set_id = state.cube_to_cube_set.get(sender_cube)
+        cube_set_id = session.cube_to_cube_set.get(sender_cube)
         if cube_set_id is not None:
-            logging.info(f"RIGHT msg: sender={sender_cube} neighbor={neighbor_cube} cube_set={cube_set_id}")
-            # Only process game-related neighbor messages if game is running
-            # After game over, cubes should not be responsive to word formation
-            is_running = state.get_game_running()
-            logging.info(f"CHECK GAME STATE: running={is_running}, started_players={state._started_players}")
-            if is_running:
-                word_tiles_list = state.cube_set_managers[cube_set_id].process_neighbor_cube(sender_cube, neighbor_cube)
-                logging.info(f"WORD_TILES (right): {word_tiles_list}")
-                # In single player mode, player_id is always 0; in multi-player, cube_set_id maps to player_id
-                player_id = 0 if len(state._started_players) <= 1 else cube_set_id
-                await guess_tiles(publish_queue, word_tiles_list, cube_set_id, player_id, now_ms)
-            else:
-                # Game not running - still track neighbors for ABC start detection
-                state.cube_set_managers[cube_set_id].process_neighbor_cube(sender_cube, neighbor_cube)
-                logging.info(f"Game not running - tracking neighbors only")
-
-            # Check ABC completion after processing right-edge updates
-            if state.abc_manager.abc_start_active:
-                completed_player = await state.abc_manager.check_abc_sequence_complete(state.cube_set_managers)
-                if completed_player is not None:
-                    await state.abc_manager.handle_abc_completion(
-                        publish_queue, completed_player, now_ms, sound_manager,
-                        state.cube_set_managers, state.ABC_COUNTDOWN_DELAY_MS
-                    )
-
-            # Countdown completion is polled from the main loop, not per-message
+            if session.neighbor_filter.offer(sender_cube, neighbor_cube, now_ms):
+                await _apply_neighbor_report(publish_queue, sender_cube, neighbor_cube, cube_set_id, now_ms,
+                                             sound_manager, session)
+            elif trace.MQTT.enabled:
+                trace.MQTT.emit("right_filtered", sender=sender_cube, neighbor=neighbor_cube)
         return
+
+
+async def apply_settled_neighbor_reports(publish_queue, now_ms: int, sound_manager,
+                                         session: Optional[CubesSession] = None) -> None:
+    """Apply neighbor reports the filter has held for its settle window. Called every frame."""
+    session = state.resolve(session)
+    settle_ms = session.neighbor_filter.next_settle_ms()
+    if settle_ms is None or now_ms < settle_ms:
+        return
+    for sender_cube, neighbor_cube in session.neighbor_filter.take_settled(now_ms):
+        cube_set_id = session.cube_to_cube_set.get(sender_cube)
+        if cube_set_id is not None:
+            await _apply_neighbor_report(publish_queue, sender_cube, neighbor_cube, cube_set_id, now_ms,
+                                         sound_manager, session)
+
+
+def set_neighbor_settle_ms(settle_ms: int, session: Optional[CubesSession] = None) -> None:
+    """Hold changed neighbor reports for settle_ms before applying them (0 applies them at once)."""
+    session = state.resolve(session)
+    session.neighbor_filter.settle_ms = settle_ms
+
+
+async def _apply_neighbor_report(publish_queue, sender_cube: str, neighbor_cube: str, cube_set_id: int,
+                                 now_ms: int, sound_manager, session: CubesSession) -> None:
+    manager = session.cube_set_managers[cube_set_id]
+    # Only process game-related neighbor messages if game is running
+    # After game over, cubes should not be responsive to word formation
+    if session.game_running:
+        word_tiles_list = manager.process_neighbor_cube(sender_cube, neighbor_cube)
+        # In single player mode, player_id is always 0; in multi-player, cube_set_id maps to player_id
+        player_id = 0 if len(session.started_players) <= 1 else cube_set_id
+        if trace.MQTT.enabled:
+            trace.MQTT.emit("right", sender=sender_cube, neighbor=neighbor_cube, cube_set=cube_set_id,
+                            running=True, started_players=sorted(session.started_players),
+                            word_tiles=word_tiles_list)
+        await guess_tiles(publish_queue, word_tiles_list, cube_set_id, player_id, now_ms, session)
+    else:
+        # Game not running - still track neighbors for ABC start detection
+        manager.process_neighbor_cube(sender_cube, neighbor_cube)
+        if trace.MQTT.enabled:
+            trace.MQTT.emit("right", sender=sender_cube, neighbor=neighbor_cube, cube_set=cube_set_id,
+                            running=False)
+
+    if neighbor_cube in manager.cube_list and manager.cube_chain.get(sender_cube) != neighbor_cube:
+        # Rejected as a loop or a link to itself
+        session.neighbor_filter.reject(sender_cube)
+
+    # Check ABC completion after processing right-edge updates
+    abc_manager = session.abc_manager
+    if abc_manager.abc_start_active:
+        completed_player = await abc_manager.check_abc_sequence_complete(session.cube_set_managers)
+        if completed_player is not None:
+            await abc_manager.handle_abc_completion(
+                publish_queue, completed_player, now_ms, sound_manager,
+                session.cube_set_managers, session.abc_countdown_delay_ms,
+                functools.partial(_start_cube_set, session)
+            )
+
+    # Countdown stages and completion run from the ABC manager's timers
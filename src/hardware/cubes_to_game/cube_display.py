@@ -0,0 +1,73 @@
+"""What each cube should show, published as changes only.
+
+The game layer writes the desired state of a cube with set(): its letter,
+its border (sides and colour, sent together as "NSW:0xFFFF") and its lock.
+reconcile() then queues a retained message for each field that differs
+from what was last published, in the order the fields were set, and skips
+the rest. A guess that moves one border publishes one message instead of
+one per cube.
+
+A field counts as published once its message is queued. The queue is
+in-process and the publisher sends it in order, so the one way a queued
+value fails to reach the cube is a failed publish. The publisher reports
+that back through publish_failed() (see coordination.publish_failed), which
+drops the field's published value and sends the desired value again at the
+next reconcile.
+
+Nothing is known about the cubes after a (re)connect, so forget() drops the
+published values and each field set after that is sent, changed or not.
+Flashes are momentary rather than state: flash() always publishes.
+"""
+
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+_UNKNOWN = object()
+
+
+class CubeDisplay:
+    def __init__(self) -> None:
+        self._desired: Dict[Tuple[str, str], Optional[str]] = {}  # (cube, field) → value
+        self._published: Dict[Tuple[str, str], Optional[str]] = {}
+        self._dirty: Dict[Tuple[str, str], None] = {}  # set since the last reconcile, in order
+        self.skipped: Counter[str] = Counter()  # per field, values the cube already had
+
+    def set(self, cube_id: str, field: str, value: Optional[str]) -> None:
+        """Desire value for cube/<cube_id>/<field>. None clears a retained field (used to unlock)."""
+        self._desired[(cube_id, field)] = value
+        self._dirty[(cube_id, field)] = None
+
+    def get(self, cube_id: str, field: str) -> Optional[str]:
+        return self._desired.get((cube_id, field))
+
+    async def reconcile(self, publish_queue, now_ms: int) -> int:
+        """Queue the fields set since the last call that differ from what was published. Returns how many."""
+        dirty, self._dirty = self._dirty, {}
+        published = 0
+        for key in dirty:
+            value = self._desired[key]
+            if self._published.get(key, _UNKNOWN) == value:
+                self.skipped[key[1]] += 1
+                continue
+            self._published[key] = value
+            cube_id, field = key
+            await publish_queue.put((f"cube/{cube_id}/{field}", value, True, now_ms))
+            published += 1
+        return published
+
+    def publish_failed(self, cube_id: str, field: str, value: Optional[str]) -> None:
+        """value did not reach cube/<cube_id>/<field>; send the desired value at the next reconcile."""
+        key = (cube_id, field)
+        if self._published.get(key, _UNKNOWN) == value:
+            del self._published[key]
+            self._dirty[key] = None
+
+    async def flash(self, publish_queue, cube_id: str, now_ms: int) -> None:
+        await publish_queue.put((f"cube/{cube_id}/flash", "1", False, now_ms))
+
+    def forget(self, field: Optional[str] = None) -> None:
+        """Drop what was published (for one field, or all of them), so the next reconcile sends it."""
+        if field is None:
+            self._published.clear()
+        else:
+            self._published = {key: value for key, value in self._published.items() if key[1] != field}
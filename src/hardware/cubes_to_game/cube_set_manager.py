@@ -21,61 +21,75 @@ MAPPINGS:
 - tiles_to_cubes: tile_id ('0'-'5') → cube_id ('1', '2', etc.)
 - cubes_to_letters: cube_id → current letter displayed on cube
 - cube_chain: cube_id → neighbor cube_id (for word formation)
+- display: what each cube should show, published as changes (see cube_display)
+
+The chains are kept as linked lists: cube_chain holds the next links, a
+reverse map holds the previous links, and each chain's word is cached under
+its head cube. A neighbor report relinks one cube and re-reads only the
+chains through it.
 """
 
 import logging
 import time
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set
 
 from core import tiles
+from game_logging import trace
+
+from .cube_display import CubeDisplay
 
 
 class CubeSetManager:
-    """Manages state for a single player's cube set (typically 6 cubes)."""
+    """Manages state for a single player's cube set (typically 6 cubes).
+
+    cube_chain is maintained by process_neighbor_cube. Code that edits it
+    directly must call _form_words_from_chain() to rebuild the chain cache.
+    """
 
     def __init__(self, cube_set_id: int):
         self.cube_set_id = cube_set_id
         self.cube_chain: Dict[str, str] = {}
         self.cubes_to_letters: Dict[str, str] = {}
-        self.tiles_to_cubes: Dict[str, str] = {}
+        self.tiles_to_cubes: Mapping[str, str] = {}
         self.cubes_to_neighbors: Dict[str, str] = {}
         self.border_color: str = "0xFFFF"
         self.cube_list: List[str] = []  # Store ordered list of cubes
+        self.display = CubeDisplay()
+        self._predecessors: Dict[str, Set[str]] = {}  # cube → cubes whose chain link points at it
+        self._chain_words: Dict[str, Optional[List[str]]] = {}  # head cube → its chain's tile IDs, None if invalid
+
+    @property
+    def tiles_to_cubes(self) -> Mapping[str, str]:
+        return self._tiles_to_cubes
+
+    @tiles_to_cubes.setter
+    def tiles_to_cubes(self, tiles_to_cubes: Mapping[str, str]) -> None:
+        """Replace the tile → cube map. It is kept read-only, so changes go through here and the chain cache follows."""
+        self._tiles_to_cubes = MappingProxyType(dict(tiles_to_cubes))
+        self._cubes_to_tiles = {cube_id: tile_id for tile_id, cube_id in tiles_to_cubes.items()}
+        if getattr(self, "cube_chain", None):
+            self._rebuild_chains()
 
     def cube_to_tile_id(self, cube_id: str) -> str | None:
         """Get tile ID for a cube (inverse lookup of tiles_to_cubes)."""
-        for tile_id, cid in self.tiles_to_cubes.items():
-            if cid == cube_id:
-                return tile_id
-        return None
+        return self._cubes_to_tiles.get(cube_id)
 
     def _find_unmatched_cubes(self):
         sources = set(self.cube_chain.keys())
         targets = set(self.cube_chain.values())
         return list(sources - targets)
 
-    def _print_cube_chain(self):
-        if not self.cubes_to_letters:
-            return
-        try:
-            s = f"Cube set {self.cube_set_id}: "
-            for source, target in self.cube_chain.items():
-                s += f"{source} [{self.cubes_to_letters.get(source, '')}] -> {target} [{self.cubes_to_letters.get(target, '')}]; "
-            return s
-        except Exception as e:
-            logging.error(f"print_cube_chain ERROR: {e}")
-
-    def _dump_cubes_to_neighbors(self):
-        # Prefer explicit cube list for stable ordering
-        cubes_iter = list(self.cube_list)
-        for cube in cubes_iter:
-            log_str = f"Cube set {self.cube_set_id}: {cube} [{self.cubes_to_letters.get(cube, '')}]"
-            if cube in self.cubes_to_neighbors:
-                neighbor_cube = self.cubes_to_neighbors[cube]
-                log_str += f"-> {neighbor_cube}"
-                log_str += f"[{self.cubes_to_letters.get(neighbor_cube, '')}]"
-            logging.info(log_str)
-        logging.info("")
+    def _trace_cubes(self, event: str, **fields) -> None:
+        """Emit the cube chain and neighbor table with their letters (only called when trace.CUBES is on)."""
+        letters = self.cubes_to_letters
+        trace.CUBES.emit(
+            event, cube_set=self.cube_set_id,
+            chain={source: [letters.get(source, ''), target, letters.get(target, '')]
+                   for source, target in self.cube_chain.items()},
+            neighbors={cube: [letters.get(cube, ''), self.cubes_to_neighbors.get(cube)]
+                       for cube in self.cube_list},
+            **fields)
 
     def _traverse_chain_from_cube(self, start_cube: str) -> list[str] | None:
         """
@@ -96,53 +110,51 @@ class CubeSetManager:
             word_tiles.append(tile_id)
 
             if len(word_tiles) > tiles.MAX_LETTERS:
-                logging.info("infinite loop detected")
+                if trace.CUBES.enabled:
+                    trace.CUBES.emit("chain_loop", cube_set=self.cube_set_id, start=start_cube)
                 return None
 
             current_cube = self.cube_chain.get(current_cube)
 
         return word_tiles
 
-    def _build_words_from_sources(self, source_cubes: List[str]) -> List[List[str]]:
-        """
-        Build words by traversing chains from each source cube.
-
-        Returns empty list if any chain is invalid.
-        """
-        all_words = []
-        for source_cube in sorted(source_cubes):
-            word = self._traverse_chain_from_cube(source_cube)
-            if word is None:
-                return []  # Invalid chain detected
-            all_words.append(word)
-        return all_words
-
     def _has_duplicate_tiles(self, words: List[List[str]]) -> bool:
         """Check if any tile ID appears in multiple words."""
         all_tile_ids = [tile_id for word in words for tile_id in word]
         return len(all_tile_ids) != len(set(all_tile_ids))
 
-    def _form_words_from_chain(self) -> List[List[str]]:
-        """Forms words from the current cube chain. Returns empty list if invalid."""
-        if not self.cube_chain:
-            return []
-
-        source_cubes = self._find_unmatched_cubes()
-        all_words = self._build_words_from_sources(source_cubes)
+    def _rebuild_chains(self) -> None:
+        """Recompute the previous links and every chain's word from cube_chain."""
+        self._predecessors = {}
+        for source, target in self.cube_chain.items():
+            self._predecessors.setdefault(target, set()).add(source)
+        self._chain_words = {head: self._traverse_chain_from_cube(head) for head in self._find_unmatched_cubes()}
 
-        if not all_words:
-            return []
+    def words(self) -> List[List[str]]:
+        """The words on the cubes, ordered by head cube. Empty if any chain is invalid or tiles repeat."""
+        all_words = []
+        for head in sorted(self._chain_words):
+            word = self._chain_words[head]
+            if word is None:
+                return []  # Invalid chain detected
+            all_words.append(word)
 
         if self._has_duplicate_tiles(all_words):
-            logging.info(f"DUPES: {all_words}")
+            if trace.CUBES.enabled:
+                trace.CUBES.emit("duplicate_tiles", cube_set=self.cube_set_id, words=all_words)
             return []
 
         return all_words
 
-    def _has_loop_from_cube(self, start_cube: str) -> bool:
-        """Checks if adding a link from start_cube would create a loop."""
+    def _form_words_from_chain(self) -> List[List[str]]:
+        """Forms words from the current cube chain, rebuilding the chain cache. Returns empty list if invalid."""
+        self._rebuild_chains()
+        return self.words()
+
+    def _has_loop_from_cube(self, start_cube: str, target_cube: Optional[str] = None) -> bool:
+        """Checks if start_cube's link (or a link to target_cube, if given) leads back to start_cube."""
         path = {start_cube}
-        curr = self.cube_chain.get(start_cube)
+        curr = self.cube_chain.get(start_cube) if target_cube is None else target_cube
         while curr:
             if curr in path:
                 return True
@@ -150,34 +162,70 @@ class CubeSetManager:
             curr = self.cube_chain.get(curr)
         return False
 
-    def _update_chain(self, sender_cube: str, target_cube: str) -> bool:
-        """Updates the chain with a new connection. Returns True if chain is valid."""
-        if sender_cube == target_cube:
-            return False
+    def _heads(self, cube: str, others: tuple) -> Set[str]:
+        """Heads of the chains running through cube, plus any of others that head a chain."""
+        heads = {other for other in others
+                 if other in self.cube_chain and not self._predecessors.get(other)}
+        stack, seen = [cube], {cube}
+        while stack:
+            current = stack.pop()
+            predecessors = self._predecessors.get(current)
+            if predecessors:
+                for predecessor in predecessors - seen:
+                    seen.add(predecessor)
+                    stack.append(predecessor)
+            elif current in self.cube_chain:
+                heads.add(current)
+        return heads
+
+    def _relink(self, sender_cube: str, target_cube: Optional[str]) -> None:
+        """Point sender_cube's link at target_cube (None to unlink) and re-read the chains it touches.
+
+        Only the chains through sender_cube change, plus the chain starting at
+        the old target (which may become a head) and the one that started at
+        the new target (which stops being one).
+        """
+        old_target = self.cube_chain.get(sender_cube)
+        if old_target == target_cube:
+            return
+        ends = (old_target, target_cube)
+        before = self._heads(sender_cube, ends)
 
-        self.cube_chain[sender_cube] = target_cube
-        if self._has_loop_from_cube(sender_cube):
+        if old_target is not None:
             del self.cube_chain[sender_cube]
-            return False
-        return True
+            predecessors = self._predecessors[old_target]
+            predecessors.discard(sender_cube)
+            if not predecessors:
+                del self._predecessors[old_target]
+        if target_cube is not None:
+            self.cube_chain[sender_cube] = target_cube
+            self._predecessors.setdefault(target_cube, set()).add(sender_cube)
+
+        after = {head: self._traverse_chain_from_cube(head) for head in self._heads(sender_cube, ends)}
+        for head in before - after.keys():
+            del self._chain_words[head]
+        self._chain_words.update(after)
 
     def process_neighbor_cube(self, sender_cube: str, neighbor_cube: str) -> List[List[str]]:
         # Update neighbor tracking with direct cube id
         self.cubes_to_neighbors[sender_cube] = neighbor_cube
-        self._dump_cubes_to_neighbors()
-        logging.info(f"process_neighbor_cube {sender_cube} -> {neighbor_cube}")
 
         # Handle empty or invalid neighbor case
         if not neighbor_cube or neighbor_cube not in self.cube_list:
-            if sender_cube in self.cube_chain:
-                del self.cube_chain[sender_cube]
-            return self._form_words_from_chain()
-
-        # Update chain if valid
-        if not self._update_chain(sender_cube, neighbor_cube):
+            self._relink(sender_cube, None)
+        # Reject links to itself (keeping the old link) and loops (dropping the old link)
+        elif sender_cube == neighbor_cube or self._has_loop_from_cube(sender_cube, neighbor_cube):
+            if sender_cube != neighbor_cube:
+                self._relink(sender_cube, None)
+            if trace.CUBES.enabled:
+                self._trace_cubes("neighbor", sender=sender_cube, neighbor=neighbor_cube, rejected=True)
             return []
-        logging.info(f"process_neighbor final cube_chain: {self._print_cube_chain()}")
-        return self._form_words_from_chain()
+        else:
+            self._relink(sender_cube, neighbor_cube)
+
+        if trace.CUBES.enabled:
+            self._trace_cubes("neighbor", sender=sender_cube, neighbor=neighbor_cube)
+        return self.words()
 
     def _initialize_arrays(self):
         cubes = self.cube_list
@@ -191,6 +239,8 @@ class CubeSetManager:
         cubes = all_cubes[start_idx:end_idx]
         self.cube_list = cubes
         self._initialize_arrays()
+        # Whatever the cubes show now is unknown; publish every field again
+        self.display.forget()
 
     async def load_rack(self, publish_queue, tiles_with_letters: list[tiles.Tile], now_ms: int, game_started_players: set) -> None:
         """Load letters onto the rack for this player.
@@ -212,11 +262,11 @@ class CubeSetManager:
             cube_id = self.tiles_to_cubes[tile_id]
             letter = tile.letter
             self.cubes_to_letters[cube_id] = letter
-            # Publish letter - will be handled by coordination layer
-            await publish_queue.put((f"cube/{cube_id}/letter", letter, True, now_ms))
+            self.display.set(cube_id, "letter", letter)
             if letter == " ":
                 # Clear all borders for empty cubes using consolidated messaging
-                await publish_queue.put((f"cube/{cube_id}/border", ":", True, now_ms))
+                self.display.set(cube_id, "border", ":")
+        await self.display.reconcile(publish_queue, now_ms)
         logging.info(f"LOAD RACK tiles_with_letters done: {self.cubes_to_letters}")
 
     async def _mark_tiles_for_guess(self, publish_queue, guess_tiles: List[str], now_ms: int, game_started_players: set) -> None:
@@ -247,13 +297,16 @@ class CubeSetManager:
 
                 # Create consolidated message: "NS:color", "NSW:color", "NSE:color", or "NSEW:color"
                 consolidated_message = f"{''.join(sorted(directions))}:{self.border_color}"
-                await publish_queue.put((f"cube/{self.tiles_to_cubes[tile]}/border", consolidated_message, True, now_ms))
+                self.display.set(self.tiles_to_cubes[tile], "border", consolidated_message)
 
         for tile in unused_tiles:
             # Clear all borders for unused tiles using consolidated messaging
-            await publish_queue.put((f"cube/{self.tiles_to_cubes[tile]}/border", ":", True, now_ms))
+            self.display.set(self.tiles_to_cubes[tile], "border", ":")
+
+        # Only the borders that changed since the last guess are published
+        await self.display.reconcile(publish_queue, now_ms)
 
     async def flash_guess(self, publish_queue, tiles: list[str], now_ms: int) -> None:
         """Flash the tiles for a guess."""
         for t in tiles:
-            await publish_queue.put((f"cube/{self.tiles_to_cubes[t]}/flash", "1", False, now_ms))
+            await self.display.flash(publish_queue, self.tiles_to_cubes[t], now_ms)
@@ -0,0 +1,82 @@
+"""Duplicate and bounce filtering for cube/right neighbor reports.
+
+Cubes resend cube/N/right even when their neighbor has not changed, and
+while a cube slides past another the contacts can report a burst of
+alternating values. Every report that gets through is processed: the chain
+is relinked, the words are guessed again and the borders are republished.
+
+NeighborFilter sits in front of that. A report equal to the last one it
+let through for the same cube is dropped. With a settle window, a changed
+value is held until it has gone settle_ms without being replaced. If the
+cube goes back to the applied value first, the held value is dropped as a
+bounce. The window is measured in game time (now_ms), so replays filter
+the same way the live game did.
+
+A report the cube set rejects (a link that would close a loop, or one to
+the sender itself) is passed to reject(), so it does not count as applied:
+a repeat of it is let through again, since it may link once the other
+cubes have moved.
+
+forget_applied() is called when a game starts or stops, so the next report
+from each cube is applied again and the words on the cubes get guessed
+under the new running state, as they did before this filter.
+"""
+
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+
+class NeighborFilter:
+    def __init__(self, settle_ms: int = 0) -> None:
+        self.settle_ms = settle_ms
+        self._applied: Dict[str, str] = {}  # sender cube → neighbor last let through
+        self._pending: Dict[str, Tuple[str, int]] = {}  # sender cube → (neighbor, first reported ms)
+        self.suppressed: Counter[str] = Counter()  # "duplicate", "bounce", "superseded"
+
+    def offer(self, sender_cube: str, neighbor_cube: str, now_ms: int) -> bool:
+        """Whether to apply this report now."""
+        pending = self._pending.get(sender_cube)
+        if neighbor_cube == self._applied.get(sender_cube):
+            if pending is not None:
+                del self._pending[sender_cube]
+                self.suppressed["bounce"] += 1
+            else:
+                self.suppressed["duplicate"] += 1
+            return False
+        if self.settle_ms <= 0:
+            self._applied[sender_cube] = neighbor_cube
+            return True
+        if pending is not None:
+            if pending[0] == neighbor_cube:
+                self.suppressed["duplicate"] += 1
+                return False
+            self.suppressed["superseded"] += 1
+        self._pending[sender_cube] = (neighbor_cube, now_ms)
+        return False
+
+    def next_settle_ms(self) -> Optional[int]:
+        """When the earliest held report settles, or None when nothing is held."""
+        if not self._pending:
+            return None
+        return min(reported_ms for _, reported_ms in self._pending.values()) + self.settle_ms
+
+    def take_settled(self, now_ms: int) -> List[Tuple[str, str]]:
+        """(sender, neighbor) for every held report that has settled, in the order they were first held."""
+        settled = [(sender, neighbor) for sender, (neighbor, reported_ms) in self._pending.items()
+                   if now_ms - reported_ms >= self.settle_ms]
+        for sender, neighbor in settled:
+            del self._pending[sender]
+            self._applied[sender] = neighbor
+        return settled
+
+    def reject(self, sender_cube: str) -> None:
+        """The last report let through for sender_cube was not linked, so let its next report through."""
+        self._applied.pop(sender_cube, None)
+
+    def forget_applied(self) -> None:
+        self._applied.clear()
+
+    def reset(self) -> None:
+        self._applied.clear()
+        self._pending.clear()
+        self.suppressed.clear()
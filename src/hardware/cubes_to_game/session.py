@@ -0,0 +1,103 @@
+"""Per-installation state for the cubes-to-game system.
+
+A CubesSession holds everything one installation (one set of cubes and the
+game playing on them) keeps between calls: the cube set managers, the ABC
+manager, the neighbor filter, which players and cube sets have started,
+locks, the last guess and the callbacks into the game. Nothing in it is
+shared, so one process can run several sessions side by side (separate
+installations, or headless test games in parallel) without cross-talk.
+
+The coordination functions and CubesHardwareInterface take a session; when
+none is given they use the process's default one (state.session), which is
+what main.py runs on.
+"""
+
+import logging
+from typing import Callable, Coroutine, Dict, List, Optional
+
+from config import game_config
+
+from .abc_manager import ABCManager
+from .cube_set_manager import CubeSetManager
+from .neighbor_filter import NeighborFilter
+
+
+class CubesSession:
+    """State for one installation of cubes and the game running on it."""
+
+    def __init__(self, max_players: int = game_config.MAX_PLAYERS,
+                 neighbor_settle_ms: int = game_config.NEIGHBOR_SETTLE_MS,
+                 abc_countdown_delay_ms: int = game_config.ABC_COUNTDOWN_DELAY_MS) -> None:
+        # Managers
+        self.cube_set_managers: List[CubeSetManager] = [CubeSetManager(cube_set_id)
+                                                        for cube_set_id in range(max_players)]
+        self.abc_manager = ABCManager()
+        self.neighbor_filter = NeighborFilter(neighbor_settle_ms)
+
+        # ABC countdown delay - config value by default, overridden for replay
+        self.abc_countdown_delay_ms = abc_countdown_delay_ms
+
+        # Game lifecycle
+        self.game_running = False
+        self.game_on_mode_ended = False  # A game_on mode game ended; don't re-activate ABC
+        self.started_cube_sets: set[int] = set()  # Cube sets that completed the ABC sequence
+        self.started_players: set[int] = set()  # Players who have started their games
+
+        # Hardware mappings
+        self.cube_to_cube_set: Dict[str, int] = {}  # cube ID → cube_set_id
+        self.locked_cubes: Dict[int, Optional[str]] = {}  # cube_set_id → locked cube ID
+
+        # Guess tracking
+        self.last_guess_tiles: list = []  # List of guesses, each a list of tile IDs
+        self.last_tiles_with_letters: list = []  # Tiles last loaded to the rack
+
+        # Callbacks (injected by game logic)
+        self.guess_tiles_callback: Optional[Callable[..., Coroutine[None, None, None]]] = None
+        self.remove_highlight_callback: Optional[Callable[[list[str], int], Coroutine[None, None, None]]] = None
+        self.start_game_callback: Optional[Callable] = None
+
+    def set_game_running(self, running: bool) -> None:
+        """Set the current game running state.
+
+        Note:
+            Clears the game_on_mode_ended flag when a new game starts.
+        """
+        self.game_running = running
+        # Let the next report from each cube through so its words are handled under the new state
+        self.neighbor_filter.forget_applied()
+        if running:
+            self.game_on_mode_ended = False
+        logging.info(f"Game running state set to: {running}")
+
+    def set_game_end_time(self, now_ms: int, min_win_score: int) -> None:
+        """Set game running state to false when game ends.
+
+        In game_on mode (min_win_score > 0) ABC is disabled until the next game
+        arrives over MQTT; in normal mode it stays available for the next game.
+        """
+        self.game_running = False
+        self.neighbor_filter.forget_applied()
+        if min_win_score > 0:
+            self.game_on_mode_ended = True
+            self.abc_manager.reset()
+            logging.info(f"Game ended in game_on mode at {now_ms} - ABC disabled")
+        else:
+            logging.info(f"Game ended at {now_ms} - ABC enabled for next game")
+
+    def has_player_started_game(self, player: int) -> bool:
+        return player in self.started_players
+
+    def add_player_started(self, player: int) -> None:
+        self.started_players.add(player)
+
+    def reset_player_started_state(self) -> None:
+        self.started_players = set()
+
+    def add_started_cube_set(self, cube_set_id: int) -> None:
+        self.started_cube_sets.add(cube_set_id)
+
+    def reset_started_cube_sets(self) -> None:
+        self.started_cube_sets = set()
+
+    def get_started_cube_sets(self) -> list:
+        return list(self.started_cube_sets)
@@ -1,80 +1,71 @@
-"""Global state management for the cubes-to-game system.
+"""The process's default cubes-to-game session.
 
-This module contains all mutable global state and provides setter/getter
-functions for clean encapsulation. It has no dependencies on other cubes_to_game
-modules to avoid circular imports.
+All mutable cubes-to-game state lives in a CubesSession (see session.py).
+This module holds the default one, `session`, used by main.py and by any
+caller that does not pass a session of its own, and keeps the functions the
+rest of the game already calls on it.
 
-WHEN TO USE GLOBAL STATE (this module):
+The old module-level names (cube_set_managers, abc_manager, locked_cubes,
+last_guess_tiles, _started_players, ABC_COUNTDOWN_DELAY_MS, ...) still read
+through to the default session. They are read-only: assigning one only
+shadows it on the module, so set the attribute on `session` instead
+(e.g. state.session.last_guess_tiles = []).
+
+WHEN TO USE SESSION STATE:
 - State that spans multiple cube sets (e.g., game_running affects both players)
 - State needed by coordination layer across async boundaries
 - State that tests need to inject/replace (e.g., manager instances)
-- Configuration that can be overridden at runtime (e.g., ABC_COUNTDOWN_DELAY_MS)
+- Configuration that can be overridden at runtime (e.g., the ABC countdown delay)
 
-WHEN NOT TO USE GLOBAL STATE:
+WHEN NOT TO USE SESSION STATE:
 - Per-player cube state → use CubeSetManager
 - Per-player ABC countdown state → use ABCManager
 - Transient function-local state → use local variables
 - Configuration that never changes → use config.game_config
-
-STATE CATEGORIES:
-
-1. Game Lifecycle State:
-   - _game_running: Whether any game is currently active
-   - _started_players: Set of players (0, 1) who have started their games
-   - _started_cube_sets: Set of cube sets (0, 1) that completed ABC countdown
-
-2. Manager Instances (for test injection):
-   - cube_set_managers: List of CubeSetManager instances (one per player)
-   - abc_manager: ABCManager instance for countdown sequences
-
-3. Callback Functions (injected by game logic layer):
-   - guess_tiles_callback: Called when player makes a guess
-   - start_game_callback: Called when player completes ABC countdown
-
-4. Hardware Mappings:
-   - cube_to_cube_set: Maps cube ID (e.g., "1") to cube_set_id (0 or 1)
-   - locked_cubes: Tracks which cube is currently locked per player
-
-5. Guess Tracking State:
-   - last_guess_tiles: List of tile IDs in the most recent guess
-   - last_tiles_with_letters: List of tiles last loaded to rack
-
-ARCHITECTURE NOTES:
-- This module has NO imports from other cubes_to_game modules (prevents circular deps)
-- Manager instances are created in coordination.py but stored here for shared access
-- Tests can replace manager instances and have all code see the replacement
-- All state mutations go through setter functions for debuggability
 """
 
-import logging
-from typing import Callable, Coroutine, Dict
+from .session import CubesSession
 
-from config import game_config
+session = CubesSession()
 
-# ABC countdown delay - use config value by default, but allow override for replay
-ABC_COUNTDOWN_DELAY_MS = game_config.ABC_COUNTDOWN_DELAY_MS
+# Old module-level name → CubesSession attribute
+_SESSION_ATTRIBUTES = {
+    'ABC_COUNTDOWN_DELAY_MS': 'abc_countdown_delay_ms',
+    '_game_running': 'game_running',
+    'game_on_mode_ended': 'game_on_mode_ended',
+    '_started_cube_sets': 'started_cube_sets',
+    '_started_players': 'started_players',
+    'cube_to_cube_set': 'cube_to_cube_set',
+    'locked_cubes': 'locked_cubes',
+    'cube_set_managers': 'cube_set_managers',
+    'abc_manager': 'abc_manager',
+    'neighbor_filter': 'neighbor_filter',
+    'last_guess_tiles': 'last_guess_tiles',
+    'last_tiles_with_letters': 'last_tiles_with_letters',
+    'guess_tiles_callback': 'guess_tiles_callback',
+    'remove_highlight_callback': 'remove_highlight_callback',
+    'start_game_callback': 'start_game_callback',
+}
 
 
-def set_abc_countdown_delay(delay_ms: int):
-    """Set the ABC countdown delay for replay compatibility."""
-    global ABC_COUNTDOWN_DELAY_MS
-    ABC_COUNTDOWN_DELAY_MS = delay_ms
+def __getattr__(name):
+    """Read old module-level state names from the default session."""
+    if name in _SESSION_ATTRIBUTES:
+        return getattr(session, _SESSION_ATTRIBUTES[name])
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
-# Game state tracking
-_game_running = False
+def resolve(s: CubesSession | None) -> CubesSession:
+    """The given session, or the default one."""
+    return session if s is None else s
 
-# Flag to track if game_on mode game has ended (should not re-activate ABC)
-game_on_mode_ended = False
 
-# ABC countdown tracking - which cube sets (0, 1) completed the ABC sequence
-_started_cube_sets = set()
-
-# Game play tracking - which players (0, 1) have started their games
-_started_players = set()
+def set_abc_countdown_delay(delay_ms: int, session: CubesSession | None = None):
+    """Set the ABC countdown delay for replay compatibility."""
+    resolve(session).abc_countdown_delay_ms = delay_ms
 
 
-def set_game_running(running: bool) -> None:
+def set_game_running(running: bool, session: CubesSession | None = None) -> None:
     """Set the current game running state.
 
     Args:
@@ -83,20 +74,15 @@ def set_game_running(running: bool) -> None:
     Note:
         Clears the game_on_mode_ended flag when a new game starts.
     """
-    global _game_running, game_on_mode_ended
-    _game_running = running
-    # Clear game_on_ended flag when a new game starts
-    if running:
-        game_on_mode_ended = False
-    logging.info(f"Game running state set to: {running}")
+    resolve(session).set_game_running(running)
 
 
-def get_game_running() -> bool:
+def get_game_running(session: CubesSession | None = None) -> bool:
     """Get the current game running state."""
-    return _game_running
+    return resolve(session).game_running
 
 
-def set_game_end_time(now_ms: int, min_win_score: int) -> None:
+def set_game_end_time(now_ms: int, min_win_score: int, session: CubesSession | None = None) -> None:
     """Set game running state to false when game ends.
 
     Args:
@@ -107,102 +93,62 @@ def set_game_end_time(now_ms: int, min_win_score: int) -> None:
         - In game_on mode (min_win_score > 0): Sets flag to prevent ABC re-activation
         - In normal mode (min_win_score = 0): ABC remains available for next game
     """
-    global _game_running, game_on_mode_ended
-    _game_running = False
-    # In game_on mode (min_win_score > 0), set flag to prevent ABC from being re-activated
-    # In normal mode, ABC should remain available so players can start a new game
-    if min_win_score > 0:
-        game_on_mode_ended = True
-        if abc_manager:
-            abc_manager.reset()
-        logging.info(f"Game ended in game_on mode at {now_ms} - ABC disabled")
-    else:
-        logging.info(f"Game ended at {now_ms} - ABC enabled for next game")
-
-
-def reset_game_on_mode_ended() -> None:
+    resolve(session).set_game_end_time(now_ms, min_win_score)
+
+
+def reset_game_on_mode_ended(session: CubesSession | None = None) -> None:
     """Reset the game_on mode ended flag (for testing and initialization)."""
-    global game_on_mode_ended
-    game_on_mode_ended = False
+    resolve(session).game_on_mode_ended = False
 
 
-def has_player_started_game(player: int) -> bool:
+def has_player_started_game(player: int, session: CubesSession | None = None) -> bool:
     """Check if a specific player has started their game."""
-    return player in _started_players
+    return resolve(session).has_player_started_game(player)
 
 
-def add_player_started(player: int) -> None:
+def add_player_started(player: int, session: CubesSession | None = None) -> None:
     """Mark a player as having started their game."""
-    _started_players.add(player)
+    resolve(session).add_player_started(player)
 
 
-def reset_player_started_state() -> None:
+def reset_player_started_state(session: CubesSession | None = None) -> None:
     """Reset the set of players who have started their games."""
-    global _started_players
-    _started_players = set()
+    resolve(session).reset_player_started_state()
 
 
-def reset_started_cube_sets() -> None:
+def reset_started_cube_sets(session: CubesSession | None = None) -> None:
     """Reset the set of cube sets that completed ABC countdown."""
-    global _started_cube_sets
-    _started_cube_sets = set()
+    resolve(session).reset_started_cube_sets()
 
 
-def add_started_cube_set(cube_set_id: int) -> None:
+def add_started_cube_set(cube_set_id: int, session: CubesSession | None = None) -> None:
     """Mark a cube set as having completed the ABC sequence.
 
     Args:
         cube_set_id: The cube set ID (0 or 1) that completed ABC
     """
-    _started_cube_sets.add(cube_set_id)
+    resolve(session).add_started_cube_set(cube_set_id)
 
 
-def get_started_cube_sets() -> list:
+def get_started_cube_sets(session: CubesSession | None = None) -> list:
     """Get list of cube sets that completed ABC countdown.
 
     Returns:
         List of cube_set_ids (0, 1) that completed ABC sequence
     """
-    return list(_started_cube_sets)
-
-
-# Cube-to-cube-set mapping for O(1) lookup
-cube_to_cube_set: Dict[str, int] = {}
-
-
-# Letter lock tracking (which cube is currently locked per player)
-locked_cubes = {}
-
-
-# Manager instances - initialized by coordination module but stored here for shared access
-# This allows tests to replace these instances and have all code see the replacement
-cube_set_managers = None  # Will be set by coordination.init()
-abc_manager = None  # Will be set by coordination module
-
-# Guess tracking state (formerly in GuessManager)
-last_guess_tiles = []  # List of tile IDs in the last guess
-last_tiles_with_letters = []  # List of tiles last loaded to rack
-
-
-# Callback functions (injected by game logic)
-guess_tiles_callback: Callable[[str, bool], Coroutine[None, None, None]] = None
-remove_highlight_callback: Callable[[list[str], int], Coroutine[None, None, None]] = None
-start_game_callback: Callable = None
+    return resolve(session).get_started_cube_sets()
 
 
-def set_guess_tiles_callback(f):
+def set_guess_tiles_callback(f, session: CubesSession | None = None):
     """Register the callback for when tiles are guessed."""
-    global guess_tiles_callback
-    guess_tiles_callback = f
+    resolve(session).guess_tiles_callback = f
 
 
-def set_remove_highlight_callback(f):
+def set_remove_highlight_callback(f, session: CubesSession | None = None):
     """Register the callback for when highlights should be removed."""
-    global remove_highlight_callback
-    remove_highlight_callback = f
+    resolve(session).remove_highlight_callback = f
 
 
-def set_start_game_callback(f):
+def set_start_game_callback(f, session: CubesSession | None = None):
     """Register the callback for when game starts."""
-    global start_game_callback
-    start_game_callback = f
+    resolve(session).start_game_callback = f
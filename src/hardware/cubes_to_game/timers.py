@@ -0,0 +1,56 @@
+"""Timers for scheduled cubes-to-game transitions (the ABC countdown).
+
+call_at(when_ms, callback) runs `await callback(now_ms)` from the first
+advance(now_ms) with now_ms at or past when_ms; the callback gets the time of
+that frame, like everything else the frame publishes. call_at returns a
+handle whose cancel() drops the timer if it has not run yet.
+
+advance() runs every timer due by now_ms, in time order, including any a
+callback schedules at or before now_ms. The game's frame calls it each tick,
+live and in replays, so transitions run at the same point of the frame either
+way (outside any App batch) and replays and tests (driving MockTime or
+passing times in directly) fire them at exactly the same game times every
+run. Checking for a due timer is a peek at the heap.
+"""
+
+import heapq
+import itertools
+from typing import Awaitable, Callable, List, Optional
+
+TimerCallback = Callable[[int], Awaitable[None]]
+
+
+class _GameTimeHandle:
+    def __init__(self, entry: list) -> None:
+        self._entry = entry
+
+    def cancel(self) -> None:
+        self._entry[2] = None
+
+
+class GameTimeTimers:
+    """Timers that fire when advance() is called with a time at or past theirs."""
+
+    def __init__(self) -> None:
+        self._pending: List[list] = []  # heap of [when_ms, seq, callback or None once cancelled]
+        self._seq = itertools.count()
+
+    def call_at(self, when_ms: int, callback: TimerCallback) -> _GameTimeHandle:
+        entry = [when_ms, next(self._seq), callback]
+        heapq.heappush(self._pending, entry)
+        return _GameTimeHandle(entry)
+
+    def next_when_ms(self) -> Optional[int]:
+        """When the earliest pending timer is due; None when none are pending."""
+        while self._pending and self._pending[0][2] is None:
+            heapq.heappop(self._pending)
+        return self._pending[0][0] if self._pending else None
+
+    async def advance(self, now_ms: int) -> None:
+        """Run every timer due by now_ms, earliest first."""
+        while True:
+            when_ms = self.next_when_ms()
+            if when_ms is None or when_ms > now_ms:
+                return
+            _, _, callback = heapq.heappop(self._pending)
+            await callback(now_ms)
@@ -8,6 +8,7 @@ from hardware import cubes_to_game
 from utils.pygameasync import events
 from events.game_events import GameAbortEvent
 from config.game_params import GameParams
+from game_logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -159,7 +160,8 @@ class MQTTCoordinator:
                 payload_str = payload.decode()
             else:
                 payload_str = payload if payload else ""
-            print(f"[DEBUG] Keyboard guess: '{payload_str}' for player 1")
+            if trace.GUESS.enabled:
+                trace.GUESS.emit("keyboard_guess", guess=payload_str, player=1)
             await self.app.guess_word_keyboard(payload_str, 1, now_ms)
 
         elif topic_str.startswith("cube/right/"):
@@ -173,11 +175,6 @@ class MQTTCoordinator:
                 elif isinstance(payload, bytes):
                     payload_bytes = payload
 
-            # Log cube neighbor connections (word formation)
-            sender_id = topic_str.split('/')[-1]
-            neighbor_id = payload_bytes.decode() if payload_bytes else ''
-            print(f"[DEBUG] Cube neighbor connection: cube {sender_id} -> cube {neighbor_id}")
-
             # Create a simple message-like object for cubes_to_game
             message = type('Message', (), {
                 'topic': type('Topic', (), {'value': topic_str})(),
@@ -52,7 +52,10 @@ class Blitter():
 
     def blit_words(self, words: tuple[str], pos_dict: dict[str, tuple[int, int]], colors: list[pygame.Color], animation_time: float = 0.0, animate: bool = False) -> pygame.Surface:
         surface = self._empty_surface.copy()
-        
+        self.blit_words_onto(surface, words, pos_dict, colors, animation_time, animate)
+        return surface
+
+    def blit_words_onto(self, surface: pygame.Surface, words: tuple[str], pos_dict: dict[str, tuple[int, int]], colors: list[pygame.Color], animation_time: float = 0.0, animate: bool = False) -> None:
         for i, (word, color) in enumerate(zip(words, colors)):
             x, y = pos_dict[word]
             
@@ -64,8 +67,6 @@ class Blitter():
                 self._render_blit_xy(surface, self._font, word, x, y, festive_color)
             else:
                  self._render_blit_xy(surface, self._font, word, x, y, color)
-            
-        return surface
 
 class TextRectRenderer():
     def __init__(self, font: pygame.freetype.Font, rect: pygame.Rect) -> None:
@@ -74,6 +75,7 @@ class TextRectRenderer():
         self._font_rect_getter = FontRectGetter(font)
         self._blitter = Blitter(font, rect)
         self._pos_dict = {}
+        self._laid_out: list[str] = []  # The words _pos_dict holds positions for, in order
         self._space_width = int(self._font_rect_getter.get_size("I")[0]*1.5)
         x_height = self._font_rect_getter.get_size("X")[1]
         self._vertical_gap = int(1.25 * x_height)
@@ -84,8 +86,33 @@ class TextRectRenderer():
         """Reset the animation phase."""
         self.animation_time = 0.0
 
-    def update_pos_dict(self, words: list[str]) -> None:
-        self._pos_dict = self._prerender_textrect(words)
+    def update_pos_dict(self, words: list[str]) -> int:
+        """Lay out words, reusing the positions of the words they share with the last layout's start.
+
+        Returns how many leading words kept their positions.
+        """
+        start = 0
+        for old, new in zip(self._laid_out, words):
+            if old != new:
+                break
+            start += 1
+        if start == len(words) == len(self._laid_out):
+            return start
+        self._pos_dict = self._prerender_textrect(words, start)
+        self._laid_out = list(words)
+        return start
+
+    def render_changes(self, surface: pygame.Surface, words: list[str], colors: list[pygame.Color]) -> None:
+        """Update surface, last drawn for the previous words, to show words.
+
+        Only the words after the shared leading ones are erased and drawn again.
+        Raises TextRectException, leaving surface alone, if words don't fit.
+        """
+        old_words, old_pos_dict = self._laid_out, self._pos_dict
+        start = self.update_pos_dict(words)
+        for word in old_words[start:]:
+            surface.fill((0, 0, 0, 0), pygame.Rect(old_pos_dict[word], self._font_rect_getter.get_size(word)))
+        self._blitter.blit_words_onto(surface, words[start:], self._pos_dict, colors[start:])
 
     def render(self, words: list[str], colors: list[pygame.Color], animate: bool = False) -> pygame.Surface:
         self.update_pos_dict(words)
@@ -99,16 +126,22 @@ class TextRectRenderer():
     def get_pos(self, word: str) -> tuple[int, int]:
         return self._pos_dict[word]
 
-    def _prerender_textrect(self, words: list[str]) -> dict[str, tuple[int, int]]:
+    def _prerender_textrect(self, words: list[str], start: int = 0) -> dict[str, tuple[int, int]]:
+        """Positions for words; words[:start] keep their positions in the current layout."""
         pos_dict = {}
         if not words:
             return pos_dict
 
-        pos_dict[words[0]] = (0, 0)
-        last_x, last_y = 0, 0
-        last_width = self._font_rect_getter.get_size(words[0])[0]
+        start = max(start, 1)
+        if start == 1:
+            pos_dict[words[0]] = (0, 0)
+        else:
+            for word in words[:start]:
+                pos_dict[word] = self._pos_dict[word]
+        last_x, last_y = pos_dict[words[start - 1]]
+        last_width = self._font_rect_getter.get_size(words[start - 1])[0]
 
-        for word in words[1:]:
+        for word in words[start:]:
             word_width, _ = self._font_rect_getter.get_size(word)
             if word_width > self._rect.width:
                 raise TextRectException("The word " + word + " is too long to fit in the rect passed.")
@@ -52,14 +52,8 @@ class FakeMqttClient:
         return self
 
     async def __anext__(self):
-        """Async iterator that yields injected messages."""
-        try:
-            # Wait for next message with timeout to allow test to finish
-            message = await asyncio.wait_for(self._message_queue.get(), timeout=0.1)
-            return message
-        except asyncio.TimeoutError:
-            # Keep waiting unless we're done
-            return await self.__anext__()
+        """Async iterator that yields injected messages, waiting until one is injected."""
+        return await self._message_queue.get()
 
     def get_published(self, topic_prefix: str) -> List[Tuple[str, str, bool]]:
         """Get all published messages matching a topic prefix."""
@@ -7,11 +7,15 @@ class MockMqttClient:
         # Reverse MQTT events to maintain chronological order since they come in reversed from GameReplayer
         self.replay_events = list(reversed(replay_events))
         self.event_index = 0
-        self.game_ready = False
+        self._ready = asyncio.Event()
+
+    @property
+    def game_ready(self) -> bool:
+        return self._ready.is_set()
 
     def set_game_ready(self):
         """Mark the game as ready to receive MQTT messages."""
-        self.game_ready = True
+        self._ready.set()
 
     async def subscribe(self, topic):
         """No-op subscribe for compatibility with real MQTT client."""
@@ -28,17 +32,16 @@ class MockMqttClient:
     async def __anext__(self):
         """Async iterator that yields MQTT messages from replay events."""
         # Wait for game to be ready before starting MQTT replay
-        if not self.game_ready:
-            await asyncio.sleep(0.1)  # Small delay to allow game initialization
-            return await self.__anext__()
-            
-        if self.event_index >= len(self.replay_events):
-            raise StopAsyncIteration
-            
-        event = self.replay_events[self.event_index]
-        self.event_index += 1
-        
-        if event['event_type'] == 'mqtt_message':
+        await self._ready.wait()
+
+        while self.event_index < len(self.replay_events):
+            event = self.replay_events[self.event_index]
+            self.event_index += 1
+
+            # Skip non-MQTT events
+            if event['event_type'] != 'mqtt_message':
+                continue
+
             # Create mock MQTT message
             class MockTopic:
                 def __init__(self, topic_str):
@@ -47,16 +50,16 @@ class MockMqttClient:
                     return self.value
                 def matches(self, pattern):
                     return self.value.startswith(pattern.replace('#', ''))
-            
+
             class MockMqttMessage:
                 def __init__(self, topic_str, payload_str):
                     self.topic = MockTopic(topic_str)
                     self.payload = payload_str.encode() if payload_str else b""
-            
+
             topic = event['data']['topic']
             payload = event['data']['payload']
             mock_message = MockMqttMessage(topic, payload)
-            
+
             # Wait for the appropriate timestamp
             if self.event_index > 1:
                 prev_timestamp = self.replay_events[self.event_index - 2]['timestamp_ms']
@@ -64,8 +67,7 @@ class MockMqttClient:
                 delay_ms = current_timestamp - prev_timestamp
                 if delay_ms > 0:
                     await asyncio.sleep(delay_ms / 1000.0)
-            
+
             return mock_message
-        else:
-            # Skip non-MQTT events and continue to next
-            return await self.__anext__()
+
+        raise StopAsyncIteration
@@ -1,5 +1,7 @@
 """Display components for showing previous guesses."""
 
+import bisect
+
 import pygame
 import pygame.freetype
 
@@ -17,6 +19,20 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _apply_delta(words: list[str], added: list[str], removed: list[str]) -> list[str]:
+    """Sorted words with removed taken out and added put in; re-applying it is harmless."""
+    if removed:
+        removed_set = set(removed)
+        words = [word for word in words if word not in removed_set]
+    else:
+        words = list(words)
+    for word in added:
+        i = bisect.bisect_left(words, word)
+        if i == len(words) or words[i] != word:
+            words.insert(i, word)
+    return words
+
+
 class PreviousGuessesDisplayBase:
     """Base class for displaying previous guesses."""
 
@@ -75,16 +91,15 @@ class PreviousGuessesDisplay(PreviousGuessesDisplayBase):
         for last_guess, last_update_ms, color, duration in self.fader_inputs:
             self._try_add_fader(last_guess, color, duration, now_ms)
 
+    def _colors(self, guesses: list[str]) -> list[pygame.Color]:
+        return [self.config_manager.get_config(self.guess_to_player.get(guess, 0)).shield_color
+                for guess in guesses]
+
     def draw(self, animate: bool = False) -> None:
         """Draw the previous guesses display."""
-        colors = []
-        for guess in self.previous_guesses:
-            player_id = self.guess_to_player.get(guess, 0)
-            colors.append(self.config_manager.get_config(player_id).shield_color)
-
         self.surface = self._text_rect_renderer.render(
             self.previous_guesses,
-            colors,
+            self._colors(self.previous_guesses),
             animate=animate)
 
     def old_guess(self, old_guess: str, now_ms: int) -> None:
@@ -129,6 +144,30 @@ class PreviousGuessesDisplay(PreviousGuessesDisplayBase):
         self._recreate_faders(now_ms)
         self.draw()
 
+    def apply_delta(self, added: list[str], removed: list[str], now_ms: int) -> None:
+        """Add and remove words in place.
+
+        Only the words after the first change are laid out and drawn again. The
+        running faders are kept: faders of words that moved follow them, and
+        faders of removed words are dropped.
+        """
+        if not (added or removed):
+            return
+        previous_guesses = _apply_delta(self.previous_guesses, added, removed)
+        word_at = {self._text_rect_renderer.get_pos(guess): guess for guess in self.previous_guesses}
+        # Raises TextRectException before anything changes if the words no longer fit
+        self._text_rect_renderer.render_changes(self.surface, previous_guesses, self._colors(previous_guesses))
+        self.previous_guesses = previous_guesses
+
+        kept = set(previous_guesses)
+        faders = []
+        for fader in self.faders:
+            guess = word_at.get(fader.last_guess_position)
+            if guess in kept:
+                fader.last_guess_position = self._text_rect_renderer.get_pos(guess)
+                faders.append(fader)
+        self.faders = faders
+
     def update(self, window: pygame.Surface, now: int, game_over: bool = False) -> None:
         """Render the display with faders to the window."""
         # Drive animation (rainbow) only if game_over
@@ -160,8 +199,8 @@ class RemainingPreviousGuessesDisplay(PreviousGuessesDisplayBase):
         self.config_manager = config_manager
         self.guess_to_player = guess_to_player
         self.color = REMAINING_PREVIOUS_GUESSES_COLOR
-        self.surface = pygame.Surface((0, 0))
         self.remaining_guesses = []
+        self.draw()
 
     @classmethod
     def from_instance(cls, instance: 'RemainingPreviousGuessesDisplay', font_size: int) -> 'RemainingPreviousGuessesDisplay':
@@ -192,17 +231,26 @@ class RemainingPreviousGuessesDisplay(PreviousGuessesDisplayBase):
         self.remaining_guesses = remaining_guesses
         self.draw()
 
-    def draw(self, animate: bool = False) -> None:
-        """Draw the remaining previous guesses display."""
+    def apply_delta(self, added: list[str], removed: list[str]) -> None:
+        """Add and remove remaining guesses in place, drawing only the words after the first change again."""
+        if added or removed:
+            remaining_guesses = _apply_delta(self.remaining_guesses, added, removed)
+            self._text_rect_renderer.render_changes(self.surface, remaining_guesses, self._colors(remaining_guesses))
+            self.remaining_guesses = remaining_guesses
+
+    def _colors(self, guesses: list[str]) -> list[pygame.Color]:
         colors = []
-        for guess in self.remaining_guesses:
+        for guess in guesses:
             player_id = self.guess_to_player.get(guess, 0)
             base_color = self.config_manager.get_config(player_id).shield_color
             colors.append(pygame.Color(base_color.r, base_color.g, base_color.b, 192))
+        return colors
 
+    def draw(self, animate: bool = False) -> None:
+        """Draw the remaining previous guesses display."""
         self.surface = self._text_rect_renderer.render(
             self.remaining_guesses,
-            colors,
+            self._colors(self.remaining_guesses),
             animate=animate)
 
 
@@ -258,6 +306,13 @@ class PreviousGuessesManager:
         """Update remaining guesses."""
         self.exec_with_resize(lambda: self.remaining_previous_guesses_display.update_remaining_guesses(previous_guesses), now_ms)
 
+    def apply_delta(self, added: list[str], removed: list[str],
+                    remaining_added: list[str], remaining_removed: list[str], now_ms: int) -> None:
+        """Apply changes to both guess lists."""
+        self.exec_with_resize(lambda: self.previous_guesses_display.apply_delta(added, removed, now_ms), now_ms)
+        self.exec_with_resize(lambda: self.remaining_previous_guesses_display.apply_delta(
+            remaining_added, remaining_removed), now_ms)
+
     def update(self, window: pygame.Surface, now_ms: int, game_over: bool = False) -> None:
         """Update all displays."""
         def _update():
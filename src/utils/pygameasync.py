@@ -1,9 +1,13 @@
 import asyncio
+import inspect
 import logging
+import operator
 import pygame
-from typing import Callable
-from collections import defaultdict
+import time
+from typing import Any, Callable, Hashable, Optional
+from collections import Counter, defaultdict, deque
 from dataclasses import fields
+from enum import Enum
 
 class Clock:
     def __init__(self, time_func: Callable[[], int] = pygame.time.get_ticks) -> None:
@@ -22,18 +26,123 @@ class Clock:
         self.last_tick = current
         await asyncio.sleep(delay)
 
+class _Queued:
+    """An event waiting for its async handlers."""
+    __slots__ = ("name", "args", "kwargs", "key", "lane", "superseded", "queued_at")
+
+    def __init__(self, name: str, args: tuple, kwargs: dict, key: Optional[Hashable], lane: int,
+                 queued_at: float) -> None:
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.lane = lane
+        self.superseded = False
+        self.queued_at = queued_at  # perf_counter() when metrics are on, else 0
+
+
+class LaneQueue(asyncio.Queue):
+    """An asyncio.Queue with FIFO lanes, lane 0 served first.
+
+    Items carry a `lane` attribute. So that busy lanes cannot starve the
+    ones after them, a lane that has waited while `burst` items were taken
+    from other lanes gets the next turn.
+    """
+
+    def __init__(self, lanes: int = 3, burst: int = 8) -> None:
+        self.lanes = lanes
+        self.burst = burst
+        super().__init__()
+
+    def _init(self, maxsize: int) -> None:
+        self._lanes: list[deque] = [deque() for _ in range(self.lanes)]
+        self._passed = [0] * self.lanes  # Items taken from other lanes while this one waited
+        self.max_depths = [0] * self.lanes
+
+    def qsize(self) -> int:
+        return sum(len(lane) for lane in self._lanes)
+
+    def empty(self) -> bool:
+        return not any(self._lanes)
+
+    def _put(self, item: Any) -> None:
+        lane = self._lanes[item.lane]
+        lane.append(item)
+        if len(lane) > self.max_depths[item.lane]:
+            self.max_depths[item.lane] = len(lane)
+
+    def _get(self) -> Any:
+        waiting = [index for index, lane in enumerate(self._lanes) if lane]
+        chosen = next((index for index in waiting if self._passed[index] >= self.burst), waiting[0])
+        for index in waiting:
+            self._passed[index] += 1
+        self._passed[chosen] = 0
+        return self._lanes[chosen].popleft()
+
+    def depths(self) -> list[int]:
+        """Items waiting in each lane."""
+        return [len(lane) for lane in self._lanes]
+
+
 class EventEngine:
+    """Dispatches typed events to the handlers registered with on().
+
+    Async handlers run later, one event at a time, from the worker task.
+    Plain (non-async) handlers run immediately inside trigger(), so events
+    that only have those never touch the queue.
+
+    Queued events wait in the LaneQueue lane named by their `lane`, so
+    gameplay events are not held up behind a burst of display updates.
+
+    Events whose coalesce_key() is not None are latest-wins: queuing one
+    supersedes a still-pending event with the same key, and the worker skips
+    the superseded one. The skips are counted per event name in `coalesced`.
+
+    Assigning a game_logging.event_metrics.EventMetrics to `metrics` records
+    queue latency and handler times, for plain handlers as well as async
+    ones; with it None nothing is timed.
+    """
+
     def __init__(self) -> None:
         self.listeners: dict[str, list[Callable]] = defaultdict(list)
-        self.queue: asyncio.Queue = asyncio.Queue()
+        self.queue: asyncio.Queue = LaneQueue()
         self.running = False
+        self.coalesced: Counter[str] = Counter()
+        self.metrics: Optional[Any] = None
+        self._routes: dict[str, tuple[tuple[Callable, ...], tuple[Callable, ...]]] = {}
+        self._extractors: dict[type, Callable[[Any], tuple]] = {}
+        self._pending: dict[Hashable, _Queued] = {}
 
     def on(self, event: str) -> Callable:
         def wrapper(func: Callable) -> Callable:
             self.listeners[event].append(func)
+            self._routes.pop(event, None)
             return func
         return wrapper
 
+    def _route(self, event_name: str) -> tuple[tuple[Callable, ...], tuple[Callable, ...]]:
+        """(plain handlers, async handlers) for an event name, split once per registration."""
+        route = self._routes.get(event_name)
+        if route is None:
+            handlers = self.listeners.get(event_name, ())
+            route = (tuple(f for f in handlers if not inspect.iscoroutinefunction(f)),
+                     tuple(f for f in handlers if inspect.iscoroutinefunction(f)))
+            self._routes[event_name] = route
+        return route
+
+    def _extractor(self, event_class: type) -> Callable[[Any], tuple]:
+        """A function returning an event's fields (except event_type) as handler args, built once per class."""
+        names = [f.name for f in fields(event_class) if f.name != 'event_type']
+        if not names:
+            extractor = lambda event: ()
+        elif len(names) == 1:
+            name = names[0]
+            extractor = lambda event: (getattr(event, name),)
+        else:
+            extractor = operator.attrgetter(*names)
+        self._extractors[event_class] = extractor
+        return extractor
+
     def trigger(self, event: any) -> None:
         """Trigger a typed event.
 
@@ -41,11 +150,33 @@ class EventEngine:
             event: A GameEvent object with event_type and typed fields
         """
         if self.running:
-            # Typed event - extract event name and convert fields to args
-            event_name = event.event_type.value if hasattr(event.event_type, 'value') else str(event.event_type)
-            # Extract all fields except event_type as positional arguments
-            event_args = tuple(getattr(event, f.name) for f in fields(event) if f.name != 'event_type')
-            self.queue.put_nowait((event_name, event_args, {}))
+            event_type = event.event_type
+            event_name = event_type.value if isinstance(event_type, Enum) else str(event_type)
+            sync_handlers, async_handlers = self._route(event_name)
+            if not sync_handlers and not async_handlers:
+                return
+            extractor = self._extractors.get(type(event)) or self._extractor(type(event))
+            event_args = extractor(event)
+            if self.metrics is not None:
+                self._call_measured(event_name, sync_handlers, event_args, not async_handlers, self.metrics)
+            else:
+                for func in sync_handlers:
+                    try:
+                        func(*event_args)
+                    except Exception as e:
+                        logging.error(f"Event handler error: {e}")
+            if async_handlers:
+                self._enqueue(event_name, event_args, event.coalesce_key(), event.lane)
+
+    def _enqueue(self, event_name: str, event_args: tuple, key: Optional[Hashable], lane: int) -> None:
+        item = _Queued(event_name, event_args, {}, key, lane,
+                       time.perf_counter() if self.metrics is not None else 0.0)
+        if key is not None:
+            previous = self._pending.get(key)
+            if previous is not None:
+                previous.superseded = True
+            self._pending[key] = item
+        self.queue.put_nowait(item)
 
     async def stop(self) -> None:
         self.running = False
@@ -53,10 +184,20 @@ class EventEngine:
             await asyncio.wait_for(self.queue.join(), timeout=2.0)
         except asyncio.TimeoutError:
             logging.warning("Event queue join timed out, there may be unfinished tasks.")
+        # The worker sleeps in queue.get() until an event arrives, so wake it to exit
+        worker = getattr(self, '_worker_task', None)
+        if worker is not None and worker is not asyncio.current_task():
+            worker.cancel()
+        if self.coalesced:
+            logging.info(f"Coalesced events: {dict(self.coalesced)}")
+        if isinstance(self.queue, LaneQueue):
+            logging.info(f"Event lane max depths: {self.queue.max_depths}")
 
     def clear(self) -> None:
         """Clear all listeners and pending events."""
         self.listeners.clear()
+        self._routes.clear()
+        self._pending.clear()
         # Empty the queue
         try:
             while True:
@@ -70,23 +211,31 @@ class EventEngine:
         return self.running and hasattr(self, '_worker_task') and not self._worker_task.done()
 
     async def start(self) -> None:
+        if self.is_alive():
+            return
         self.running = True
         self._worker_task = asyncio.create_task(self._worker(), name="event_worker")
 
     async def _worker(self) -> None:
         while self.running:
             try:
-                event, args, kwargs = await asyncio.wait_for(self.queue.get(), timeout=0.1)
+                item = await self.queue.get()
                 try:
-                    for func in self.listeners[event]:
+                    if item.superseded:
+                        self.coalesced[item.name] += 1
+                        continue
+                    if item.key is not None and self._pending.get(item.key) is item:
+                        del self._pending[item.key]
+                    if self.metrics is not None:
+                        await self._dispatch_measured(item, self.metrics)
+                        continue
+                    for func in self._route(item.name)[1]:
                         try:
-                            await func(*args, **kwargs)
+                            await func(*item.args, **item.kwargs)
                         except Exception as e:
                             logging.error(f"Event handler error: {e}")
                 finally:
                     self.queue.task_done()
-            except asyncio.TimeoutError:
-                continue
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -95,5 +244,37 @@ class EventEngine:
                 logging.error(f"Event worker critical error: {e}")
                 raise e
 
+    def _call_measured(self, event_name: str, sync_handlers: tuple[Callable, ...], event_args: tuple,
+                       record_latency: bool, metrics: Any) -> None:
+        """Run plain handlers inside trigger(), timing each. They wait in no queue, so their latency is 0."""
+        if record_latency and sync_handlers:
+            metrics.record_latency(event_name, 0.0)
+        start = time.perf_counter()
+        for func in sync_handlers:
+            failed = False
+            try:
+                func(*event_args)
+            except Exception as e:
+                failed = True
+                logging.error(f"Event handler error: {e}")
+            end = time.perf_counter()
+            metrics.record_handler(event_name, getattr(func, "__qualname__", repr(func)), (end - start) * 1000, failed)
+            start = end
+
+    async def _dispatch_measured(self, item: _Queued, metrics: Any) -> None:
+        start = time.perf_counter()
+        if item.queued_at:
+            metrics.record_latency(item.name, (start - item.queued_at) * 1000)
+        for func in self._route(item.name)[1]:
+            failed = False
+            try:
+                await func(*item.args, **item.kwargs)
+            except Exception as e:
+                failed = True
+                logging.error(f"Event handler error: {e}")
+            end = time.perf_counter()
+            metrics.record_handler(item.name, getattr(func, "__qualname__", repr(func)), (end - start) * 1000, failed)
+            start = end
+
 
 events = EventEngine()
@@ -16,7 +16,7 @@ from rendering.metrics import RackMetrics
 from systems.sound_manager import SoundManager
 from game_logging.game_loggers import GameLogger, OutputLogger
 from testing.fake_mqtt_client import FakeMqttClient
-from utils.pygameasync import events
+from utils.pygameasync import LaneQueue, events
 from hardware.cubes_interface import CubesHardwareInterface
 from tests.constants import FRAME_DURATION_MS, MAX_SIMULATION_FRAMES
 
@@ -70,7 +70,7 @@ def async_test(coro):
             
             # Clear previous listeners and reset queue to bind to current loop
             events.clear()
-            events.queue = asyncio.Queue()
+            events.queue = LaneQueue()
 
             # Ensure events engine is running
             if not events.running:
@@ -343,7 +343,7 @@ async def run_until_condition(
         except LookupError:
             pass
 
-        countdown_incidents = await cubes_to_game.check_countdown_completion(publish_queue, now_ms, game.sound_manager)
+        countdown_incidents = await cubes_to_game.advance_countdown(now_ms)
         game_incidents = await game.update(window, now_ms)
 
         # Check condition with normalized callback
@@ -126,7 +126,7 @@ async def test_load_rack_skips_unstarted_players(mock_hardware):
     game._app.player_count = 2
 
     # Case: Only P0 started
-    mock_hardware.has_player_started_game.side_effect = lambda p: p == 0
+    mock_hardware.has_player_started_game.side_effect = lambda p, session=None: p == 0
 
     await game._app.load_rack(now_ms=3000)
 
@@ -17,7 +17,7 @@ async def test_game_does_not_end_on_guess_overflow():
     for i in range(50):
         word = f"WORD{i}"
         guesses.append(word)
-        await game.add_guess(guesses, word, 0, 1000 + i * 100)
+        game.add_guess(guesses, word, 0, 1000 + i * 100)
         await game.update(window, 1000 + i * 100)
 
         # Game should stay running
@@ -49,7 +49,7 @@ async def test_shrink_on_overflow():
     # Create enough words to force vertical overflow and trigger resize
     long_guess_words = [f"LINE{i}" for i in range(60)]
 
-    await game.add_guess(long_guess_words, "LASTWORD", 0, 0)
+    game.add_guess(long_guess_words, "LASTWORD", 0, 0)
 
     window = pygame.Surface((game_config.SCREEN_WIDTH, game_config.SCREEN_HEIGHT))
     await game.update(window, 100)
@@ -144,6 +144,10 @@ async def test_letter_position_resets_after_word_accepted():
     assert success, f"Letter failed to fall/accept within time. Pos: {game.letter.pos[1]}"
     assert game.letter.letter == "", "Letter should be cleared after acceptance"
 
+    # Fall at the normal speed again, so the empty slot can't reach the rack
+    # before the game.next_tile event is handled
+    game.letter.drop_time_ms = Letter.DROP_TIME_MS
+
     # 2. Wait for next letter to be spawned (handling the event)
     success = await run_until_condition(game, queue, lambda: game.letter.letter != "", max_frames=20)
     assert success, "Game failed to spawn next letter"
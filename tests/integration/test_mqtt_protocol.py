@@ -223,7 +223,7 @@ async def test_bad_old_guess_feedback():
     # We must ensure last_guess_tiles has our tiles.
     # We must ensure last_guess_tiles has our tiles.
     from hardware.cubes_to_game import state
-    state.last_guess_tiles = [tiles_in_guess] # wait, it is list of lists? No, list of str?
+    state.session.last_guess_tiles = [tiles_in_guess] # wait, it is list of lists? No, list of str?
     # coordination.py: guess_last_tiles iterates: for guess in state.last_guess_tiles:
     # If last_guess_tiles is list of guesses?
     # coordination.py: guess_tiles(..., word_tiles_list, ...) sets state.last_guess_tiles = word_tiles_list
@@ -259,7 +259,7 @@ async def test_bad_old_guess_feedback():
     # So `last_guess_tiles` is `List[str]`. The strings are tile IDs concatenated.
     # Correct.
     
-    state.last_guess_tiles = ["".join(tiles_in_guess)]
+    state.session.last_guess_tiles = ["".join(tiles_in_guess)]
     
     await app.hardware.guess_last_tiles(queue, 0, 0, 3000)
     
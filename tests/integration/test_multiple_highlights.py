@@ -410,13 +410,13 @@ async def test_coordination_layer_passes_previous_tiles():
     from unittest.mock import AsyncMock
 
     # Reset state from previous tests
-    ctg_coordination.state.last_guess_tiles = []
+    ctg_coordination.state.session.last_guess_tiles = []
 
     # Set up mock callbacks
     mock_guess_callback = AsyncMock()
     mock_remove_callback = AsyncMock()
-    ctg_coordination.state.guess_tiles_callback = mock_guess_callback
-    ctg_coordination.state.remove_highlight_callback = mock_remove_callback
+    ctg_coordination.state.session.guess_tiles_callback = mock_guess_callback
+    ctg_coordination.state.session.remove_highlight_callback = mock_remove_callback
 
     print("\n=== Test: Coordination layer passes previous tiles ===")
 
@@ -453,13 +453,13 @@ async def test_coordination_layer_removes_individual_chain_from_multiple():
     from unittest.mock import AsyncMock
 
     # Reset state from previous tests
-    ctg_coordination.state.last_guess_tiles = []
+    ctg_coordination.state.session.last_guess_tiles = []
 
     # Set up mock callbacks
     mock_guess_callback = AsyncMock()
     mock_remove_callback = AsyncMock()
-    ctg_coordination.state.guess_tiles_callback = mock_guess_callback
-    ctg_coordination.state.remove_highlight_callback = mock_remove_callback
+    ctg_coordination.state.session.guess_tiles_callback = mock_guess_callback
+    ctg_coordination.state.session.remove_highlight_callback = mock_remove_callback
 
     print("\n=== Test: Remove one chain from multiple ===")
 
@@ -550,3 +550,18 @@ async def test_mqtt_neighbor_messages_control_highlights():
     assert len(game.racks[0].highlights) == 0, "Highlight should be removed when cubes are separated"
 
     print("\n✅ Test passed: MQTT neighbor messages properly control highlights")
+
+
+@async_test
+async def test_guess_feedback_applies_in_trigger_order():
+    """A bad guess triggered after a good one leaves the rack showing bad."""
+    from events.game_events import GameBadGuessEvent, GameStageGuessEvent
+    from utils.pygameasync import events
+    game, mqtt, queue = await create_test_game(player_count=1)
+
+    events.trigger(GameStageGuessEvent(3, "CAT", 0, 0))
+    events.trigger(GameBadGuessEvent(0))
+    await asyncio.sleep(0.1)
+
+    assert game.racks[0].guess_type == GuessType.BAD
+    assert len(game.shields) == 1
@@ -19,7 +19,7 @@ async def test_overflow_does_not_stop_game():
     game.guesses_manager.previous_guesses_display.add_guess = failing_mock
     
     # Add a guess
-    await game.add_guess(["prev"], "guess", 0, 0)
+    game.add_guess(["prev"], "guess", 0, 0)
     
     # Check that game is still running
     # If exception was raised, game would have crashed (stopped execution flow or raised out)
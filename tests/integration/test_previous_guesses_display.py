@@ -161,3 +161,17 @@ async def test_guess_count_tracking():
     remaining = game.guesses_manager.remaining_previous_guesses_display.remaining_guesses
     assert "DAD" in remaining
 
+
+@async_test
+async def test_guess_list_events_apply_in_trigger_order():
+    """An added guess can't overwrite a delta triggered after it."""
+    from events.game_events import InputAddGuessEvent, InputPreviousGuessesDeltaEvent
+    from utils.pygameasync import events
+    game, mqtt, queue = await create_test_game(player_count=1)
+
+    events.trigger(InputAddGuessEvent(["CAT", "DOG"], "DOG", 0, 0))
+    events.trigger(InputPreviousGuessesDeltaEvent([], ["CAT"], ["CAT"], [], 0))
+    await asyncio.sleep(0.1)
+
+    assert game.guesses_manager.previous_guesses_display.previous_guesses == ["DOG"]
+    assert game.guesses_manager.remaining_previous_guesses_display.remaining_guesses == ["CAT"]
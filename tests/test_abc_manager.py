@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from hardware.cubes_to_game.abc_manager import ABCManager, CountdownState
+from hardware.cubes_to_game.cube_set_manager import CubeSetManager
+from hardware.cubes_to_game.timers import GameTimeTimers
+
+
+def _manager(cube_set_id: int) -> CubeSetManager:
+    manager = CubeSetManager(cube_set_id)
+    first = 1 + 10 * cube_set_id
+    manager.cube_list = [str(first + i) for i in range(6)]
+    manager.cubes_to_neighbors = {cube: "-" for cube in manager.cube_list}
+    return manager
+
+
+def _question_marks(queue: asyncio.Queue) -> list:
+    messages = []
+    while not queue.empty():
+        topic, message, _, now_ms = queue.get_nowait()
+        if message == "?":
+            messages.append((topic, now_ms))
+    return messages
+
+
+class TestGameTimeTimers(unittest.IsolatedAsyncioTestCase):
+    async def test_fires_due_timers_in_order_with_the_frame_time(self):
+        timers = GameTimeTimers()
+        fired = []
+
+        def record(name):
+            async def callback(now_ms):
+                fired.append((name, now_ms))
+            return callback
+
+        timers.call_at(300, record("second"))
+        timers.call_at(100, record("first"))
+        timers.call_at(500, record("third"))
+        await timers.advance(400)
+
+        self.assertEqual([("first", 400), ("second", 400)], fired)
+        self.assertEqual(500, timers.next_when_ms())
+
+    async def test_cancelled_timer_does_not_fire(self):
+        timers = GameTimeTimers()
+        callback = AsyncMock()
+        timers.call_at(100, callback).cancel()
+        await timers.advance(200)
+
+        callback.assert_not_awaited()
+        self.assertIsNone(timers.next_when_ms())
+
+    async def test_timer_scheduled_by_a_timer_fires_in_the_same_advance(self):
+        timers = GameTimeTimers()
+        fired = []
+
+        async def first(now_ms):
+            fired.append("first")
+            timers.call_at(now_ms, second)
+
+        async def second(now_ms):
+            fired.append("second")
+
+        timers.call_at(100, first)
+        await timers.advance(150)
+        self.assertEqual(["first", "second"], fired)
+
+
+class TestABCCountdownStateMachine(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.queue = asyncio.Queue()
+        self.sound = MagicMock()
+        self.start_cube_set = AsyncMock()
+        self.managers = [_manager(0), _manager(1)]
+        self.abc = ABCManager()
+
+    async def _complete_abc(self, player: int, now_ms: int):
+        await self.abc.handle_abc_completion(self.queue, player, now_ms, self.sound, self.managers, 1000,
+                                             self.start_cube_set)
+
+    async def test_states_follow_the_sequence(self):
+        self.assertEqual(CountdownState.IDLE, self.abc.state)
+        self.assertFalse(self.abc.abc_start_active)
+
+        await self.abc.assign_abc_letters_to_available_players(self.queue, 0, self.managers)
+        self.assertEqual(CountdownState.WAITING_FOR_ABC, self.abc.state)
+        self.assertTrue(self.abc.abc_start_active)
+
+        await self._complete_abc(0, 1000)
+        self.assertEqual(CountdownState.COUNTING_DOWN, self.abc.state)
+        self.assertEqual({"state": "counting_down", "stage": None, "next_transition_ms": 1000,
+                          "complete_ms": 7000, "abc_players": [0, 1], "countdown_players": [0]},
+                         self.abc.diagnostics())
+
+        # Letter assignment each frame leaves a running countdown alone
+        await self.abc.assign_abc_letters_to_available_players(self.queue, 1500, self.managers)
+        self.assertEqual(CountdownState.COUNTING_DOWN, self.abc.state)
+
+        await self.abc.timers.advance(7000)
+        self.assertEqual(CountdownState.IDLE, self.abc.state)
+        self.start_cube_set.assert_awaited_once_with(0, 7000)
+
+    async def test_late_advance_runs_every_due_stage(self):
+        await self.abc.assign_abc_letters_to_available_players(self.queue, 0, self.managers)
+        await self._complete_abc(0, 1000)
+        _question_marks(self.queue)
+
+        # Every stage due by now runs, in order, publishing with the frame's time
+        await self.abc.timers.advance(3500)
+        self.assertEqual([("cube/4/letter", 3500), ("cube/5/letter", 3500), ("cube/6/letter", 3500)],
+                         _question_marks(self.queue))
+        self.assertEqual("non_abc_3", self.abc.stage)
+        self.assertEqual(4000, self.abc.next_deadline_ms())
+        self.assertEqual(["abc_countdown_replacement: non_abc_1", "abc_countdown_replacement: non_abc_2",
+                          "abc_countdown_replacement: non_abc_3"], self.abc.take_incidents())
+        self.assertEqual([], self.abc.take_incidents())
+        self.start_cube_set.assert_not_awaited()
+
+    async def test_joining_player_gets_stages_that_are_due_but_not_run(self):
+        await self.abc.assign_abc_letters_to_available_players(self.queue, 0, self.managers)
+        await self._complete_abc(0, 1000)
+        await self.abc.timers.advance(2000)
+        _question_marks(self.queue)
+
+        # Stages that already ran are not replayed for the joiner; the one due at 3000 is
+        await self._complete_abc(1, 3500)
+        self.assertEqual([("cube/16/letter", 3500)], _question_marks(self.queue))
+
+        await self.abc.timers.advance(7000)
+        self.assertEqual([0, 1], [call.args[0] for call in self.start_cube_set.await_args_list])
+
+    async def test_reset_cancels_the_countdown(self):
+        await self.abc.assign_abc_letters_to_available_players(self.queue, 0, self.managers)
+        await self._complete_abc(0, 1000)
+        self.abc.reset()
+
+        await self.abc.timers.advance(10000)
+        self.assertEqual([], self.abc.take_incidents())
+        self.start_cube_set.assert_not_awaited()
+        self.assertIsNone(self.abc.next_deadline_ms())
+
+    async def test_countdown_resets_when_starting_a_cube_set_fails(self):
+        self.start_cube_set.side_effect = RuntimeError("start failed")
+        await self.abc.assign_abc_letters_to_available_players(self.queue, 0, self.managers)
+        await self._complete_abc(0, 1000)
+
+        with self.assertRaises(RuntimeError):
+            await self.abc.timers.advance(7000)
+        self.assertEqual(CountdownState.IDLE, self.abc.state)
+        self.assertIsNone(self.abc.next_deadline_ms())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 
 import unittest
 import random
+import string
 import sys
 import os
 
@@ -9,6 +10,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from core.anagram_helper import AnagramHelper
+from core.lexicon import pack_letters
 
 
 class TestAnagramHelper(unittest.TestCase):
@@ -21,22 +23,18 @@ class TestAnagramHelper(unittest.TestCase):
     def test_compute_signature_single_letter(self):
         """Test signature computation for single letters."""
         sig = self.helper._compute_signature('a')
-        expected = tuple([1] + [0] * 25)
-        self.assertEqual(sig, expected)
+        self.assertEqual(sig, pack_letters('A'))
         
         sig_z = self.helper._compute_signature('z')
-        expected_z = tuple([0] * 25 + [1])
-        self.assertEqual(sig_z, expected_z)
+        self.assertEqual(sig_z, pack_letters('Z'))
     
     def test_compute_signature_duplicates(self):
         """Test signature computation with duplicate letters."""
         sig = self.helper._compute_signature('aaa')
-        expected = tuple([3] + [0] * 25)
-        self.assertEqual(sig, expected)
+        self.assertEqual(sig, pack_letters('AAA'))
         
-        sig_mixed = self.helper._compute_signature('aabbcc')
-        expected_mixed = tuple([2, 2, 2] + [0] * 23)
-        self.assertEqual(sig_mixed, expected_mixed)
+        sig_mixed = self.helper._compute_signature('cbacba')
+        self.assertEqual(sig_mixed, pack_letters('AABBCC'))
     
     def test_compute_signature_mixed_case(self):
         """Test that signatures are case-insensitive."""
@@ -89,6 +87,26 @@ class TestAnagramHelper(unittest.TestCase):
             self.assertIsInstance(score, int)
             self.assertGreaterEqual(score, 0)
     
+    def test_score_candidates_matches_count_anagrams(self):
+        """Test that batched scoring matches one count_anagrams call per letter."""
+        random.seed(3)
+        racks = ["BEEBRA", "AAAAAA", "QQZZXX", "??????", "AB?DEF", "", "E", "ST",
+                 "".join(random.choice(string.ascii_uppercase) for _ in range(6))]
+        for rack in racks:
+            expected = {c: self.helper.count_anagrams(rack + c) for c in string.ascii_uppercase}
+            self.assertEqual(expected, dict(self.helper.score_candidates(rack)), rack)
+
+    def test_score_candidates_without_batch_scorer(self):
+        """Test the subset-lattice fallback used when NumPy is unavailable."""
+        helper = AnagramHelper.__new__(AnagramHelper)
+        helper._freq_map = self.helper._freq_map
+        helper._batch_scorer = None
+        random.seed(4)
+        racks = ["BEEBRA", "AAAAAA", "SSSEEE", "QQZZXX", "??????", "AB?DEF", "", "E", "ST",
+                 "".join(random.choice(string.ascii_uppercase) for _ in range(6))]
+        for rack in racks:
+            self.assertEqual(self.helper.score_candidates(rack), helper.score_candidates(rack), rack)
+
     def test_singleton_pattern(self):
         """Test that get_instance returns the same instance."""
         helper1 = AnagramHelper.get_instance()
@@ -37,6 +37,7 @@ class TestCubeGame(IsolatedAsyncioTestCase):
         events.on("rack.update_rack")(nop)
         events.on("input.remaining_previous_guesses")(nop)
         events.on("input.update_previous_guesses")(nop)
+        events.on("input.previous_guesses_delta")(nop)
         a_dictionary = dictionary.Dictionary(3, 6, my_open)
         a_dictionary.read("sowpods.txt", "bingos.txt")
         from unittest.mock import MagicMock
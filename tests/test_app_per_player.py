@@ -57,7 +57,7 @@ class TestAppPerPlayerIntegration(unittest.IsolatedAsyncioTestCase):
                 
     async def test_load_rack_only_player_0_started(self):
         """Test app load_rack when only player 0 has started."""
-        def mock_has_started(player):
+        def mock_has_started(player, session=None):
             return player == 0
             
         with patch.object(cubes_to_game, 'has_player_started_game', side_effect=mock_has_started):
@@ -73,7 +73,7 @@ class TestAppPerPlayerIntegration(unittest.IsolatedAsyncioTestCase):
                 
     async def test_load_rack_only_player_1_started(self):
         """Test app load_rack when only player 1 has started."""
-        def mock_has_started(player):
+        def mock_has_started(player, session=None):
             return player == 1
             
         with patch.object(cubes_to_game, 'has_player_started_game', side_effect=mock_has_started):
@@ -267,7 +267,7 @@ class TestAppStartIntegration(unittest.IsolatedAsyncioTestCase):
                         await self.app.start(1000)
 
                         # Then: Game running state is set
-                        mock_set_running.assert_called_once_with(True)
+                        mock_set_running.assert_called_once_with(True, session=self.app.hardware.session)
 
                         # And: ABC cubes are cleared
                         mock_clear_abc.assert_called_once()
@@ -296,7 +296,7 @@ class TestAppStartIntegration(unittest.IsolatedAsyncioTestCase):
                         await self.app.start(1000)
 
                         # Then: Game running state is set
-                        mock_set_running.assert_called_once_with(True)
+                        mock_set_running.assert_called_once_with(True, session=self.app.hardware.session)
 
                         # And: Player 0 is marked as started
                         self.assertTrue(cubes_to_game.has_player_started_game(0))
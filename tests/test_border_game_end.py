@@ -76,7 +76,7 @@ async def test_neighbor_message_does_not_set_borders_when_game_not_running():
     async def mock_guess_callback(word_tiles, is_valid, player, now_ms):
         guess_tiles_called.append((word_tiles, is_valid, player, now_ms))
 
-    state.guess_tiles_callback = mock_guess_callback
+    state.set_guess_tiles_callback(mock_guess_callback)
 
     # Create a mock queue to capture published messages
     queue = asyncio.Queue()
@@ -128,7 +128,7 @@ async def test_neighbor_message_sets_borders_when_game_is_running():
     async def mock_guess_callback(word_tiles, is_valid, player, now_ms):
         guess_tiles_called.append((word_tiles, is_valid, player, now_ms))
 
-    state.guess_tiles_callback = mock_guess_callback
+    state.set_guess_tiles_callback(mock_guess_callback)
 
     # Create a mock queue
     queue = asyncio.Queue()
@@ -205,6 +205,8 @@ async def test_mark_tiles_for_guess_works_when_player_started():
     manager.tiles_to_cubes = {
         '0': '1', '1': '2', '2': '3', '3': '4', '4': '5', '5': '6'
     }
+    # Borders published by earlier tests are not resent
+    manager.display.forget()
 
     # Mark tiles for guess (should work because player has started)
     await manager._mark_tiles_for_guess(queue, [['0', '1', '2']], 1000, state._started_players)
@@ -222,3 +224,40 @@ async def test_mark_tiles_for_guess_works_when_player_started():
 
     # Clean up
     state.reset_player_started_state()
+
+
+@pytest.mark.asyncio
+@pytest.mark.fast
+async def test_mark_tiles_for_guess_publishes_only_changed_borders():
+    """Verify that a longer guess resends only the borders that moved."""
+
+    state.reset_player_started_state()
+    state.add_player_started(0)
+
+    queue = asyncio.Queue()
+
+    manager = cubes_to_game.cube_set_managers[0]
+    manager.cube_list = ['1', '2', '3', '4', '5', '6']
+    manager.tiles_to_cubes = {
+        '0': '1', '1': '2', '2': '3', '3': '4', '4': '5', '5': '6'
+    }
+    manager.border_color = "0xFFFF"
+    manager.display.forget()
+
+    await manager._mark_tiles_for_guess(queue, [['0', '1', '2']], 1000, state._started_players)
+    assert queue.qsize() == 6
+
+    while not queue.empty():
+        queue.get_nowait()
+
+    # Tile 2 loses its east border and tile 3 gains one; the rest are unchanged
+    await manager._mark_tiles_for_guess(queue, [['0', '1', '2', '3']], 2000, state._started_players)
+    border_messages = []
+    while not queue.empty():
+        topic, payload, retain, timestamp = queue.get_nowait()
+        border_messages.append((topic, payload))
+
+    assert border_messages == [("cube/3/border", "NS:0xFFFF"), ("cube/4/border", "ENS:0xFFFF")]
+
+    # Clean up
+    state.reset_player_started_state()
@@ -5,6 +5,7 @@ import asyncio
 
 from hardware.cubes_to_game import coordination
 from hardware.cubes_to_game import state
+from hardware.cubes_to_game.abc_manager import CountdownState
 from hardware.cubes_to_game.cube_set_manager import CubeSetManager
 
 
@@ -46,25 +47,46 @@ class TestHelperFunctions(unittest.TestCase):
         self.assertTrue(coordination._has_received_initial_neighbor_reports())
 
 
-class TestPublishLetter(unittest.IsolatedAsyncioTestCase):
-    """Test _publish_letter helper."""
+class TestAcceptNewLetter(unittest.IsolatedAsyncioTestCase):
+    """Test accept_new_letter publishing."""
 
-    async def test_publish_letter_puts_to_queue(self):
+    def setUp(self):
+        self.manager = coordination.cube_set_managers[0]
+        self.manager.tiles_to_cubes = {"0": "5"}
+        self.manager.display.forget()
+
+    async def test_accept_new_letter_puts_to_queue(self):
         """Should publish letter to correct topic with retain."""
         queue = asyncio.Queue()
         
-        await coordination._publish_letter(queue, "A", "5", 1000)
+        await coordination.accept_new_letter(queue, "A", "0", 0, 1000)
         
         topic, message, retain, timestamp = await queue.get()
         self.assertEqual(topic, "cube/5/letter")
         self.assertEqual(message, "A")
         self.assertTrue(retain)
         self.assertEqual(timestamp, 1000)
+        self.assertEqual(self.manager.cubes_to_letters["5"], "A")
+
+    async def test_same_letter_is_not_republished(self):
+        """A cube already showing the letter should not be sent it again."""
+        queue = asyncio.Queue()
+
+        await coordination.accept_new_letter(queue, "A", "0", 0, 1000)
+        await queue.get()
+        await coordination.accept_new_letter(queue, "A", "0", 0, 2000)
+
+        self.assertTrue(queue.empty())
 
 
 class TestLetterLock(unittest.IsolatedAsyncioTestCase):
     """Test letter_lock functionality."""
 
+    def setUp(self):
+        # What earlier tests published would hide this test's messages
+        for manager in coordination.cube_set_managers:
+            manager.display.forget()
+
     async def test_letter_lock_first_lock(self):
         """First lock should publish lock message."""
         queue = asyncio.Queue()
@@ -152,6 +174,11 @@ class TestLetterLock(unittest.IsolatedAsyncioTestCase):
 class TestUnlockAllLetters(unittest.IsolatedAsyncioTestCase):
     """Test unlock_all_letters functionality."""
 
+    def setUp(self):
+        # What earlier tests published would hide this test's messages
+        for manager in coordination.cube_set_managers:
+            manager.display.forget()
+
     async def test_unlock_all_letters_empty(self):
         """Unlocking when nothing is locked should do nothing."""
         queue = asyncio.Queue()
@@ -190,6 +217,10 @@ class TestUnlockAllLetters(unittest.IsolatedAsyncioTestCase):
 class TestBulkOperations(unittest.IsolatedAsyncioTestCase):
     """Test bulk operations."""
 
+    def setUp(self):
+        for manager in coordination.cube_set_managers:
+            manager.display.forget()
+
     async def test_clear_all_borders(self):
         """Should clear borders on all cubes."""
         queue = asyncio.Queue()
@@ -339,7 +370,7 @@ class TestABCManagementAsync(unittest.IsolatedAsyncioTestCase):
     async def test_set_game_end_time_resets_abc_in_game_on_mode(self):
         """ABC manager should be reset when game ends in game_on mode (min_win_score > 0)."""
         # Set up ABC manager with active state
-        state.abc_manager.abc_start_active = True
+        state.abc_manager.state = CountdownState.WAITING_FOR_ABC
         state.abc_manager.player_abc_cubes = {0: {"A": "1", "B": "2", "C": "3"}}
 
         # Call set_game_end_time with min_win_score > 0 (game_on mode)
@@ -352,7 +383,7 @@ class TestABCManagementAsync(unittest.IsolatedAsyncioTestCase):
     async def test_set_game_end_time_preserves_abc_in_normal_mode(self):
         """ABC manager should NOT be reset in normal mode (min_win_score = 0)."""
         # Set up ABC manager with active state
-        state.abc_manager.abc_start_active = True
+        state.abc_manager.state = CountdownState.WAITING_FOR_ABC
         state.abc_manager.player_abc_cubes = {0: {"A": "1", "B": "2", "C": "3"}}
 
         # Call set_game_end_time with min_win_score = 0 (normal mode)
@@ -367,11 +398,11 @@ class TestABCManagementAsync(unittest.IsolatedAsyncioTestCase):
         queue = asyncio.Queue()
 
         # Set up conditions: game not running, has neighbor reports
-        state._game_running = False
+        state.session.game_running = False
         coordination.cube_set_managers[0].cubes_to_neighbors = {"1": "2"}
 
         # Set game_on_mode_ended flag (simulating game_on mode game end)
-        state.game_on_mode_ended = True
+        state.session.game_on_mode_ended = True
 
         with patch.object(state.abc_manager, 'assign_abc_letters_to_available_players', new_callable=AsyncMock) as mock_assign:
             await coordination.activate_abc_start_if_ready(queue, 1000)
@@ -424,7 +455,7 @@ class TestMQTTMessageHandler(unittest.IsolatedAsyncioTestCase):
         state.cube_to_cube_set["3"] = 0
         state._started_players.clear()
         state._started_players.add(0)
-        state.abc_manager.abc_start_active = True
+        state.abc_manager.state = CountdownState.WAITING_FOR_ABC
         
         message = MagicMock()
         message.topic.value = "cube/right/3"
@@ -440,6 +471,49 @@ class TestMQTTMessageHandler(unittest.IsolatedAsyncioTestCase):
                         mock_check.assert_called_once()
                         mock_handle.assert_called_once()
 
+    async def test_handle_mqtt_message_right_edge_duplicate(self):
+        """Should drop a right-edge report that repeats the last one applied."""
+        queue = asyncio.Queue()
+        state.cube_to_cube_set["3"] = 0
+        state._started_players.add(0)
+        state.neighbor_filter.reset()
+        manager = coordination.cube_set_managers[0]
+
+        message = MagicMock()
+        message.topic.value = "cube/right/3"
+        message.payload.decode.return_value = "4"
+
+        with patch.object(manager, 'process_neighbor_cube', return_value=[]) as mock_process:
+            with patch.object(coordination, 'guess_tiles', new_callable=AsyncMock):
+                await coordination.handle_mqtt_message(queue, message, 1000, None)
+                await coordination.handle_mqtt_message(queue, message, 1100, None)
+                mock_process.assert_called_once_with("3", "4")
+        self.assertEqual({"duplicate": 1}, state.neighbor_filter.suppressed)
+        state.neighbor_filter.reset()
+
+    async def test_settled_neighbor_report_applied_from_frame(self):
+        """Should hold a changed report for the settle window, then apply it."""
+        queue = asyncio.Queue()
+        state.cube_to_cube_set["3"] = 0
+        state.neighbor_filter.reset()
+        coordination.set_neighbor_settle_ms(50)
+        manager = coordination.cube_set_managers[0]
+
+        message = MagicMock()
+        message.topic.value = "cube/right/3"
+        message.payload.decode.return_value = "4"
+
+        try:
+            with patch.object(manager, 'process_neighbor_cube', return_value=[]) as mock_process:
+                await coordination.handle_mqtt_message(queue, message, 1000, None)
+                await coordination.apply_settled_neighbor_reports(queue, 1049, None)
+                mock_process.assert_not_called()
+                await coordination.apply_settled_neighbor_reports(queue, 1050, None)
+                mock_process.assert_called_once_with("3", "4")
+        finally:
+            coordination.set_neighbor_settle_ms(0)
+            state.neighbor_filter.reset()
+
 
 if __name__ == '__main__':
     unittest.main()
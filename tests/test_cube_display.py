@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+import asyncio
+import unittest
+
+from hardware.cubes_to_game.cube_display import CubeDisplay
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    messages = []
+    while not queue.empty():
+        messages.append(queue.get_nowait())
+    return messages
+
+
+class TestCubeDisplay(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.display = CubeDisplay()
+        self.queue = asyncio.Queue()
+
+    async def test_first_set_is_published(self):
+        self.display.set("1", "letter", "A")
+        self.display.set("1", "border", "NS:0xFFFF")
+        self.assertEqual(2, await self.display.reconcile(self.queue, 100))
+        self.assertEqual([("cube/1/letter", "A", True, 100),
+                          ("cube/1/border", "NS:0xFFFF", True, 100)], _drain(self.queue))
+
+    async def test_unchanged_field_is_skipped(self):
+        self.display.set("1", "border", ":")
+        self.display.set("2", "border", ":")
+        await self.display.reconcile(self.queue, 100)
+        _drain(self.queue)
+
+        self.display.set("1", "border", ":")
+        self.display.set("2", "border", "NS:0x07E0")
+        self.assertEqual(1, await self.display.reconcile(self.queue, 200))
+        self.assertEqual([("cube/2/border", "NS:0x07E0", True, 200)], _drain(self.queue))
+        self.assertEqual({"border": 1}, self.display.skipped)
+
+    async def test_last_value_set_wins(self):
+        self.display.set("1", "letter", "A")
+        await self.display.reconcile(self.queue, 100)
+        _drain(self.queue)
+
+        self.display.set("1", "letter", "B")
+        self.display.set("1", "letter", "A")
+        self.assertEqual(0, await self.display.reconcile(self.queue, 200))
+        self.assertEqual("A", self.display.get("1", "letter"))
+
+    async def test_unlock_publishes_none(self):
+        self.display.set("1", "lock", "1")
+        await self.display.reconcile(self.queue, 100)
+        self.display.set("1", "lock", None)
+        await self.display.reconcile(self.queue, 200)
+        self.assertEqual([("cube/1/lock", "1", True, 100),
+                          ("cube/1/lock", None, True, 200)], _drain(self.queue))
+
+    async def test_failed_publish_is_sent_again(self):
+        self.display.set("1", "letter", "A")
+        self.display.set("2", "letter", "B")
+        await self.display.reconcile(self.queue, 100)
+        _drain(self.queue)
+
+        self.display.publish_failed("1", "letter", "A")
+        self.display.set("2", "letter", "B")
+        self.assertEqual(1, await self.display.reconcile(self.queue, 200))
+        self.assertEqual([("cube/1/letter", "A", True, 200)], _drain(self.queue))
+
+    async def test_failure_of_a_superseded_value_is_ignored(self):
+        self.display.set("1", "letter", "A")
+        await self.display.reconcile(self.queue, 100)
+        self.display.set("1", "letter", "B")
+        await self.display.reconcile(self.queue, 200)
+        _drain(self.queue)
+
+        self.display.publish_failed("1", "letter", "A")
+        self.assertEqual(0, await self.display.reconcile(self.queue, 300))
+
+    async def test_forget_field_resends_it(self):
+        self.display.set("1", "letter", "A")
+        self.display.set("1", "border", ":")
+        await self.display.reconcile(self.queue, 100)
+        _drain(self.queue)
+
+        self.display.forget("border")
+        self.display.set("1", "letter", "A")
+        self.display.set("1", "border", ":")
+        await self.display.reconcile(self.queue, 200)
+        self.assertEqual([("cube/1/border", ":", True, 200)], _drain(self.queue))
+
+    async def test_forget_all_resends_everything(self):
+        self.display.set("1", "letter", "A")
+        await self.display.reconcile(self.queue, 100)
+        _drain(self.queue)
+
+        self.display.forget()
+        self.display.set("1", "letter", "A")
+        self.assertEqual(1, await self.display.reconcile(self.queue, 200))
+
+    async def test_flash_always_publishes(self):
+        await self.display.flash(self.queue, "1", 100)
+        await self.display.flash(self.queue, "1", 100)
+        self.assertEqual([("cube/1/flash", "1", False, 100)] * 2, _drain(self.queue))
+
+
+if __name__ == '__main__':
+    unittest.main()
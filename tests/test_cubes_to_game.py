@@ -1,5 +1,6 @@
 import unittest
 import asyncio
+import random
 from unittest.mock import Mock, patch, AsyncMock
 from hardware import cubes_to_game
 from hardware.cubes_to_game import state as ctg_state
@@ -29,7 +30,7 @@ class TestLetterLock(unittest.IsolatedAsyncioTestCase):
     
     def setUp(self):
         # Set up cube managers for testing - must set on state module to be seen by functions
-        ctg_state.cube_set_managers = [cubes_to_game.CubeSetManager(0), cubes_to_game.CubeSetManager(1)]
+        ctg_state.session.cube_set_managers = [cubes_to_game.CubeSetManager(0), cubes_to_game.CubeSetManager(1)]
 
         # Mock the tiles_to_cubes for both players
         ctg_state.cube_set_managers[0].tiles_to_cubes = {
@@ -389,5 +390,43 @@ class TestLoopDetection(unittest.TestCase):
         self.assertTrue(self.cube_manager._has_loop_from_cube("cube1"))
         self.assertTrue(self.cube_manager._has_loop_from_cube("cube4"))
 
+class TestIncrementalChains(unittest.TestCase):
+    def setUp(self):
+        self.cube_manager = cubes_to_game.CubeSetManager(0)
+        self.cube_manager.cube_list = [f"cube{i}" for i in range(tiles.MAX_LETTERS)]
+        self.cube_manager.tiles_to_cubes = {str(i): f"cube{i}" for i in range(tiles.MAX_LETTERS)}
+
+    def test_cube_to_tile_id_follows_reassignment(self):
+        self.assertEqual("2", self.cube_manager.cube_to_tile_id("cube2"))
+        self.cube_manager.tiles_to_cubes = {"0": "cube2"}
+        self.assertEqual("0", self.cube_manager.cube_to_tile_id("cube2"))
+        self.assertIsNone(self.cube_manager.cube_to_tile_id("cube0"))
+
+    def test_tiles_to_cubes_cannot_be_edited_in_place(self):
+        assigned = {"0": "cube2"}
+        self.cube_manager.tiles_to_cubes = assigned
+        assigned["1"] = "cube3"
+        self.assertIsNone(self.cube_manager.cube_to_tile_id("cube3"))
+        with self.assertRaises(TypeError):
+            self.cube_manager.tiles_to_cubes["1"] = "cube3"
+
+    def test_loop_check_for_a_new_link(self):
+        self.cube_manager.cube_chain = {"cube1": "cube2", "cube2": "cube3"}
+        self.assertTrue(self.cube_manager._has_loop_from_cube("cube3", "cube1"))
+        self.assertFalse(self.cube_manager._has_loop_from_cube("cube3", "cube4"))
+
+    def test_matches_full_rebuild(self):
+        rng = random.Random(7)
+        cubes = self.cube_manager.cube_list + ["-"]
+        for _ in range(2000):
+            sender = rng.choice(self.cube_manager.cube_list)
+            result = self.cube_manager.process_neighbor_cube(sender, rng.choice(cubes))
+            incremental = dict(self.cube_manager._chain_words)
+            rejected = result == [] and self.cube_manager.words() != []
+            self.assertEqual(self.cube_manager.words(), self.cube_manager._form_words_from_chain())
+            self.assertEqual(incremental, self.cube_manager._chain_words)
+            if not rejected:
+                self.assertEqual(self.cube_manager.words(), result)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from core.dawg import Dawg
+
+WORDS = ["CAT", "CATS", "COT", "COTS", "DOG", "DOGS", "TACO", "TACOS"]
+
+
+class TestDawg(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dawg = Dawg.from_words(w.lower() for w in reversed(WORDS))
+
+    def test_contains(self) -> None:
+        self.assertEqual(len(WORDS), len(self.dawg))
+        for word in WORDS:
+            self.assertIn(word, self.dawg)
+        for word in ["CA", "CATSS", "DOGE", "", "TAC"]:
+            self.assertNotIn(word, self.dawg)
+
+    def test_iterates_alphabetically(self) -> None:
+        self.assertEqual(WORDS, list(self.dawg))
+
+    def test_shares_suffixes(self) -> None:
+        # CA/CO share one "T(S)" tail, and every word's final node with an S edge is shared:
+        # root, C, CA=CO, CAT=COT=DOG=TACO, CATS=..., D, DO, T, TA, TAC
+        node_edges, node_edge_count, node_final, edge_letter, edge_target = self.dawg.arrays()
+        self.assertEqual(10, len(node_final))
+
+    def test_prefixes(self) -> None:
+        self.assertTrue(self.dawg.has_prefix("TA"))
+        self.assertFalse(self.dawg.has_prefix("TX"))
+        self.assertEqual(["COT", "COTS"], list(self.dawg.words_with_prefix("CO")))
+        self.assertEqual([], list(self.dawg.words_with_prefix("Z")))
+
+    def test_words_from_rack(self) -> None:
+        self.assertEqual(["CAT", "COT", "TACO"], self.dawg.words_from_rack("OTCA"))
+        self.assertEqual(["CAT", "CATS", "COT", "COTS", "TACO", "TACOS"], self.dawg.words_from_rack("SOCTAX"))
+        self.assertEqual([], self.dawg.words_from_rack("CA?"))
+
+    def test_add_does_not_disturb_shared_nodes(self) -> None:
+        self.dawg.update(["CATE", "DO", "CATS"])
+        self.assertEqual(len(WORDS) + 2, len(self.dawg))
+        self.assertIn("CATE", self.dawg)
+        self.assertIn("DO", self.dawg)
+        self.assertNotIn("COTE", self.dawg)
+        self.assertEqual(sorted(WORDS + ["CATE", "DO"]), list(self.dawg))
+
+    def test_rejects_unsorted_input(self) -> None:
+        with self.assertRaises(ValueError):
+            Dawg.from_sorted(["DOG", "CAT"])
+
+    def test_read_only_arrays_are_copied_on_add(self) -> None:
+        arrays = [memoryview(bytes(a)) if isinstance(a, bytearray) else memoryview(a)
+                  for a in self.dawg.arrays()]
+        view = Dawg.from_arrays(*arrays, self.dawg.root, len(self.dawg))
+        self.assertEqual(WORDS, list(view))
+        view.add("ACT")
+        self.assertIn("ACT", view)
+        self.assertNotIn("ACT", self.dawg)
+
+
+if __name__ == '__main__':
+    unittest.main()
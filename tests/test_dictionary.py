@@ -25,10 +25,58 @@ class TestDictionary(unittest.TestCase):
     def testGetRack(self) -> None:
         self.assertEqual("ACEHRS", self.d.get_rack().letters())
 
+    def testGetRackLeavesGlobalRandomAlone(self) -> None:
+        state = random.getstate()
+        self.d.get_rack()
+        self.assertEqual(state, random.getstate())
+
+    def testGetRackByLevel(self) -> None:
+        # SEARCH also makes ARCH, so it is the easier bingo
+        d = dictionary.Dictionary.from_words(["arch", "search", "online"], bingos=["online", "search"])
+        self.assertEqual("ACEHRS", d.get_rack(1).letters())
+        self.assertEqual("EILNNO", d.get_rack(2).letters())
+        self.assertEqual("EILNNO", d.get_rack(9).letters())
+
+    def testGetRackByLevelUsesBingoStats(self) -> None:
+        files = {"sowpods.txt": "arch\nsearch\nonline", "bingos_file": "search\nonline",
+                 "bingo_stats.csv": "Word,AnagramCount\nONLINE,40\nSEARCH,12\n"}
+        d = dictionary.Dictionary(3, 6, open=lambda filename, mode: StringIO(files[filename]))
+        d.read("sowpods.txt", "bingos_file", "bingo_stats.csv")
+        self.assertEqual("EILNNO", d.get_rack(1).letters())
+        self.assertEqual("ACEHRS", d.get_rack(2).letters())
+
+    def testGetRackByLevelWithoutBingoStatsFile(self) -> None:
+        def my_open(filename, mode):
+            if filename == "missing.csv":
+                raise FileNotFoundError(filename)
+            return StringIO("search\nonline")
+        d = dictionary.Dictionary(3, 6, open=my_open)
+        d.read("sowpods.txt", "bingos_file", "missing.csv")
+        # Each bingo only makes itself, so the tie goes alphabetically
+        self.assertEqual("EILNNO", d.get_rack(1).letters())
+
     def testIsWord(self) -> None:
         self.assertTrue(self.d.is_word("ONLINE"))
         self.assertFalse(self.d.is_word("OXLINE"))
 
+    def testPrefixes(self) -> None:
+        self.assertTrue(self.d.has_prefix("ONL"))
+        self.assertFalse(self.d.has_prefix("ONX"))
+        self.assertEqual(["SEARCH"], list(self.d.words_with_prefix("SE")))
+        self.assertEqual(["ONLINE", "SEARCH"], list(self.d.words_with_prefix("")))
+
+    def testWordsFromRack(self) -> None:
+        self.assertEqual(["SEARCH"], self.d.words_from_rack("HCRAES"))
+        self.assertEqual(["ONLINE"], self.d.words_from_rack("NNOEIL"))
+        self.assertEqual([], self.d.words_from_rack("NOEIL?"))
+
+    def testFromWords(self) -> None:
+        d = dictionary.Dictionary.from_words(["cat", "act", "at", "tacos"], min_letters=3, max_letters=4)
+        self.assertTrue(d.is_word("CAT"))
+        self.assertFalse(d.is_word("AT"))
+        self.assertFalse(d.is_word("TACOS"))
+        self.assertEqual(["ACT", "CAT"], d.words_from_rack("TCA"))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+import asyncio
+import unittest
+
+from core import tiles
+from events.game_events import (GameAbortEvent, GameBadGuessEvent, GameStageGuessEvent, InputAddGuessEvent,
+                                RackUpdateLetterEvent, RackUpdateRackEvent)
+from utils.pygameasync import EventEngine, LaneQueue
+
+
+class TestEventEngine(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.engine = EventEngine()
+        self.calls = []
+
+    async def asyncTearDown(self) -> None:
+        await self.engine.stop()
+
+    async def test_plain_handler_runs_immediately(self):
+        self.engine.on("game.bad_guess")(lambda player: self.calls.append(("bad", player)))
+        self.engine.running = True
+        self.engine.trigger(GameBadGuessEvent(1))
+        self.assertEqual([("bad", 1)], self.calls)
+        self.assertTrue(self.engine.queue.empty())
+
+    async def test_async_handler_runs_from_queue(self):
+        async def update_letter(tile, player, now_ms):
+            self.calls.append((tile.letter, player, now_ms))
+
+        self.engine.on("rack.update_letter")(update_letter)
+        self.engine.on("rack.update_letter")(lambda *args: self.calls.append("plain"))
+        await self.engine.start()
+        self.engine.trigger(RackUpdateLetterEvent(tiles.Tile("A", "0"), 1, 100))
+        self.assertEqual(["plain"], self.calls)
+        await asyncio.wait_for(self.engine.queue.join(), 1)
+        self.assertEqual(["plain", ("A", 1, 100)], self.calls)
+
+    async def test_event_without_fields(self):
+        self.engine.on("game.abort")(lambda: self.calls.append("abort"))
+        self.engine.running = True
+        self.engine.trigger(GameAbortEvent())
+        self.assertEqual(["abort"], self.calls)
+
+    async def test_handler_registered_after_first_trigger(self):
+        self.engine.running = True
+        self.engine.trigger(GameBadGuessEvent(0))
+        self.engine.on("game.bad_guess")(lambda player: self.calls.append(player))
+        self.engine.trigger(GameBadGuessEvent(1))
+        self.assertEqual([1], self.calls)
+
+    async def test_pending_duplicates_coalesce_to_newest(self):
+        async def update_rack(tiles, highlight_length, guess_length, player, now_ms, guessed_tile_ids):
+            self.calls.append((player, highlight_length, now_ms))
+
+        self.engine.on("rack.update_rack")(update_rack)
+        self.engine.running = True
+        self.engine.trigger(RackUpdateRackEvent([], 0, 0, 0, 10, None))
+        self.engine.trigger(RackUpdateRackEvent([], 0, 0, 1, 10, None))
+        self.engine.trigger(RackUpdateRackEvent([], 3, 3, 0, 20, ["0", "1", "2"]))
+        self.engine.trigger(RackUpdateRackEvent([], 0, 0, 0, 30, None))
+        self.engine.trigger(RackUpdateRackEvent([], 0, 0, 0, 40, None))
+        await self.engine.start()
+        await asyncio.wait_for(self.engine.queue.join(), 1)
+        self.assertEqual([(1, 0, 10), (0, 3, 20), (0, 0, 40)], self.calls)
+        self.assertEqual({"rack.update_rack": 2}, self.engine.coalesced)
+
+    async def test_event_in_flight_is_not_superseded(self):
+        tile = tiles.Tile("A", "0")
+
+        async def update_letter(changed_tile, player, now_ms):
+            self.calls.append(now_ms)
+            if now_ms == 10:
+                self.engine.trigger(RackUpdateLetterEvent(tile, 0, 20))
+
+        self.engine.on("rack.update_letter")(update_letter)
+        await self.engine.start()
+        self.engine.trigger(RackUpdateLetterEvent(tile, 0, 10))
+        await asyncio.wait_for(self.engine.queue.join(), 1)
+        self.assertEqual([10, 20], self.calls)
+        self.assertFalse(self.engine.coalesced)
+
+    async def test_gameplay_lane_goes_first(self):
+        async def add_guess(previous_guesses, guess, player, now_ms):
+            self.calls.append(guess)
+
+        async def stage_guess(score, last_guess, player, now_ms):
+            self.calls.append(last_guess.upper())
+
+        self.engine.on("input.add_guess")(add_guess)
+        self.engine.on("game.stage_guess")(stage_guess)
+        self.engine.running = True
+        self.engine.trigger(InputAddGuessEvent([], "cat", 0, 10))
+        self.engine.trigger(InputAddGuessEvent([], "dog", 0, 10))
+        self.engine.trigger(GameStageGuessEvent(3, "emu", 0, 10))
+        self.assertEqual([1, 0, 2], self.engine.queue.depths())
+        await self.engine.start()
+        await asyncio.wait_for(self.engine.queue.join(), 1)
+        self.assertEqual(["EMU", "cat", "dog"], self.calls)
+
+    async def test_stop_ends_idle_worker(self):
+        await self.engine.start()
+        worker = self.engine._worker_task
+        await self.engine.start()
+        self.assertIs(worker, self.engine._worker_task)
+        await self.engine.stop()
+        await asyncio.wait_for(asyncio.gather(worker, return_exceptions=True), 1)
+        self.assertTrue(worker.done())
+
+
+class _Item:
+    def __init__(self, lane: int, name: str) -> None:
+        self.lane = lane
+        self.name = name
+
+
+class TestLaneQueue(unittest.TestCase):
+    def test_waiting_lane_gets_a_turn_after_burst(self):
+        queue = LaneQueue(lanes=3, burst=2)
+        for name in ("a", "b", "c", "d", "e"):
+            queue.put_nowait(_Item(0, name))
+        queue.put_nowait(_Item(1, "rack"))
+        queue.put_nowait(_Item(2, "display"))
+        order = [queue.get_nowait().name for _ in range(7)]
+        self.assertEqual(["a", "b", "rack", "display", "c", "d", "e"], order)
+        self.assertEqual([5, 1, 1], queue.max_depths)
+        self.assertEqual([0, 0, 0], queue.depths())
+
+
+if __name__ == '__main__':
+    unittest.main()
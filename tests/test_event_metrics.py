@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from core import tiles
+from events.game_events import GameBadGuessEvent, RackUpdateLetterEvent
+from game_logging.event_metrics import EventMetrics, histogram
+from utils.pygameasync import EventEngine
+
+
+class TestEventMetrics(unittest.TestCase):
+    def test_histogram_buckets(self):
+        counts = histogram([0.05, 0.1, 0.3, 7, 1000])
+        self.assertEqual(2, counts["<=0.1"])
+        self.assertEqual(1, counts["<=0.5"])
+        self.assertEqual(1, counts["<=10"])
+        self.assertEqual(1, counts[">500"])
+
+    def test_window_keeps_latest_samples(self):
+        metrics = EventMetrics(window=2)
+        for latency in (100, 1, 2):
+            metrics.record_latency("rack.update_letter", latency)
+        latency = metrics.snapshot()["rack.update_letter"]["latency"]
+        self.assertEqual((2, 2), (latency["count"], latency["max_ms"]))
+
+    def test_dump_writes_a_line_per_event(self):
+        metrics = EventMetrics()
+        metrics.record_latency("game.stage_guess", 1.5)
+        metrics.record_handler("game.stage_guess", "Game.stage_guess", 3, failed=True)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics.jsonl")
+            metrics.dump(path)
+            with open(path) as f:
+                record, = [json.loads(line) for line in f]
+        self.assertEqual("game.stage_guess", record["event"])
+        self.assertEqual(1, record["handlers"]["Game.stage_guess"]["errors"])
+
+
+class TestEngineMetrics(unittest.IsolatedAsyncioTestCase):
+    async def test_engine_records_latency_and_handler_time(self):
+        engine = EventEngine()
+        engine.metrics = EventMetrics()
+
+        async def update_letter(tile, player, now_ms):
+            raise ValueError("boom")
+
+        engine.on("rack.update_letter")(update_letter)
+        await engine.start()
+        engine.trigger(RackUpdateLetterEvent(tiles.Tile("A", "0"), 0, 0))
+        await asyncio.wait_for(engine.queue.join(), 1)
+        await engine.stop()
+
+        snapshot = engine.metrics.snapshot()["rack.update_letter"]
+        self.assertEqual(1, snapshot["latency"]["count"])
+        handler, = snapshot["handlers"].values()
+        self.assertEqual((1, 1), (handler["count"], handler["errors"]))
+
+    async def test_engine_times_plain_handlers(self):
+        engine = EventEngine()
+        engine.metrics = EventMetrics()
+
+        def bad_guess(player):
+            pass
+
+        engine.on("game.bad_guess")(bad_guess)
+        await engine.start()
+        engine.trigger(GameBadGuessEvent(0))
+        await engine.stop()
+
+        snapshot = engine.metrics.snapshot()["game.bad_guess"]
+        self.assertEqual((1, 0), (snapshot["latency"]["count"], snapshot["latency"]["max_ms"]))
+        handler = snapshot["handlers"][bad_guess.__qualname__]
+        self.assertEqual((1, 0), (handler["count"], handler["errors"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+import asyncio
+import unittest
+from io import StringIO
+from unittest.mock import AsyncMock, MagicMock
+
+from core import app
+from core import dictionary
+from core import tiles
+from core.frame_batch import FrameBatch, PublishBuffer
+from events.game_events import RackUpdateLetterEvent, RackUpdateRackEvent
+from utils.pygameasync import events
+
+
+class TestPublishBuffer(unittest.IsolatedAsyncioTestCase):
+    async def test_last_retained_message_per_topic_wins(self):
+        buffer = PublishBuffer()
+        await buffer.put(("cube/1/lock", "1", True, 10))
+        await buffer.put(("cube/1/flash", "1", False, 10))
+        await buffer.put(("cube/2/lock", "1", True, 10))
+        await buffer.put(("cube/1/lock", None, True, 20))
+        await buffer.put(("cube/1/flash", "1", False, 20))
+        self.assertEqual([
+            ("cube/1/flash", "1", False, 10),
+            ("cube/2/lock", "1", True, 10),
+            ("cube/1/lock", None, True, 20),
+            ("cube/1/flash", "1", False, 20),
+        ], buffer.messages())
+
+
+class TestFrameBatch(unittest.TestCase):
+    def test_refresh_dropped_before_later_rack_update(self):
+        batch = FrameBatch(0)
+        tile = tiles.Tile("A", "0")
+        refresh = RackUpdateRackEvent([], 0, 0, 0, 0, None)
+        highlight = RackUpdateRackEvent([], 3, 3, 0, 0, ["0", "1", "2"])
+        other_player = RackUpdateRackEvent([], 0, 0, 1, 0, None)
+        letter = RackUpdateLetterEvent(tile, 0, 0)
+        for event in (refresh, letter, other_player, highlight, RackUpdateLetterEvent(tile, 0, 5)):
+            batch.add_rack_event(event)
+        events_sent = batch.rack_events()
+        self.assertEqual([other_player, highlight], events_sent[:2])
+        self.assertEqual(5, events_sent[2].now_ms)
+        self.assertEqual(3, len(events_sent))
+
+    def test_trailing_refresh_kept(self):
+        batch = FrameBatch(0)
+        highlight = RackUpdateRackEvent([], 3, 3, 0, 0, ["0", "1", "2"])
+        refresh = RackUpdateRackEvent([], 0, 0, 0, 0, None)
+        batch.add_rack_event(highlight)
+        batch.add_rack_event(refresh)
+        self.assertEqual([highlight, refresh], batch.rack_events())
+
+
+class TestAppBatch(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.rack_events = []
+
+        async def record(*args):
+            self.rack_events.append(args)
+
+        events.clear()
+        events.on("rack.update_rack")(record)
+        events.running = True
+        self.addCleanup(setattr, events, "running", False)
+        self.addCleanup(events.clear)
+
+        async def letter_lock(queue, cube_set_id, tile_id, now_ms):
+            await queue.put(("cube/1/lock", tile_id, True, now_ms))
+            return True
+
+        hardware = MagicMock()
+        hardware.letter_lock = AsyncMock(side_effect=letter_lock)
+        a_dictionary = dictionary.Dictionary(3, 6, lambda filename, mode: StringIO("cat\n"))
+        a_dictionary.read("sowpods.txt", "bingos.txt")
+        self.publish_queue: asyncio.Queue = asyncio.Queue()
+        self.app = app.App(self.publish_queue, a_dictionary, hardware)
+
+    async def test_batch_sends_consolidated_updates_at_end(self):
+        async with self.app.batch(100):
+            await self.app.letter_lock(0, True, 100)
+            await self.app.letter_lock(1, True, 116)
+            await self.app.remove_highlight([], 0)
+            await self.app.remove_highlight([], 0)
+            self.assertTrue(self.publish_queue.empty())
+            self.assertTrue(events.queue.empty())
+
+        self.assertEqual(1, self.publish_queue.qsize())
+        self.assertEqual(("cube/1/lock", self.app.rack_manager.get_rack(0).position_to_id(1), True, 116),
+                         self.publish_queue.get_nowait())
+        self.assertEqual(1, events.queue.qsize())
+
+    async def test_nested_batch_joins_outer(self):
+        async with self.app.batch(100):
+            async with self.app.batch(100):
+                await self.app.letter_lock(0, True, 100)
+            self.assertTrue(self.publish_queue.empty())
+        self.assertEqual(1, self.publish_queue.qsize())
+
+    async def test_guess_lists_sent_once_at_end(self):
+        sent = []
+        events.on("input.update_previous_guesses")(lambda previous_guesses, now_ms: sent.append("previous"))
+        events.on("input.previous_guesses_delta")(lambda *args: sent.append("delta"))
+        self.app._score_card.add_guess("CAT", 0)
+        events.coalesced.clear()
+        async with self.app.batch(100):
+            self.app._update_previous_guesses_delta()
+            self.app._update_previous_guesses()
+            self.app._update_previous_guesses_delta()
+            self.app._update_previous_guesses()
+            self.assertEqual([], sent)
+        self.assertEqual(["previous", "delta"], sent)
+        self.assertEqual({"input.previous_guesses_delta": 1, "input.update_previous_guesses": 1},
+                         events.coalesced)
+
+    async def test_other_tasks_do_not_join_the_batch(self):
+        async with self.app.batch(100):
+            await asyncio.create_task(self.app.letter_lock(0, True, 100))
+            self.assertEqual(1, self.publish_queue.qsize())
+            await self.app.letter_lock(1, True, 116)
+            self.assertEqual(1, self.publish_queue.qsize())
+        self.assertEqual(2, self.publish_queue.qsize())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -41,6 +41,12 @@ def test_game_params_from_json_partial():
     assert params.level == 2
 
 
+def test_game_params_from_json_lexicon():
+    """Test the lexicon id is read from the payload and defaults to None."""
+    assert GameParams.from_json('{"lexicon":"kids"}').lexicon == "kids"
+    assert GameParams.from_json('{"level":2}').lexicon is None
+
+
 def test_game_params_from_json_empty():
     """Test parsing empty JSON string returns None."""
     assert GameParams.from_json("") is None
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+import os
+import tempfile
+import unittest
+
+from core import lexicon
+from core.dictionary import Dictionary
+
+
+class TestLexicon(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.tmp_dir.name, "words.txt")
+        self._write_source(["arch", "char", "fuzz", "search", "online", "ab", "toolong", "it's"])
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def _write_source(self, words: list[str]) -> None:
+        with open(self.source, "w") as f:
+            f.write("\n".join(words))
+
+    def test_pack_letters_preserves_order(self) -> None:
+        self.assertLess(lexicon.pack_letters("AB"), lexicon.pack_letters("ABC"))
+        self.assertLess(lexicon.pack_letters("ABC"), lexicon.pack_letters("ABD"))
+        self.assertIsNone(lexicon.pack_letters("A?C"))
+        self.assertIsNone(lexicon.pack_letters("ABCDEFG"))
+
+    def test_signature_is_multiset(self) -> None:
+        self.assertEqual(lexicon.pack_signature("ARCH"), lexicon.pack_signature("CHAR"))
+        self.assertNotEqual(lexicon.pack_signature("ARCH"), lexicon.pack_signature("ARCHH"))
+
+    def test_is_word(self) -> None:
+        lex = lexicon.load(self.source)
+        self.assertEqual(5, len(lex))
+        self.assertTrue(lex.is_word("SEARCH"))
+        self.assertTrue(lex.is_word("FUZZ"))
+        self.assertFalse(lex.is_word("AB"))
+        self.assertFalse(lex.is_word("TOOLONG"))
+        self.assertFalse(lex.is_word("SEARCJ"))
+        self.assertFalse(lex.is_word("IT'S"))
+
+    def test_anagram_counts(self) -> None:
+        lex = lexicon.load(self.source)
+        self.assertEqual(2, lex.anagram_count(lexicon.pack_signature("ARCH")))
+        self.assertEqual(1, lex.anagram_count(lexicon.pack_signature("FUZZ")))
+        self.assertEqual(0, lex.anagram_count(lexicon.pack_signature("FUZ")))
+        counts = lex.signature_counts()
+        self.assertEqual(2, counts[lexicon.pack_signature("HARC")])
+        self.assertEqual(0, counts.get(lexicon.pack_signature("FUZ"), 0))
+        self.assertNotIn(lexicon.pack_signature("FUZ"), counts)
+        self.assertEqual(len(counts), len(list(counts)))
+
+    def test_rebuilds_when_source_is_newer(self) -> None:
+        lex = lexicon.load(self.source)
+        self.assertFalse(lex.is_word("QUIZ"))
+
+        self._write_source(["quiz"])
+        lexicon_path = lexicon.lexicon_path_for(self.source)
+        built_at = os.path.getmtime(lexicon_path)
+        os.utime(self.source, (built_at + 10, built_at + 10))
+
+        lex = lexicon.load(self.source)
+        self.assertTrue(lex.is_word("QUIZ"))
+        self.assertFalse(lex.is_word("ARCH"))
+
+    def test_dictionary_load(self) -> None:
+        bingos = os.path.join(self.tmp_dir.name, "bingos.txt")
+        with open(bingos, "w") as f:
+            f.write("search\n")
+        d = Dictionary(3, 6)
+        d.load(self.source, bingos)
+        self.assertTrue(d.is_word("ONLINE"))
+        self.assertFalse(d.is_word("OXLINE"))
+        self.assertEqual(["ARCH", "CHAR", "SEARCH"], d.words_from_rack("SEARCH"))
+        self.assertEqual("ACEHRS", d.get_rack().letters())
+
+    def test_dictionary_load_rejects_wider_bounds(self) -> None:
+        with self.assertRaises(ValueError):
+            Dictionary(3, 7).load(self.source, self.source)
+
+
+if __name__ == '__main__':
+    unittest.main()
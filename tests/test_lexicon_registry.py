@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from core import app
+from core.anagram_helper import AnagramHelper
+from core.lexicon_registry import LexiconRegistry
+
+
+class TestLexiconRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config = {
+            "full": self._write_lexicon("full", ["arch", "char", "search", "online"], ["search", "online"]),
+            "kids": self._write_lexicon("kids", ["cat", "act", "tacos", "coasts"], ["coasts"]),
+        }
+        self.lexicons = LexiconRegistry(self.config, default_id="full")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def _write_lexicon(self, name: str, words: list[str], bingos: list[str]) -> dict[str, str]:
+        paths = {}
+        for kind, lines in (("words", words), ("bingos", bingos)):
+            paths[kind] = os.path.join(self.tmp_dir.name, f"{name}_{kind}.txt")
+            with open(paths[kind], "w") as f:
+                f.write("\n".join(lines))
+        return paths
+
+    def test_get(self) -> None:
+        self.assertTrue(self.lexicons.get("kids").is_word("TACOS"))
+        self.assertFalse(self.lexicons.get("kids").is_word("ARCH"))
+        self.assertTrue(self.lexicons.get().is_word("ARCH"))
+        self.assertIs(self.lexicons.get("full"), self.lexicons.get())
+        with self.assertRaises(KeyError):
+            self.lexicons.get("bogus")
+
+    def test_load_keeps_every_lexicon_resident(self) -> None:
+        self.lexicons.load()
+        dictionaries = [self.lexicons.get(lexicon_id) for lexicon_id in self.lexicons.ids()]
+        self.lexicons.load()
+        self.assertEqual(dictionaries, [self.lexicons.get(lexicon_id) for lexicon_id in self.lexicons.ids()])
+
+    def test_word_list(self) -> None:
+        self.assertEqual(self.config["kids"]["words"], self.lexicons.word_list("kids"))
+        self.assertEqual(self.config["full"]["words"], self.lexicons.word_list())
+
+    def test_unknown_default(self) -> None:
+        with self.assertRaises(ValueError):
+            LexiconRegistry(self.config, default_id="bogus")
+
+    def test_app_set_lexicon(self) -> None:
+        the_app = app.App(asyncio.Queue(), self.lexicons.get(), MagicMock(), lexicons=self.lexicons)
+        the_app.set_lexicon("kids")
+        self.assertEqual("ACOSST", the_app.rack_manager._dictionary.get_rack().letters())
+        self.assertIs(AnagramHelper.get_instance(self.config["kids"]["words"]),
+                      the_app._tile_generator._anagram_helper)
+
+        the_app.set_lexicon("bogus")
+        self.assertIs(self.lexicons.get("full"), the_app._dictionary)
+        self.assertIs(AnagramHelper.get_instance(self.config["full"]["words"]),
+                      the_app._tile_generator._anagram_helper)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from hardware.cubes_to_game import coordination
+from hardware.cubes_to_game.neighbor_filter import NeighborFilter
+from hardware.cubes_to_game.session import CubesSession
+
+
+class TestNeighborFilter(unittest.TestCase):
+    def test_repeat_of_applied_is_dropped(self):
+        neighbor_filter = NeighborFilter()
+        self.assertTrue(neighbor_filter.offer("1", "2", 0))
+        self.assertFalse(neighbor_filter.offer("1", "2", 10))
+        self.assertTrue(neighbor_filter.offer("1", "3", 20))
+        self.assertTrue(neighbor_filter.offer("2", "3", 20))
+        self.assertEqual({"duplicate": 1}, neighbor_filter.suppressed)
+
+    def test_without_settle_nothing_is_held(self):
+        neighbor_filter = NeighborFilter()
+        self.assertTrue(neighbor_filter.offer("1", "2", 0))
+        self.assertIsNone(neighbor_filter.next_settle_ms())
+        self.assertEqual([], neighbor_filter.take_settled(1000))
+
+    def test_forget_applied_lets_repeat_through(self):
+        neighbor_filter = NeighborFilter()
+        neighbor_filter.offer("1", "2", 0)
+        neighbor_filter.forget_applied()
+        self.assertTrue(neighbor_filter.offer("1", "2", 10))
+
+    def test_changed_value_settles(self):
+        neighbor_filter = NeighborFilter(settle_ms=50)
+        self.assertFalse(neighbor_filter.offer("1", "2", 100))
+        self.assertFalse(neighbor_filter.offer("1", "2", 120))
+        self.assertEqual(150, neighbor_filter.next_settle_ms())
+        self.assertEqual([], neighbor_filter.take_settled(149))
+        self.assertEqual([("1", "2")], neighbor_filter.take_settled(150))
+        self.assertIsNone(neighbor_filter.next_settle_ms())
+        self.assertFalse(neighbor_filter.offer("1", "2", 200))
+        self.assertEqual({"duplicate": 2}, neighbor_filter.suppressed)
+
+    def test_bounce_back_to_applied_is_dropped(self):
+        neighbor_filter = NeighborFilter(settle_ms=50)
+        neighbor_filter.offer("1", "2", 0)
+        neighbor_filter.take_settled(50)
+        neighbor_filter.offer("1", "3", 100)
+        self.assertFalse(neighbor_filter.offer("1", "2", 110))
+        self.assertEqual([], neighbor_filter.take_settled(200))
+        self.assertEqual({"bounce": 1}, neighbor_filter.suppressed)
+
+    def test_newer_value_restarts_window(self):
+        neighbor_filter = NeighborFilter(settle_ms=50)
+        neighbor_filter.offer("1", "3", 100)
+        neighbor_filter.offer("1", "4", 130)
+        self.assertEqual([], neighbor_filter.take_settled(150))
+        self.assertEqual([("1", "4")], neighbor_filter.take_settled(180))
+        self.assertEqual({"superseded": 1}, neighbor_filter.suppressed)
+
+    def test_rejected_report_is_let_through_again(self):
+        neighbor_filter = NeighborFilter()
+        self.assertTrue(neighbor_filter.offer("2", "1", 0))
+        neighbor_filter.reject("2")
+        self.assertTrue(neighbor_filter.offer("2", "1", 10))
+        self.assertFalse(neighbor_filter.suppressed)
+
+    def test_reset(self):
+        neighbor_filter = NeighborFilter(settle_ms=50)
+        neighbor_filter.offer("1", "3", 100)
+        neighbor_filter.offer("1", "3", 110)
+        neighbor_filter.reset()
+        self.assertIsNone(neighbor_filter.next_settle_ms())
+        self.assertFalse(neighbor_filter.suppressed)
+
+
+class TestNeighborFilterWithChains(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.session = CubesSession()
+        await coordination.init(AsyncMock(), session=self.session)
+        self.queue = asyncio.Queue()
+
+    async def _report(self, sender: str, neighbor: str, now_ms: int):
+        message = MagicMock()
+        message.topic.value = f"cube/right/{sender}"
+        message.payload.decode.return_value = neighbor
+        await coordination.handle_mqtt_message(self.queue, message, now_ms, None, session=self.session)
+
+    async def test_link_rejected_as_loop_links_when_repeated_later(self):
+        for sender, neighbor in [("1", "2"), ("2", ""), ("2", "1"), ("1", ""), ("2", "1"), ("2", "1")]:
+            await self._report(sender, neighbor, 0)
+
+        manager = self.session.cube_set_managers[0]
+        self.assertEqual({"2": "1"}, manager.cube_chain)
+        self.assertEqual([["1", "0"]], manager.words())
+        self.assertEqual({"duplicate": 1}, self.session.neighbor_filter.suppressed)
+
+
+if __name__ == '__main__':
+    unittest.main()
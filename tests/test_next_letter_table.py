@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import os
+import random
+import string
+import tempfile
+import unittest
+from itertools import combinations_with_replacement
+
+from config import game_config
+from core import next_letter_table
+from core.anagram_helper import AnagramHelper
+from core.tile_generator import TileGenerator
+
+
+class TestNextLetterTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # A 3-letter table over the real word list builds in well under a second
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.table_path = os.path.join(cls.tmp_dir.name, "sowpods.next")
+        next_letter_table.build(game_config.DICTIONARY_PATH, cls.table_path, 3)
+        cls.table = next_letter_table.NextLetterTable(cls.table_path)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tmp_dir.cleanup()
+
+    def test_rack_count(self) -> None:
+        self.assertEqual(736281, next_letter_table.rack_count(6))
+        self.assertEqual(3276, next_letter_table.rack_count(3))
+
+    def test_scores_match_live_scoring(self) -> None:
+        helper = AnagramHelper.get_instance()
+        for combo in combinations_with_replacement(string.ascii_uppercase, 3):
+            rack = "".join(combo)
+            if rack in ("AAA", "CAT", "ERS", "QUZ", "ZZZ") or random.Random(rack).random() < 0.02:
+                expected = [helper.count_anagrams(rack + c) for c in string.ascii_uppercase]
+                self.assertEqual(expected, self.table.scores(rack), rack)
+
+    def test_build_in_worker_processes(self) -> None:
+        table_path = os.path.join(self.tmp_dir.name, "parallel.next")
+        next_letter_table.build(game_config.DICTIONARY_PATH, table_path, 3, workers=2)
+        with open(self.table_path, "rb") as expected, open(table_path, "rb") as built:
+            self.assertEqual(expected.read(), built.read())
+
+    def test_letter_order_does_not_matter(self) -> None:
+        self.assertEqual(self.table.scores("ACT"), self.table.scores("tca"))
+
+    def test_unsupported_racks(self) -> None:
+        self.assertIsNone(self.table.scores("CA?"))
+        self.assertIsNone(self.table.scores("CATS"))
+        self.assertIsNone(self.table.scores("CA"))
+
+    def test_rejects_other_files(self) -> None:
+        with self.assertRaises(ValueError):
+            next_letter_table.NextLetterTable(game_config.DICTIONARY_PATH)
+
+    def test_tile_generator_lookup_matches_live(self) -> None:
+        generator = TileGenerator()
+        generator._next_letter_table = None
+        live = generator._score_candidates("CAT")
+        generator._next_letter_table = self.table
+        self.assertEqual(live, generator._score_candidates("CAT"))
+
+        state = random.getstate()
+        with_table = [generator.get_next_letter("ERS") for _ in range(20)]
+        random.setstate(state)
+        generator._next_letter_table = None
+        without_table = [generator.get_next_letter("ERS") for _ in range(20)]
+        self.assertEqual(without_table, with_table)
+
+    def test_tile_generator_falls_back_for_blanks(self) -> None:
+        generator = TileGenerator()
+        generator._next_letter_table = self.table
+        self.assertEqual(AnagramHelper.get_instance().score_candidates("CA?"),
+                         generator._score_candidates("CA?"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+import string
+import unittest
+
+from config import game_config
+from core import rack_analytics
+from core.anagram_helper import AnagramHelper
+
+
+class TestRackAnalytics(unittest.TestCase):
+    def setUp(self) -> None:
+        self.helper = AnagramHelper.get_instance()
+        self.racks = ["SEARCH", "ONLINE", "QQQQQQ", "ACT"]
+
+    def test_count_anagrams(self) -> None:
+        expected = [(rack, self.helper.count_anagrams(rack)) for rack in self.racks]
+        results = rack_analytics.count_anagrams(self.racks, game_config.DICTIONARY_PATH, workers=1, batch_size=3)
+        self.assertEqual(expected, list(results))
+
+    def test_count_anagrams_in_worker_processes(self) -> None:
+        expected = list(rack_analytics.count_anagrams(self.racks, game_config.DICTIONARY_PATH, workers=1))
+        results = rack_analytics.count_anagrams(self.racks, game_config.DICTIONARY_PATH, workers=2, batch_size=1)
+        self.assertEqual(expected, list(results))
+
+    def test_replacement_scores(self) -> None:
+        (rack, scores), = rack_analytics.replacement_scores(["acdeef"], game_config.DICTIONARY_PATH, workers=1)
+        self.assertEqual("ACDEEF", rack)
+        for letter in "RZ":
+            expected = sum(self.helper.count_anagrams(rack[:i] + letter + rack[i + 1:]) for i in range(6)) / 6
+            self.assertEqual(expected, scores[string.ascii_uppercase.index(letter)])
+
+
+if __name__ == '__main__':
+    unittest.main()
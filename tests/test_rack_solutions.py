@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+import random
+import string
+import unittest
+
+from config import game_config
+from core.dictionary import Dictionary
+from core.rack_solutions import RackSolutions
+
+
+class TestRackSolutions(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dictionary = Dictionary(3, 6)
+        self.dictionary.load(game_config.DICTIONARY_PATH, game_config.BINGOS_PATH)
+        self.solutions = RackSolutions()
+
+    def test_sync(self) -> None:
+        self.solutions.sync(self.dictionary, "SEARCH")
+        self.assertIn("ARCH", self.solutions)
+        self.assertIn("SEARCH", self.solutions)
+        self.assertNotIn("SEARCHES", self.solutions)
+        self.assertEqual(set(self.dictionary.words_from_rack("SEARCH")), self.solutions.words())
+
+    def test_sync_ignores_letter_order(self) -> None:
+        self.solutions.sync(self.dictionary, "SEARCH")
+        words = self.solutions.words()
+        self.solutions.sync(self.dictionary, "HCRAES")
+        self.assertIs(words, self.solutions.words())
+
+    def test_replace_letter_matches_recompute(self) -> None:
+        rng = random.Random(7)
+        letters = list("SEARCH")
+        self.solutions.sync(self.dictionary, "".join(letters))
+        for _ in range(200):
+            position = rng.randrange(len(letters))
+            new_letter = rng.choice(string.ascii_uppercase)
+            self.solutions.replace_letter(letters[position], new_letter)
+            letters[position] = new_letter
+            expected = set(self.dictionary.words_from_rack("".join(letters)))
+            self.assertEqual(expected, self.solutions.words(), "".join(letters))
+
+    def test_remaining(self) -> None:
+        self.solutions.sync(self.dictionary, "CATQQQ")
+        self.assertEqual({"CAT", "ACT", "QAT"}, self.solutions.words())
+        self.assertEqual({"ACT", "QAT"}, self.solutions.remaining({"CAT", "DOG"}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -45,6 +45,79 @@ class TestScoreCard(unittest.TestCase):
         self.score_card.update_previous_guesses()
         self.assertEqual(set(["CAT"]), self.score_card.possible_words)
 
+    def test_replace_letter_moves_previous_guesses(self):
+        self.score_card.player_rack = tiles.Rack("CATDOG")
+        self.score_card.add_guess("CAT", 0)
+        self.score_card.add_guess("DOG", 1)
+        self.assertEqual(["CAT", "DOG"], self.score_card.get_previous_guesses())
+
+        self.score_card.player_rack.replace_letter("X", 1)
+        self.score_card.replace_letter("A", "X")
+        self.assertEqual(["DOG"], self.score_card.get_previous_guesses())
+        self.assertEqual(["CAT"], self.score_card.get_remaining_previous_guesses())
+
+        self.score_card.player_rack.replace_letter("A", 4)
+        self.score_card.replace_letter("O", "A")
+        self.assertEqual(["CAT"], self.score_card.get_previous_guesses())
+        self.assertEqual(["DOG"], self.score_card.get_remaining_previous_guesses())
+
+    def test_replace_letter_matches_recompute(self):
+        rng = random.Random(3)
+        self.score_card.player_rack = tiles.Rack("CONTACT")
+        for word in ["CAT", "TACT", "CON", "TOT", "COAT", "ANT", "OAT", "TANTO"]:
+            self.score_card.add_guess(word, rng.randrange(2))
+        for _ in range(100):
+            position = rng.randrange(7)
+            old_letter = self.score_card.player_rack.letters()[position]
+            new_letter = rng.choice("ACNOTX")
+            self.score_card.player_rack.replace_letter(new_letter, position)
+            self.score_card.replace_letter(old_letter, new_letter)
+            possible, remaining = set(self.score_card.possible_words), set(self.score_card.remaining_words)
+            self.score_card.update_previous_guesses()
+            self.assertEqual(self.score_card.possible_words, possible)
+            self.assertEqual(self.score_card.remaining_words, remaining)
+
+    def test_is_good_guess(self):
+        self.score_card.player_rack = tiles.Rack("CONTACT")
+        self.assertTrue(self.score_card.is_good_guess("TACT"))
+        self.assertFalse(self.score_card.is_good_guess("TACO"))
+        self.score_card.add_staged_guess("TACT")
+        self.assertFalse(self.score_card.is_good_guess("TACT"))
+
+    def test_words_remaining(self):
+        self.score_card.player_rack = tiles.Rack("CONTACT")
+        self.score_card.add_staged_guess("TACT")
+        self.assertEqual(["CON", "CONTACT"], self.score_card.words_remaining())
+
+        self.score_card.player_rack.replace_letter("X", 1)
+        self.score_card.replace_letter("O", "X")
+        self.assertEqual([], self.score_card.words_remaining())
+
+    def test_previous_guesses_delta(self):
+        self.score_card.player_rack = tiles.Rack("CATDOG")
+        self.score_card.add_guess("CAT", 0)
+        self.score_card.add_guess("DOG", 1)
+        self.assertEqual((["CAT", "DOG"], [], [], []), self.score_card.take_previous_guesses_delta())
+        self.assertEqual(([], [], [], []), self.score_card.take_previous_guesses_delta())
+
+        self.score_card.player_rack.replace_letter("X", 1)
+        self.score_card.replace_letter("A", "X")
+        self.assertEqual(([], ["CAT"], ["CAT"], []), self.score_card.take_previous_guesses_delta())
+
+        # Moving back before the delta is taken cancels out
+        self.score_card.player_rack.replace_letter("A", 1)
+        self.score_card.replace_letter("X", "A")
+        self.score_card.player_rack.replace_letter("X", 1)
+        self.score_card.replace_letter("A", "X")
+        self.assertEqual(([], [], [], []), self.score_card.take_previous_guesses_delta())
+
+    def test_published_guesses_are_not_in_delta(self):
+        self.score_card.player_rack = tiles.Rack("CATDOG")
+        self.score_card.add_guess("CAT", 0)
+        self.assertEqual(["CAT"], self.score_card.publish_previous_guesses())
+        self.score_card.add_guess("ZOO", 0)
+        self.assertEqual(([], [], ["ZOO"], []), self.score_card.take_previous_guesses_delta())
+
     def test_get_previous_guesses(self):
         self.score_card.possible_words = set(["CAT", "DOG"])
         self.assertEqual(["CAT", "DOG"],
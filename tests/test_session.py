@@ -0,0 +1,107 @@
+"""Unit tests for CubesSession: independent cubes-to-game state per installation."""
+import asyncio
+import functools
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from hardware.cubes_to_game import coordination
+from hardware.cubes_to_game import state
+from hardware.cubes_to_game.session import CubesSession
+from hardware.cubes_interface import CubesHardwareInterface
+
+
+def _right_message(sender: str, neighbor: str):
+    message = MagicMock()
+    message.topic.value = f"cube/right/{sender}"
+    message.payload.decode.return_value = neighbor
+    return message
+
+
+class TestCubesSession(unittest.IsolatedAsyncioTestCase):
+    """Two sessions in one process share nothing."""
+
+    async def asyncSetUp(self):
+        self.first = CubesSession()
+        self.second = CubesSession()
+        for session in (self.first, self.second):
+            await coordination.init(AsyncMock(), session=session)
+
+    async def test_neighbor_reports_stay_in_their_session(self):
+        queue = asyncio.Queue()
+
+        await coordination.handle_mqtt_message(queue, _right_message("1", "2"), 1000, None, session=self.first)
+
+        self.assertEqual(self.first.cube_set_managers[0].cube_chain, {"1": "2"})
+        self.assertEqual(self.second.cube_set_managers[0].cube_chain, {})
+        self.assertTrue(coordination._has_received_initial_neighbor_reports(self.first))
+        self.assertFalse(coordination._has_received_initial_neighbor_reports(self.second))
+
+    async def test_game_state_stays_in_its_session(self):
+        self.first.set_game_running(True)
+        self.first.add_player_started(0)
+        self.first.add_started_cube_set(1)
+
+        self.assertFalse(self.second.game_running)
+        self.assertFalse(self.second.has_player_started_game(0))
+        self.assertEqual(self.second.get_started_cube_sets(), [])
+
+    async def test_locks_stay_in_their_session(self):
+        queue = asyncio.Queue()
+        self.first.cube_set_managers[0].tiles_to_cubes = {"0": "1"}
+        self.second.cube_set_managers[0].tiles_to_cubes = {"0": "1"}
+
+        await coordination.letter_lock(queue, 0, "0", 1000, session=self.first)
+
+        self.assertEqual(self.first.locked_cubes, {0: "1"})
+        self.assertEqual(self.second.locked_cubes, {})
+        # The second session has published nothing, so it still sends its own lock
+        self.assertTrue(await coordination.letter_lock(queue, 0, "0", 1000, session=self.second))
+        self.assertEqual(queue.qsize(), 2)
+
+    async def test_failed_publish_is_resent_by_its_session(self):
+        queue = asyncio.Queue()
+        for session in (self.first, self.second):
+            session.cube_set_managers[0].tiles_to_cubes = {"0": "1"}
+            await coordination.letter_lock(queue, 0, "0", 1000, session=session)
+        while not queue.empty():
+            queue.get_nowait()
+
+        coordination.publish_failed("cube/1/lock", "1", session=self.first)
+        for session in (self.first, self.second):
+            await session.cube_set_managers[0].display.reconcile(queue, 2000)
+
+        self.assertEqual(("cube/1/lock", "1", True, 2000), queue.get_nowait())
+        self.assertTrue(queue.empty())
+
+    async def test_abc_countdown_completion_marks_its_session(self):
+        queue = asyncio.Queue()
+        start_game = AsyncMock()
+        self.first.start_game_callback = start_game
+        manager = self.first.cube_set_managers[0]
+        manager.cube_list = ["1", "2", "3", "4", "5", "6"]
+        self.first.abc_manager.player_abc_cubes[0] = {"A": "1", "B": "2", "C": "3"}
+
+        await self.first.abc_manager.handle_abc_completion(
+            queue, 0, 100, MagicMock(), self.first.cube_set_managers, 0,
+            functools.partial(coordination._start_cube_set, self.first))
+        await coordination.advance_countdown(100, session=self.first)
+
+        start_game.assert_awaited_once_with(True, 100, 0)
+        self.assertEqual(self.first.get_started_cube_sets(), [0])
+        self.assertEqual(self.second.get_started_cube_sets(), [])
+
+    def test_old_state_names_read_the_default_session(self):
+        self.assertIs(state.cube_set_managers, state.session.cube_set_managers)
+        self.assertIs(state.last_guess_tiles, state.session.last_guess_tiles)
+
+    def test_hardware_interface_uses_its_session(self):
+        hardware = CubesHardwareInterface(self.first)
+        hardware.add_player_started(1)
+
+        self.assertTrue(self.first.has_player_started_game(1))
+        self.assertFalse(self.second.has_player_started_game(1))
+        self.assertIs(CubesHardwareInterface().session, state.session)
+
+
+if __name__ == '__main__':
+    unittest.main()
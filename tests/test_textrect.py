@@ -4,6 +4,7 @@ import unittest
 import pygame
 import pygame.freetype
 from utils.textrect import TextRectException, FontRectGetter, Blitter, TextRectRenderer
+from rendering import text_renderer
 
 class TestPrerenderTextrect(unittest.TestCase):
     def setUp(self):
@@ -103,5 +104,36 @@ class TestPrerenderTextrect(unittest.TestCase):
     def tearDown(self):
         pygame.quit()
 
+class TestIncrementalLayout(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.font = pygame.freetype.SysFont(None, 24)
+        self.rect = pygame.Rect(0, 0, 200, 500)
+        self.renderer = text_renderer.TextRectRenderer(self.font, self.rect)
+
+    def assert_matches_full_layout(self, words):
+        self.renderer.update_pos_dict(words)
+        full = text_renderer.TextRectRenderer(self.font, self.rect)._prerender_textrect(words)
+        self.assertEqual(full, self.renderer._pos_dict)
+
+    def test_update_pos_dict_matches_full_layout(self):
+        words = ["ALPHA", "BRAVO", "CHARLIE", "DELTA", "ECHO", "FOXTROT", "GOLF"]
+        self.assert_matches_full_layout(words)
+        self.assert_matches_full_layout(words[:3] + ["CAT"] + words[3:])
+        self.assert_matches_full_layout(words[:5])
+        self.assert_matches_full_layout(["AA"] + words)
+        self.assert_matches_full_layout([])
+        self.assert_matches_full_layout(words)
+
+    def test_overflow_keeps_layout(self):
+        self.renderer._rect = pygame.Rect(0, 0, 200, 60)
+        self.renderer.update_pos_dict(["ONE"])
+        with self.assertRaises(text_renderer.TextRectException):
+            self.renderer.update_pos_dict(["ONE"] + ["WORDS"] * 20)
+        self.assertEqual({"ONE": (0, 0)}, self.renderer._pos_dict)
+
+    def tearDown(self):
+        pygame.quit()
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
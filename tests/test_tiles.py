@@ -22,6 +22,18 @@ class TestRack(unittest.TestCase):
         self.assertEqual(['3', '4', '5'], rack.letters_to_ids("EEND"))
         self.assertEqual(['3', '4', '5'], rack.letters_to_ids("ENZD"))
 
+    def test_letter_counts(self) -> None:
+        rack = tiles.Rack("FRIENDS")
+        counts = rack.letter_counts()
+        self.assertEqual(1, counts[ord("E") - 65])
+        self.assertEqual(7, sum(counts))
+        rack.replace_letter("E", 0)
+        self.assertEqual(0, rack.letter_counts()[ord("F") - 65])
+        self.assertEqual(2, rack.letter_counts()[ord("E") - 65])
+        self.assertEqual(['3', '0'], rack.letters_to_ids("EE"))
+        self.assertEqual("", rack.missing_letters("SEE"))
+        self.assertEqual("F", rack.missing_letters("FEE"))
+
     def test_ids_to_letters(self) -> None:
         rack = tiles.Rack("FRIENDS")
         self.assertEqual('END', rack.ids_to_letters(list("345")))
@@ -49,5 +61,40 @@ class TestRack(unittest.TestCase):
         self.assertTrue(letter.isupper())
         self.assertEqual(len(letter), 1)
 
+    def test_speculated_next_letter_matches_inline(self) -> None:
+        """Test that speculated scoring consumes the RNG exactly like inline scoring."""
+        from core.tile_generator import TileGenerator
+        generator = TileGenerator()
+        state = random.getstate()
+        inline = [generator.get_next_letter(rack) for rack in ("ABCDEF", "SEARCH", "QQZZXX")]
+
+        generator.speculate(["FEDCBA", "HCRAES"])
+        random.setstate(state)
+        speculated = [generator.get_next_letter(rack) for rack in ("ABCDEF", "SEARCH", "QQZZXX")]
+        self.assertEqual(inline, speculated)
+
+    def test_rack_manager_speculates_landing_positions(self) -> None:
+        """Test that every rack the falling letter can produce is scored ahead of time."""
+        from config import game_config
+        from core.dictionary import Dictionary
+        from core.rack_manager import RackManager
+        from core.tile_generator import TileGenerator
+        game_config.MAX_LETTERS = 6
+        tiles.MAX_LETTERS = 6
+        dictionary = Dictionary(3, 6)
+        dictionary.load(game_config.DICTIONARY_PATH, game_config.BINGOS_PATH)
+        generator = TileGenerator()
+        manager = RackManager(dictionary, generator)
+
+        manager.initialize_racks_for_fair_play()
+        rack = manager.get_rack(0)
+        expected = {"".join(sorted(rack.letters()[:i] + rack.next_letter() + rack.letters()[i + 1:]))
+                    for i in range(6)}
+        self.assertEqual(expected, set(generator._speculative))
+
+        manager.accept_new_letter(rack.next_letter(), 2, 0, 0)
+        self.assertIn("".join(sorted(rack.letters()[:4] + rack.next_letter() + rack.letters()[5:])),
+                      generator._speculative)
+
 if __name__ == '__main__':
     unittest.main()
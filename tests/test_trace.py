@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from game_logging import trace
+from hardware.cubes_to_game.cube_set_manager import CubeSetManager
+
+
+class TestTrace(unittest.TestCase):
+    def setUp(self):
+        self.records = []
+        trace.disable_all()
+        trace.set_sink(self.records.append)
+        self.addCleanup(trace.set_sink, None)
+        self.addCleanup(trace.disable_all)
+
+    def test_disabled_category_emits_nothing(self):
+        trace.GUESS.emit("guess_tiles", guess="CAT")
+        self.assertEqual([], self.records)
+
+    def test_enabled_category_emits_record(self):
+        trace.enable(["guess"])
+        trace.GUESS.emit("guess_tiles", guess="CAT")
+        trace.MQTT.emit("recv", topic="cube/right/1")
+        self.assertEqual(1, len(self.records))
+        record = self.records[0]
+        self.assertEqual(("guess", "guess_tiles", "CAT"),
+                         (record["category"], record["event"], record["guess"]))
+        self.assertIn("time_ms", record)
+
+    def test_enable_all(self):
+        trace.enable(["all"])
+        self.assertTrue(all(category.enabled for category in trace.CATEGORIES.values()))
+
+    def test_enable_unknown_category(self):
+        with self.assertRaises(ValueError):
+            trace.enable(["nope"])
+
+    def test_neighbor_report_traced(self):
+        manager = CubeSetManager(0)
+        manager.cube_list = ["1", "2"]
+        manager._initialize_arrays()
+        manager.process_neighbor_cube("1", "2")
+        self.assertEqual([], self.records)
+
+        trace.enable(["cubes"])
+        manager.process_neighbor_cube("1", "2")
+        record, = self.records
+        self.assertEqual("neighbor", record["event"])
+        self.assertEqual({"1": ["", "2", ""]}, record["chain"])
+
+
+if __name__ == '__main__':
+    unittest.main()
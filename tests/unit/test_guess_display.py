@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 import pygame
 from rendering import text_renderer as textrect
-from ui.guess_display import PreviousGuessesManager, PreviousGuessesDisplay, RemainingPreviousGuessesDisplay
+from ui.guess_display import PreviousGuessesManager, PreviousGuessesDisplay, RemainingPreviousGuessesDisplay, _apply_delta
 
 class TestPreviousGuessesManager(unittest.TestCase):
     def setUp(self):
@@ -124,5 +124,60 @@ class TestPreviousGuessesManager(unittest.TestCase):
         # Let's just assert multiple calls.
         self.assertGreaterEqual(func.call_count, 5)
 
+    def test_apply_delta(self):
+        self.manager.apply_delta(["CAT"], ["DOG"], ["DOG"], [], 0)
+        self.mock_previous_instance.apply_delta.assert_called_once_with(["CAT"], ["DOG"], 0)
+        self.mock_remaining_instance.apply_delta.assert_called_once_with(["DOG"], [])
+
+class TestApplyDelta(unittest.TestCase):
+    def test_keeps_words_sorted(self):
+        self.assertEqual(["ANT", "CAT", "EEL"], _apply_delta(["ANT", "DOG", "EEL"], ["CAT"], ["DOG"]))
+
+    def test_reapplying_is_harmless(self):
+        words = _apply_delta(["ANT", "DOG"], ["CAT"], ["DOG"])
+        self.assertEqual(words, _apply_delta(words, ["CAT"], ["DOG"]))
+
+class TestIncrementalDelta(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        from config.player_config import PlayerConfigManager
+        self.config_manager = PlayerConfigManager(letter_width=20)
+        self.words = ["ANT", "BEE", "COW", "DOG", "EEL", "FOX", "GNU", "HEN", "YAK"]
+
+    def _display(self, words):
+        display = PreviousGuessesDisplay(30, {}, self.config_manager)
+        display.update_previous_guesses(words, 0)
+        return display
+
+    def test_apply_delta_draws_what_a_full_update_would(self):
+        display = self._display(self.words)
+        display.apply_delta(["CAT", "ZOO"], ["BEE", "YAK"], 0)
+        expected = self._display(["ANT", "CAT", "COW", "DOG", "EEL", "FOX", "GNU", "HEN", "ZOO"])
+
+        self.assertEqual(expected.previous_guesses, display.previous_guesses)
+        self.assertEqual(pygame.image.tobytes(expected.surface, "RGBA"), pygame.image.tobytes(display.surface, "RGBA"))
+
+    def test_apply_delta_keeps_faders_on_their_words(self):
+        display = self._display(self.words)
+        display.new_guess("HEN", 0, 100)
+        display.new_guess("BEE", 0, 100)
+        hen_fader, bee_fader = display.faders
+
+        display.apply_delta(["AAH"], ["BEE"], 200)
+
+        self.assertEqual([hen_fader], display.faders)
+        self.assertEqual(display._text_rect_renderer.get_pos("HEN"), hen_fader.last_guess_position)
+        self.assertEqual(100, hen_fader.last_update_ms)
+
+    def test_remaining_apply_delta_draws_what_a_full_update_would(self):
+        display = RemainingPreviousGuessesDisplay(24, {}, self.config_manager)
+        display.apply_delta(self.words, [])
+        display.apply_delta(["CAT"], ["ANT"])
+        expected = RemainingPreviousGuessesDisplay(24, {}, self.config_manager)
+        expected.update_remaining_guesses(_apply_delta(self.words, ["CAT"], ["ANT"]))
+
+        self.assertEqual(pygame.image.tobytes(expected.surface, "RGBA"), pygame.image.tobytes(display.surface, "RGBA"))
+
+
 if __name__ == '__main__':
     unittest.main()